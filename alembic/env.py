@@ -11,8 +11,13 @@ from alembic import context
 
 from appserver.apps.account import models # 4
 from appserver.apps.calendar import models # 4
+from appserver.libs.idempotency import store # 4
+from appserver.libs.pubsub import database # 4
+from appserver.libs.scheduler import lease # 4
 from sqlmodel import SQLModel # 1
-from appserver.db import DSN # 2
+from appserver.settings import get_settings # 2
+from appserver.libs.migrations.online import CHECKPOINT_TABLE
+from appserver.apps.calendar.models import BOOKING_SEARCH_TABLE
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -34,6 +39,23 @@ target_metadata = SQLModel.metadata # 3
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+def get_dsn() -> str:
+    # 우선순위: 코드에서 넘긴 값(config.attributes) → `alembic -x dsn=...` → 앱 설정
+    return (
+        config.attributes.get("dsn")
+        or context.get_x_argument(as_dictionary=True).get("dsn")
+        or get_settings().database_dsn
+    )
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    # 마이그레이션 도우미가 쓰는 체크포인트 테이블과
+    # SQLite 예약 검색 색인(FTS5 가상 테이블과 그 내부 테이블)은 autogenerate 비교에서 제외
+    if type_ == "table" and (name == CHECKPOINT_TABLE or name.startswith(BOOKING_SEARCH_TABLE)):
+        return False
+    return True
+
+
 # ==== 기존 마이그레이션 처리 함수 ====
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -83,7 +105,13 @@ def run_migrations_online() -> None:
 
 # ==== 비동기로 동작하는 수행 함수 추가 ====
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        # 리비전마다 따로 커밋 → 긴 마이그레이션이 중간에 실패해도 앞선 리비전은 반영된 상태로 남음
+        transaction_per_migration=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -91,7 +119,7 @@ def do_run_migrations(connection: Connection) -> None:
 
 async def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section, {}) # alembic.ini 설정 로드
-    configuration["sqlalchemy.url"] = DSN # DB URL을 동기 URL이 아닌 async DNS으로 교체
+    configuration["sqlalchemy.url"] = get_dsn() # DB URL을 동기 URL이 아닌 async DNS으로 교체
 
     connectable = AsyncEngine( # 아래 동기 Engine을 비동기 래퍼로 감쌈
         engine_from_config( # 동기 Engine 생성 ↑
@@ -0,0 +1,40 @@
+"""add event_messages
+
+Revision ID: 5e7a3c9d2b16
+Revises: 9b2e6d4f1a83
+Create Date: 2026-10-20 00:41:27.316045
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+# revision identifiers, used by Alembic.
+revision: str = '5e7a3c9d2b16'
+down_revision: Union[str, Sequence[str], None] = '9b2e6d4f1a83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_messages',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('topic', sqlmodel.sql.sqltypes.AutoString(length=128), nullable=False),
+    sa.Column('message', sa.JSON(), nullable=False),
+    sa.Column('created_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index(op.f('ix_event_messages_created_at'), 'event_messages', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_event_messages_created_at'), table_name='event_messages')
+    op.drop_table('event_messages')
@@ -0,0 +1,74 @@
+"""add bookings sqlite autoincrement
+
+Revision ID: 9b2e6d4f1a83
+Revises: 4d19eb048ffe
+Create Date: 2026-10-19 23:12:41.508316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e6d4f1a83'
+down_revision: Union[str, Sequence[str], None] = '4d19eb048ffe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# f3b71e9a2c45에서 만든 전문 검색 트리거 (bookings를 다시 만들면 함께 지워짐)
+SEARCH_TRIGGER_DDL = (
+    "CREATE TRIGGER IF NOT EXISTS bookings_fts_ai AFTER INSERT ON bookings BEGIN "
+    "INSERT INTO bookings_fts(rowid, topic, description) VALUES (new.id, new.topic, new.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS bookings_fts_ad AFTER DELETE ON bookings BEGIN "
+    "INSERT INTO bookings_fts(bookings_fts, rowid, topic, description) "
+    "VALUES ('delete', old.id, old.topic, old.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS bookings_fts_au AFTER UPDATE OF topic, description ON bookings BEGIN "
+    "INSERT INTO bookings_fts(bookings_fts, rowid, topic, description) "
+    "VALUES ('delete', old.id, old.topic, old.description); "
+    "INSERT INTO bookings_fts(rowid, topic, description) VALUES (new.id, new.topic, new.description); "
+    "END",
+)
+
+
+def _recreate_bookings(autoincrement: bool) -> None:
+    # SQLite는 AUTOINCREMENT를 ALTER로 바꿀 수 없어서 테이블을 다시 만듦
+    # 트리거는 다시 만들고, id가 그대로라 색인은 다시 채우지 않음
+    with op.batch_alter_table(
+        'bookings', recreate='always', table_kwargs={'sqlite_autoincrement': autoincrement},
+    ):
+        pass
+    for statement in SEARCH_TRIGGER_DDL:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL의 시퀀스는 지운 id를 다시 쓰지 않음
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    _recreate_bookings(autoincrement=True)
+    # 이미 보관 테이블로 옮긴 예약의 id도 다시 쓰지 않도록 시작 값을 맞춤
+    op.execute(
+    "INSERT INTO sqlite_sequence (name, seq) SELECT 'bookings', 0 "
+    "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'bookings')"
+    )
+    op.execute(
+    "UPDATE sqlite_sequence SET seq = max(seq, (SELECT coalesce(max(id), 0) FROM bookings_archive)) "
+    "WHERE name = 'bookings'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    _recreate_bookings(autoincrement=False)
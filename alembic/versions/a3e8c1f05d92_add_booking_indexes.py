@@ -0,0 +1,38 @@
+"""add booking indexes
+
+Revision ID: a3e8c1f05d92
+Revises: 6f1c2a9d4b7e
+Create Date: 2026-10-19 11:40:07.218350
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+from appserver.libs.migrations.online import create_index_online, drop_index_online
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e8c1f05d92'
+down_revision: Union[str, Sequence[str], None] = '6f1c2a9d4b7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # bookings는 행이 많으므로 쓰기를 막지 않는 방식으로 인덱스를 만듦
+    create_index_online('ix_bookings_time_slot_id_when', 'bookings', ['time_slot_id', 'when'])
+    create_index_online(op.f('ix_bookings_guest_id'), 'bookings', ['guest_id'])
+    create_index_online(op.f('ix_time_slots_calendar_id'), 'time_slots', ['calendar_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_online(op.f('ix_time_slots_calendar_id'), 'time_slots')
+    drop_index_online(op.f('ix_bookings_guest_id'), 'bookings')
+    drop_index_online('ix_bookings_time_slot_id_when', 'bookings')
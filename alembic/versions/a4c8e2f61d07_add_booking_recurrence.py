@@ -0,0 +1,39 @@
+"""add booking recurrence
+
+Revision ID: a4c8e2f61d07
+Revises: f3b71e9a2c45
+Create Date: 2026-10-19 18:41:52.390117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2f61d07'
+down_revision: Union[str, Sequence[str], None] = 'f3b71e9a2c45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 기본값 없는 NULL 허용 컬럼이므로 테이블을 다시 쓰지 않음
+TABLES = ('bookings', 'bookings_archive')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in TABLES:
+        op.add_column(table_name, sa.Column('recurrence', sqlmodel.sql.sqltypes.AutoString(length=200), nullable=True))
+        op.add_column(table_name, sa.Column('recurrence_until', sa.Date(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # SQLite 3.35+는 ALTER TABLE DROP COLUMN을 지원하므로 테이블을 다시 만들지 않음 (검색 트리거 유지)
+    for table_name in TABLES:
+        op.drop_column(table_name, 'recurrence_until')
+        op.drop_column(table_name, 'recurrence')
@@ -0,0 +1,47 @@
+"""add users.username_lower
+
+Revision ID: b82f4d6e1c39
+Revises: e51b9f7c0d28
+Create Date: 2026-10-19 16:05:41.532907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+from appserver.libs.migrations.online import (
+    batch_alter_table, create_index_online, drop_index_online, run_backfill,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = 'b82f4d6e1c39'
+down_revision: Union[str, Sequence[str], None] = 'e51b9f7c0d28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. NULL을 허용하는 컬럼으로 추가 → 2. 기존 행을 구간 단위로 채움 → 3. NOT NULL로 바꿈
+    op.add_column('users', sa.Column('username_lower', sqlmodel.sql.sqltypes.AutoString(length=40), nullable=True))
+    run_backfill(
+        'users',
+        {'username_lower': sa.func.lower(sa.column('username'))},
+        where=sa.column('username_lower').is_(None),
+    )
+    with batch_alter_table('users') as batch_op:
+        batch_op.alter_column('username_lower', existing_type=sqlmodel.sql.sqltypes.AutoString(length=40), nullable=False)
+    # 대소문자만 다른 username이 이미 있으면 여기서 실패하므로, 먼저 정리한 뒤 다시 실행
+    create_index_online(op.f('ix_users_username_lower'), 'users', ['username_lower'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_online(op.f('ix_users_username_lower'), 'users')
+    with batch_alter_table('users') as batch_op:
+        batch_op.drop_column('username_lower')
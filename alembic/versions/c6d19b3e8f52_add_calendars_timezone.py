@@ -0,0 +1,32 @@
+"""add calendars timezone
+
+Revision ID: c6d19b3e8f52
+Revises: a4c8e2f61d07
+Create Date: 2026-10-19 19:24:07.581630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d19b3e8f52'
+down_revision: Union[str, Sequence[str], None] = 'a4c8e2f61d07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 상수 기본값이므로 기존 행을 고쳐 쓰지 않음 (PostgreSQL 11+, SQLite 모두)
+    op.add_column('calendars', sa.Column('timezone', sqlmodel.sql.sqltypes.AutoString(length=64), server_default='Asia/Seoul', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('calendars', 'timezone')
@@ -0,0 +1,51 @@
+"""add bookings_archive
+
+Revision ID: c7d4e2b19a36
+Revises: a3e8c1f05d92
+Create Date: 2026-10-19 13:05:44.601274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d4e2b19a36'
+down_revision: Union[str, Sequence[str], None] = 'a3e8c1f05d92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL에서는 when 기준 범위 파티션 테이블로 만듦
+    # 월 파티션은 예약을 옮길 때 필요한 만큼 만듦 (appserver.apps.calendar.archive)
+    op.create_table('bookings_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('when', sa.Date(), nullable=False),
+    sa.Column('topic', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('created_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), nullable=False),
+    sa.Column('archived_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('time_slot_id', sa.Integer(), nullable=False),
+    sa.Column('guest_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['guest_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['time_slot_id'], ['time_slots.id'], ),
+    sa.PrimaryKeyConstraint('id', 'when'),
+    postgresql_partition_by='RANGE ("when")',
+    )
+    op.create_index(op.f('ix_bookings_archive_guest_id'), 'bookings_archive', ['guest_id'], unique=False)
+    op.create_index('ix_bookings_archive_time_slot_id_when', 'bookings_archive', ['time_slot_id', 'when'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_archive_time_slot_id_when', table_name='bookings_archive')
+    op.drop_index(op.f('ix_bookings_archive_guest_id'), table_name='bookings_archive')
+    op.drop_table('bookings_archive')
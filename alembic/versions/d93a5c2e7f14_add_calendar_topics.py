@@ -0,0 +1,53 @@
+"""add calendar_topics
+
+Revision ID: d93a5c2e7f14
+Revises: b82f4d6e1c39
+Create Date: 2026-10-19 17:12:08.604219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+# revision identifiers, used by Alembic.
+revision: str = 'd93a5c2e7f14'
+down_revision: Union[str, Sequence[str], None] = 'b82f4d6e1c39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    calendar_topics = op.create_table('calendar_topics',
+    sa.Column('topic', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('calendar_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['calendar_id'], ['calendars.id'], ),
+    sa.PrimaryKeyConstraint('topic', 'calendar_id')
+    )
+    op.create_index(op.f('ix_calendar_topics_calendar_id'), 'calendar_topics', ['calendar_id'], unique=False)
+
+    # 이미 있는 캘린더의 주제로 색인을 채움 (정규화는 appserver.apps.calendar.topics.normalize_topic과 같음)
+    calendars = sa.table('calendars', sa.column('id'), sa.column('topics', sa.JSON()))
+    connection = op.get_bind()
+    rows = []
+    for calendar_id, topics in connection.execute(sa.select(calendars.c.id, calendars.c.topics)):
+        normalized = {" ".join(topic.lower().split()) for topic in topics or []} - {""}
+        rows.extend({'topic': topic, 'calendar_id': calendar_id} for topic in sorted(normalized))
+        if len(rows) >= BATCH_SIZE:
+            op.bulk_insert(calendar_topics, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(calendar_topics, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_calendar_topics_calendar_id'), table_name='calendar_topics')
+    op.drop_table('calendar_topics')
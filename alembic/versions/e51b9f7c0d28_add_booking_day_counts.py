@@ -0,0 +1,55 @@
+"""add booking_day_counts
+
+Revision ID: e51b9f7c0d28
+Revises: c7d4e2b19a36
+Create Date: 2026-10-19 14:22:10.935127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+# revision identifiers, used by Alembic.
+revision: str = 'e51b9f7c0d28'
+down_revision: Union[str, Sequence[str], None] = 'c7d4e2b19a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    booking_day_counts = op.create_table('booking_day_counts',
+    sa.Column('calendar_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['calendar_id'], ['calendars.id'], ),
+    sa.PrimaryKeyConstraint('calendar_id', 'day')
+    )
+
+    # 이미 있는 예약(보관된 예약 포함)으로 날짜별 예약 수를 채움
+    time_slots = sa.table('time_slots', sa.column('id'), sa.column('calendar_id'))
+    sources = []
+    for table_name in ('bookings', 'bookings_archive'):
+        bookings = sa.table(table_name, sa.column('when'), sa.column('time_slot_id'))
+        sources.append(
+            sa.select(time_slots.c.calendar_id, bookings.c.when.label('day'))
+            .join(time_slots, time_slots.c.id == bookings.c.time_slot_id)
+        )
+    all_bookings = sa.union_all(*sources).subquery()
+    op.execute(
+        booking_day_counts.insert().from_select(
+            ['calendar_id', 'day', 'count'],
+            sa.select(all_bookings.c.calendar_id, all_bookings.c.day, sa.func.count())
+            .group_by(all_bookings.c.calendar_id, all_bookings.c.day),
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('booking_day_counts')
@@ -0,0 +1,68 @@
+"""add booking search index
+
+Revision ID: f3b71e9a2c45
+Revises: d93a5c2e7f14
+Create Date: 2026-10-19 18:03:26.117482
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlalchemy_utc
+import sqlmodel.sql.sqltypes
+from sqlmodel import Text
+
+from appserver.libs.migrations.online import create_index_online, drop_index_online
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b71e9a2c45'
+down_revision: Union[str, Sequence[str], None] = 'd93a5c2e7f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS bookings_fts "
+    "USING fts5(topic, description, content='bookings', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS bookings_fts_ai AFTER INSERT ON bookings BEGIN "
+    "INSERT INTO bookings_fts(rowid, topic, description) VALUES (new.id, new.topic, new.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS bookings_fts_ad AFTER DELETE ON bookings BEGIN "
+    "INSERT INTO bookings_fts(bookings_fts, rowid, topic, description) "
+    "VALUES ('delete', old.id, old.topic, old.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS bookings_fts_au AFTER UPDATE OF topic, description ON bookings BEGIN "
+    "INSERT INTO bookings_fts(bookings_fts, rowid, topic, description) "
+    "VALUES ('delete', old.id, old.topic, old.description); "
+    "INSERT INTO bookings_fts(rowid, topic, description) VALUES (new.id, new.topic, new.description); "
+    "END",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        # 컬럼을 추가하지 않는 식 인덱스 → 테이블을 다시 쓰지 않고, 쓰기를 막지 않고 만듦
+        create_index_online(
+            'ix_bookings_search', 'bookings',
+            [sa.text("to_tsvector('simple', topic || ' ' || description)")],
+            postgresql_using='gin',
+        )
+        return
+
+    for statement in SQLITE_DDL:
+        op.execute(statement)
+    # 이미 있는 예약으로 색인을 채움
+    op.execute("INSERT INTO bookings_fts(bookings_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        drop_index_online('ix_bookings_search', 'bookings')
+        return
+
+    for trigger in ('bookings_fts_ai', 'bookings_fts_ad', 'bookings_fts_au'):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS bookings_fts")
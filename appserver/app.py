@@ -1,12 +1,178 @@
-from fastapi import FastAPI
-from .apps.account.endpoints import router as account_router
-from .apps.calendar.endpoints import router as calendar_router
+import logging
+from contextlib import asynccontextmanager
 
-app = FastAPI()
+from fastapi import APIRouter, FastAPI
+
+from .settings import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # DB 엔진(커넥션 풀)은 서버가 시작할 때 만들고, 종료할 때 정리합니다.
+    from .db import create_engine_from_settings, create_session
+
+    settings: Settings = _app.state.settings
+    engine = create_engine_from_settings(settings)
+    _app.state.engine = engine
+    _app.state.session_factory = create_session(engine)
+    # 풀에서 연결을 꺼낼 때 기다린 시간 (메모리 DB는 풀을 쓰지 않으므로 None)
+    _app.state.pool_metrics = getattr(engine.pool, "metrics", None)
+    if settings.prewarm:
+        await prewarm(_app)
+    # 다른 워커가 발행한 이벤트도 받기 시작
+    await _app.state.event_hub.start()
+    scheduler = _app.state.scheduler
+    if scheduler is not None:
+        scheduler.start()
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            await scheduler.close()
+            logger.info("scheduled jobs: %s", scheduler.snapshot())
+        await _app.state.event_hub.close()
+        if _app.state.admission_registry is not None:
+            logger.info("admission control: %s", _app.state.admission_registry.snapshot())
+        if _app.state.pool_metrics is not None:
+            logger.info("db pool checkout: %s", _app.state.pool_metrics.snapshot())
+        await engine.dispose() # 커넥션 풀 정리
+
+
+async def prewarm(_app: FastAPI):
+    """
+    첫 요청이 들어오기 전에 커넥션 풀과 비밀번호 해셔를 준비
+    """
+    from .db import is_memory_database, prewarm_pool
+    from .apps.account.utils import get_password_hash
+    from .apps.account.deps import get_app_token_service
+
+    settings: Settings = _app.state.settings
+    if not is_memory_database(settings.database_dsn):
+        await prewarm_pool(_app.state.engine, settings.database_pool_size)
+
+    # 해셔 모듈(argon2, bcrypt) import와 인스턴스 생성을 미리 해 둠
+    get_password_hash()
+    # JWT 키 객체도 미리 만들어 둠
+    get_app_token_service(_app)
+
+
+def include_routers(_app: FastAPI) -> dict[str, APIRouter]:
+    # 라우터(와 모델)는 앱을 만들 때 가져옵니다.
+    # → `import appserver.app` 만으로는 무거운 모듈을 불러오지 않음
+    from .apps.account.endpoints import router as account_router
+    from .apps.calendar.endpoints import router as calendar_router
 
-def include_routers(_app: FastAPI):
     _app.include_router(account_router)
     _app.include_router(calendar_router)
+    return {"account_router": account_router, "calendar_router": calendar_router}
+
+
+def add_middlewares(_app: FastAPI, routers: dict[str, APIRouter]):
+    from .libs.http.compression import CompressionMiddleware
+    from .libs.http.conditional import ConditionalRequestMiddleware
+
+    settings: Settings = _app.state.settings
+    _app.state.idempotency_store = None
+    if settings.idempotency_enabled:
+        # 압축보다 안쪽 → 압축하기 전의 응답을 저장하고, 다시 보낼 때 요청에 맞게 압축
+        add_idempotency(_app)
+    # 나중에 추가한 미들웨어가 바깥쪽 → 304로 바꾼 응답은 압축하지 않음
+    _app.add_middleware(ConditionalRequestMiddleware)
+    if settings.compression_enabled:
+        _app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            encodings=settings.compression_encodings,
+        )
+    _app.state.admission_registry = None
+    if settings.admission_control_enabled:
+        # 가장 바깥쪽 → 돌려보낼 요청에는 다른 미들웨어도 일하지 않음
+        add_admission_control(_app, routers)
+
+
+def add_idempotency(_app: FastAPI):
+    from .apps.account.constants import AUTH_TOKEN_COOKIE_NAME
+    from .libs.idempotency.middleware import IdempotencyMiddleware
+    from .libs.idempotency.store import create_idempotency_store
+
+    settings: Settings = _app.state.settings
+    _app.state.idempotency_store = create_idempotency_store(settings)
+    _app.add_middleware(
+        IdempotencyMiddleware,
+        store=_app.state.idempotency_store,
+        routes=settings.idempotency_routes,
+        auth_cookie=AUTH_TOKEN_COOKIE_NAME,
+    )
+
+
+def add_admission_control(_app: FastAPI, routers: dict[str, APIRouter]):
+    from .libs.http.admission import (
+        AdmissionControlMiddleware, AdmissionRegistry, ConcurrencyLimiter, RouteClassifier,
+    )
+
+    settings: Settings = _app.state.settings
+    # 경로의 첫 마디로 라우터를 찾음 (예: /account/login → account_router)
+    segments = {
+        route.path.split("/")[1]: name
+        for name, router in routers.items()
+        for route in router.routes
+    }
+    limiters = {
+        "auth": ConcurrencyLimiter(settings.admission_auth_concurrency, settings.admission_auth_queue),
+        "write": ConcurrencyLimiter(settings.admission_write_concurrency, settings.admission_write_queue),
+        "read": ConcurrencyLimiter(settings.admission_read_concurrency, settings.admission_read_queue),
+    }
+    _app.state.admission_registry = AdmissionRegistry()
+    _app.add_middleware(
+        AdmissionControlMiddleware,
+        limiters=limiters,
+        classify=RouteClassifier(segments, settings.admission_auth_paths, settings.admission_exempt_paths),
+        registry=_app.state.admission_registry,
+        max_queue_wait=settings.admission_max_queue_wait,
+        retry_after=settings.admission_retry_after,
+        timeout_header=settings.admission_timeout_header,
+    )
+
+
+def create_app(settings: Settings | None = None) -> FastAPI:
+    """
+    앱 팩토리
+
+    uvicorn으로 실행할 때: `uvicorn --factory appserver.app:create_app`
+    """
+    if settings is None:
+        settings = get_settings()
+
+    from .apps.account.ratelimit import create_login_rate_limiter
+    from .apps.account.sessions import create_session_store
+    from .apps.account.lookup import UserIdCache
+    from .apps.calendar.schedule import ScheduleCache
+    from .apps.calendar.events import create_event_hub
+
+    _app = FastAPI(lifespan=lifespan)
+    _app.state.settings = settings
+    _app.state.login_rate_limiter = create_login_rate_limiter(settings)
+    _app.state.session_store = create_session_store(settings)
+    _app.state.schedule_cache = ScheduleCache(settings.schedule_cache_max_entries)
+    _app.state.user_id_cache = UserIdCache(settings.user_id_cache_max_entries)
+    # 세션 팩토리는 lifespan에서 만들어지므로 Broker가 DB를 쓸 때 app.state에서 꺼냄
+    _app.state.event_hub = create_event_hub(settings, lambda: _app.state.session_factory())
+    routers = include_routers(_app)
+    add_middlewares(_app, routers)
+    _app.state.scheduler = None
+    if settings.scheduler_enabled:
+        from .maintenance import create_scheduler
+        _app.state.scheduler = create_scheduler(_app)
+    return _app
 
-include_routers(app)
 
+def __getattr__(name: str):
+    # 기존 실행 방식(`uvicorn appserver.app:app`)과의 호환을 위해
+    # `app` 속성에 처음 접근할 때 앱을 만듭니다.
+    if name == "app":
+        _app = create_app()
+        globals()["app"] = _app
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
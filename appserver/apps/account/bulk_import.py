@@ -0,0 +1,185 @@
+"""
+사용자 일괄 가져오기 (`python -m appserver import-users`)
+
+- CSV 또는 NDJSON(한 줄에 JSON 객체 하나) 파일에서 사용자를 읽음
+- 비밀번호 해싱(Argon2)은 CPU를 많이 쓰므로 ProcessPoolExecutor로 여러 프로세스에 나눠 처리
+- 해싱을 마친 묶음은 비동기 엔진으로 한 번에 INSERT
+- 해싱 결과가 쌓이는 양을 max_pending 묶음으로 제한(백프레셔)
+  → DB가 느려도 메모리에 해시가 끝없이 쌓이지 않고, 파일 읽기와 해싱이 기다림
+"""
+import asyncio
+import csv
+import json
+import logging
+import random
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, Literal
+
+from pydantic import EmailStr, ValidationError
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import SQLModel, Field
+
+from appserver.settings import Settings
+from .lookup import normalize_username
+from .models import User
+from .utils import hash_password
+
+logger = logging.getLogger(__name__)
+
+ImportFormat = Literal["csv", "ndjson"]
+
+
+class UserImportRecord(SQLModel):
+    username: str = Field(min_length=4, max_length=40)
+    email: EmailStr = Field(max_length=128)
+    display_name: str | None = Field(default=None, min_length=4, max_length=40)
+    password: str = Field(min_length=8, max_length=128)
+    is_host: bool = False
+
+
+class ImportReport:
+    def __init__(self):
+        self.read = 0
+        self.inserted = 0
+        self.skipped = 0
+        self.invalid: list[tuple[int, str]] = []
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """초당 가져온 사용자 수"""
+        return self.inserted / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"읽음 {self.read}, 추가 {self.inserted}, 중복으로 건너뜀 {self.skipped}, "
+            f"잘못된 행 {len(self.invalid)} / {self.elapsed:.1f}초 ({self.throughput:.0f}명/초)"
+        )
+
+
+def detect_format(path: Path) -> ImportFormat:
+    """
+    >>> detect_format(Path("users.csv"))
+    'csv'
+    >>> detect_format(Path("users.jsonl"))
+    'ndjson'
+    """
+    return "csv" if path.suffix.lower() == ".csv" else "ndjson"
+
+
+def iter_rows(path: Path, format: ImportFormat) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    """(줄 번호, 값) 순서로 읽음 (줄 번호는 오류 보고용, JSON으로 읽을 수 없는 줄은 None)"""
+    with path.open(encoding="utf-8", newline="") as f:
+        if format == "csv":
+            # 1번 줄은 헤더
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                yield line_no, {key: value for key, value in row.items() if value != ""}
+        else:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except ValueError:
+                    yield line_no, None
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """작업 프로세스에서 실행 (묶음 단위로 넘겨 프로세스 간 전달 비용을 줄임)"""
+    return [hash_password(password) for password in passwords]
+
+
+def _random_display_name() -> str:
+    return "".join(random.choices(string.ascii_letters + string.digits, k=8))
+
+
+async def import_users(
+    engine: AsyncEngine,
+    path: Path,
+    format: ImportFormat | None = None,
+    batch_size: int = 500,
+    workers: int | None = None,
+    max_pending: int = 4,
+) -> ImportReport:
+    """
+    path의 사용자를 batch_size명씩 해싱해서 추가
+
+    username이나 email이 이미 있는 사용자는 건너뜀 (다시 실행해도 안전)
+    """
+    format = format or detect_format(path)
+    dialect = engine.dialect.name
+    insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+
+    report = ImportReport()
+    started_at = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    # (사용자 값 목록, 해싱 결과 future) 묶음. 가득 차면 읽기/해싱 제출이 기다림
+    pending: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    async def produce(pool: ProcessPoolExecutor) -> None:
+        batch: list[dict[str, Any]] = []
+        for line_no, row in iter_rows(path, format):
+            report.read += 1
+            if not isinstance(row, dict):
+                report.invalid.append((line_no, "JSON 객체가 아닙니다."))
+                continue
+            try:
+                record = UserImportRecord.model_validate(row)
+            except ValidationError as e:
+                report.invalid.append((line_no, str(e.errors()[0]["msg"])))
+                continue
+            batch.append(record.model_dump())
+            if len(batch) == batch_size:
+                await submit(pool, batch)
+                batch = []
+        if batch:
+            await submit(pool, batch)
+        await pending.put(None)
+
+    async def submit(pool: ProcessPoolExecutor, batch: list[dict[str, Any]]) -> None:
+        passwords = [values.pop("password") for values in batch]
+        future = loop.run_in_executor(pool, hash_passwords, passwords)
+        await pending.put((batch, future))
+
+    async def consume() -> None:
+        while (item := await pending.get()) is not None:
+            batch, future = item
+            for values, hashed_password in zip(batch, await future):
+                values["hashed_password"] = hashed_password
+                values["display_name"] = values["display_name"] or _random_display_name()
+                # 컬럼 기본값(_lower_username)은 행마다 호출되지만, 여러 행 VALUES에서는
+                # get_current_parameters()가 "users.username_m0" 같은 바인드 이름을 찾지 못해 KeyError가 남
+                # → 값을 직접 채워서 기본값을 부르지 않게 함
+                values["username_lower"] = normalize_username(values["username"])
+
+            stmt = insert(User).values(batch).on_conflict_do_nothing()
+            async with engine.begin() as conn:
+                result = await conn.execute(stmt)
+            report.inserted += result.rowcount
+            report.skipped += len(batch) - result.rowcount
+            logger.info("imported %d users (%.0f/s)", report.inserted, report.inserted / (time.perf_counter() - started_at))
+
+    # 한쪽이 실패하면 다른 쪽도 취소 (큐가 가득 찬 채로 멈추지 않도록)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        async with asyncio.TaskGroup() as tasks:
+            tasks.create_task(produce(pool))
+            tasks.create_task(consume())
+
+    report.elapsed = time.perf_counter() - started_at
+    return report
+
+
+async def run_import(settings: Settings, path: Path, **kwargs: Any) -> ImportReport:
+    """`python -m appserver import-users`에서 실행"""
+    from appserver.db import create_engine_from_settings
+
+    engine = create_engine_from_settings(settings)
+    try:
+        return await import_users(engine, path, **kwargs)
+    finally:
+        await engine.dispose()
@@ -1,23 +1,83 @@
 from typing import Annotated
 from datetime import datetime, timezone, timedelta
-from sqlmodel import select
-from fastapi import Depends, Cookie, HTTPException, status
+from fastapi import Depends, Cookie, HTTPException, Request, status
+from fastapi.requests import HTTPConnection
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from appserver.db import DbSessionDep
-from .exceptions import InvalidTokenError, ExpiredTokenError, UserNotFoundError
+from appserver.libs.dataloader.loader import DataLoader
+from .exceptions import (
+    InvalidTokenError, ExpiredTokenError, UserNotFoundError, TooManyLoginAttemptsError,
+)
 from .models import User
+from .lookup import UserIdCache, get_user_by_username, get_users_by_usernames, normalize_username
+from .schemas import LoginPayload
 from .constants import AUTH_TOKEN_COOKIE_NAME
-from .utils import decode_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from .tokens import TokenService, TokenExpiredError
+from .sessions import SessionStore, restore_user
 
 
-async def get_user(auth_token: str | None, db_session: AsyncSession) -> User | None:
+def get_app_token_service(app) -> TokenService:
+    # 처음 쓸 때 만들어서 앱에 보관 (키 객체를 요청마다 다시 만들지 않음)
+    token_service = getattr(app.state, "token_service", None)
+    if token_service is None:
+        token_service = TokenService.from_settings(app.state.settings)
+        app.state.token_service = token_service
+    return token_service
+
+
+def use_token_service(request: Request) -> TokenService:
+    return get_app_token_service(request.app)
+
+TokenServiceDep = Annotated[TokenService, Depends(use_token_service)]
+
+
+def use_session_store(request: Request) -> SessionStore | None:
+    # auth_backend가 jwt이면 None
+    return request.app.state.session_store
+
+SessionStoreDep = Annotated[SessionStore | None, Depends(use_session_store)]
+
+
+def use_user_id_cache(connection: HTTPConnection) -> UserIdCache:
+    # WebSocket 엔드포인트에서도 씀
+    return connection.app.state.user_id_cache
+
+UserIdCacheDep = Annotated[UserIdCache, Depends(use_user_id_cache)]
+
+
+def use_user_loader(db_session: DbSessionDep, user_id_cache: UserIdCacheDep) -> DataLoader[str, User]:
+    # FastAPI는 요청 하나 안에서 같은 의존성을 한 번만 만듦 → 요청마다 loader 하나를 함께 씀
+    async def batch_load(usernames: list[str]) -> dict[str, User]:
+        return await get_users_by_usernames(db_session, usernames, user_id_cache)
+
+    return DataLoader(batch_load, normalize=normalize_username)
+
+UserLoaderDep = Annotated[DataLoader[str, User], Depends(use_user_loader)]
+
+
+async def get_user(
+    auth_token: str | None,
+    db_session: AsyncSession,
+    token_service: TokenService,
+    session_store: SessionStore | None = None,
+    user_id_cache: UserIdCache | None = None,
+) -> User | None:
     if not auth_token:
         return None
 
+    if session_store is not None:
+        # 세션 방식: JWT 검증과 users 조회 없이 저장된 스냅샷으로 사용자를 만듦
+        snapshot = await session_store.get(auth_token, db_session)
+        if snapshot is None:
+            raise InvalidTokenError()
+        return await restore_user(db_session, snapshot)
+
     try:
-        decoded = decode_token(auth_token)
+        decoded = token_service.decode(auth_token)
+    except TokenExpiredError as e:
+        raise ExpiredTokenError() from e
     except Exception as e:
         raise InvalidTokenError() from e
 
@@ -26,10 +86,7 @@ async def get_user(auth_token: str | None, db_session: AsyncSession) -> User | N
     if now > expires_at:
         raise ExpiredTokenError()
 
-    stmt = select(User).where(User.username == decoded["sub"])
-    result = await db_session.execute(stmt)
-
-    return result.scalar_one_or_none()
+    return await get_user_by_username(db_session, decoded["sub"], user_id_cache)
 
 
 # 클라이언트가 보낸 HTTP 요청의 Cookie 헤더에서 값을 읽습니다.
@@ -37,9 +94,12 @@ async def get_user(auth_token: str | None, db_session: AsyncSession) -> User | N
 # FastAPI는 요청의 Cookie 헤더를 파싱해 Cookie(...)로 주입합니다.
 async def get_current_user(
     auth_token: Annotated[str | None, Cookie(...)],
-    db_session: DbSessionDep
+    db_session: DbSessionDep,
+    token_service: TokenServiceDep,
+    session_store: SessionStoreDep,
+    user_id_cache: UserIdCacheDep,
 ):
-    user = await get_user(auth_token, db_session) # 현재 db 세션을 통해 사용자 정보를 조회
+    user = await get_user(auth_token, db_session, token_service, session_store, user_id_cache) # 현재 db 세션을 통해 사용자 정보를 조회
 
     if user is None:
         raise UserNotFoundError()
@@ -50,9 +110,21 @@ CurrentUserDep = Annotated[User, Depends(get_current_user)]
 
 async def get_current_user_optional(
     db_session: DbSessionDep,
+    token_service: TokenServiceDep,
+    session_store: SessionStoreDep,
+    user_id_cache: UserIdCacheDep,
     auth_token: Annotated[str | None, Cookie()] = None,
 ):
-    user = await get_user(auth_token, db_session)
+    user = await get_user(auth_token, db_session, token_service, session_store, user_id_cache)
     return user
 
-CurrentUserOptionalDep = Annotated[User | None, Depends(get_current_user_optional)]
\ No newline at end of file
+CurrentUserOptionalDep = Annotated[User | None, Depends(get_current_user_optional)]
+
+
+# 로그인 엔드포인트보다 먼저 실행되어 DB 조회와 비밀번호 검증(Argon2) 전에 거절합니다.
+async def check_login_rate_limit(request: Request, payload: LoginPayload):
+    limiter = request.app.state.login_rate_limiter
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = await limiter.check(payload.username, client_ip)
+    if retry_after > 0:
+        raise TooManyLoginAttemptsError(retry_after)
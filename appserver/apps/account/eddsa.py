@@ -0,0 +1,85 @@
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+from jose.utils import base64url_encode
+
+EDDSA = "EdDSA"
+
+
+class Ed25519Key(Key):
+    """
+    python-jose가 지원하지 않는 EdDSA(Ed25519) 서명을 위한 키 클래스
+    PEM 형식의 개인 키(서명+검증) 또는 공개 키(검증만)를 받음
+    """
+
+    def __init__(self, key, algorithm):
+        if algorithm != EDDSA:
+            raise JWKError(f"{algorithm}은 Ed25519 키에서 쓸 수 없는 알고리즘입니다.")
+        self._algorithm = algorithm
+
+        if isinstance(key, (Ed25519PrivateKey, Ed25519PublicKey)):
+            self._key = key
+            return
+
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+        try:
+            if b"PRIVATE" in key:
+                loaded = serialization.load_pem_private_key(key, password=None)
+            else:
+                loaded = serialization.load_pem_public_key(key)
+        except ValueError as e:
+            raise JWKError(e)
+        if not isinstance(loaded, (Ed25519PrivateKey, Ed25519PublicKey)):
+            raise JWKError("Ed25519 키가 아닙니다.")
+        self._key = loaded
+
+    def is_public(self) -> bool:
+        return isinstance(self._key, Ed25519PublicKey)
+
+    def sign(self, msg: bytes) -> bytes:
+        if self.is_public():
+            raise JWKError("공개 키로는 서명할 수 없습니다.")
+        return self._key.sign(msg)
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        public_key = self._key if self.is_public() else self._key.public_key()
+        try:
+            public_key.verify(sig, msg)
+        except InvalidSignature:
+            return False
+        return True
+
+    def public_key(self) -> "Ed25519Key":
+        if self.is_public():
+            return self
+        return type(self)(self._key.public_key(), self._algorithm)
+
+    def to_pem(self) -> bytes:
+        if self.is_public():
+            return self._key.public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        return self._key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+
+    def to_dict(self) -> dict:
+        public_key = self.public_key()._key
+        raw = public_key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        return {
+            "alg": self._algorithm,
+            "kty": "OKP",
+            "crv": "Ed25519",
+            "x": base64url_encode(raw).decode("ascii"),
+        }
+
+
+def register_eddsa() -> None:
+    jwk.register_key(EDDSA, Ed25519Key)
@@ -1,22 +1,22 @@
 from pickle import TRUE
 from datetime import datetime, timezone, timedelta
-from fastapi import APIRouter, HTTPException, status, Body
+from typing import Annotated
+from fastapi import APIRouter, Cookie, Depends, HTTPException, status, Body
 from fastapi.responses import JSONResponse
 from sqlmodel import select, func, update, delete
 from sqlalchemy.exc import IntegrityError
-from appserver.db import DbSessionDep
+from appserver.db import DbSessionDep, transactional
 from .schemas import (
     SignupPayload, UserOut, LoginPayload, UserDetailOut,
-    UpdateUserPayload,
+    UpdateUserPayload, UsernamesBatchIn,
 )
 from .models import User
-from .deps import CurrentUserDep
-from .constants import AUTH_TOKEN_COOKIE_NAME
-from .utils import (
-    verify_password,
-    create_access_token,
-    ACCESS_TOKEN_EXPIRE_MINUTES
+from .lookup import get_user_by_username, normalize_username
+from .deps import (
+    CurrentUserDep, TokenServiceDep, SessionStoreDep, UserIdCacheDep, UserLoaderDep, check_login_rate_limit,
 )
+from .constants import AUTH_TOKEN_COOKIE_NAME
+from .utils import verify_password
 from .exceptions import (
     DuplicateUsernameError,
     DuplicateEmailError,
@@ -45,10 +45,8 @@ router = APIRouter(prefix="/account")
 
 
 @router.get("/users/{username}")
-async def user_detail(username: str, session: DbSessionDep) -> User:
-    stmt = select(User).where(User.username == username)
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
+async def user_detail(username: str, session: DbSessionDep, user_id_cache: UserIdCacheDep) -> User:
+    user = await get_user_by_username(session, username, user_id_cache)
 
     if user:
         return user
@@ -56,10 +54,24 @@ async def user_detail(username: str, session: DbSessionDep) -> User:
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
 
+@router.post("/users:batchGet", status_code=status.HTTP_200_OK)
+async def batch_get_users(payload: UsernamesBatchIn, user_loader: UserLoaderDep) -> dict[str, UserOut | None]:
+    """
+    username 여러 개를 IN (...) 조회 한 번으로 찾음
+    요청한 username을 그대로 키로 쓰고, 없는 사용자는 null
+    """
+    users = await user_loader.load_many(payload.usernames)
+    return {
+        username: UserOut.model_validate(user) if user is not None else None
+        for username, user in zip(payload.usernames, users)
+    }
+
+
 @router.post("/signup", status_code=status.HTTP_201_CREATED, response_model=UserOut)
+@transactional
 async def signup(payload: SignupPayload, session: DbSessionDep) -> User:
     stmt = select(func.count()).select_from(User).where(
-        User.username == payload.username
+        User.username_lower == normalize_username(payload.username)
     )
     result = await session.execute(stmt)
     count = result.scalar_one()
@@ -69,18 +81,27 @@ async def signup(payload: SignupPayload, session: DbSessionDep) -> User:
     user = User.model_validate(payload, from_attributes=True)
     session.add(user)
     try:
-        await session.commit()
+        await session.flush()
     except IntegrityError as e:
         raise DuplicateEmailError()
 
     return user
 
 
-@router.post("/login", status_code=status.HTTP_200_OK)
-async def login(payload: LoginPayload, session: DbSessionDep) -> JSONResponse:
-    stmt = select(User).where(User.username == payload.username)
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
+@router.post(
+    "/login",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(check_login_rate_limit)],
+)
+@transactional
+async def login(
+    payload: LoginPayload,
+    session: DbSessionDep,
+    token_service: TokenServiceDep,
+    session_store: SessionStoreDep,
+    user_id_cache: UserIdCacheDep,
+) -> JSONResponse:
+    user = await get_user_by_username(session, payload.username, user_id_cache)
 
     if user is None:
         raise UserNotFoundError()
@@ -89,21 +110,27 @@ async def login(payload: LoginPayload, session: DbSessionDep) -> JSONResponse:
     if not is_valid:
         raise PasswordMismatchError()
 
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={
-            "sub": user.username,
-            "display_name": user.display_name,
-            "is_host": user.is_host,
-        },
-        expires_delta=access_token_expires
-    )
+    access_token_expires = timedelta(minutes=token_service.expire_minutes)
+    if session_store is not None:
+        # 세션 방식: 의미 없는 무작위 세션 ID를 발급
+        access_token = await session_store.create(user, session)
+        token_type = "session"
+    else:
+        access_token = token_service.encode(
+            data={
+                "sub": user.username,
+                "display_name": user.display_name,
+                "is_host": user.is_host,
+            },
+            expires_delta=access_token_expires
+        )
+        token_type = "bearer"
     response_data = {
         "access_token": access_token,
-        "token_type": "bearer",
+        "token_type": token_type,
         "user": user.model_dump(
             mode="json", 
-            exclude={"hashed_password", "email"}
+            exclude={"hashed_password", "email", "username_lower"}
         )
     }
 
@@ -114,7 +141,7 @@ async def login(payload: LoginPayload, session: DbSessionDep) -> JSONResponse:
     res.set_cookie(
         key=AUTH_TOKEN_COOKIE_NAME,
         value=access_token,
-        expires=now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+        expires=now + access_token_expires,
         httponly=True,
         secure=True,
         samesite="strict"
@@ -128,31 +155,54 @@ async def me(user: CurrentUserDep) -> User:
 
 
 @router.patch("/@me", response_model=UserDetailOut)
+@transactional
 async def update_user(
     payload: UpdateUserPayload,
     user: CurrentUserDep,
     session: DbSessionDep,
+    session_store: SessionStoreDep,
 ) -> User:
     updated_data = payload.model_dump(exclude_none=True, exclude={"password", "password_again"})
 
-    stmt = update(User).where(User.id == user.id).values(**updated_data)
-    await session.execute(stmt)
-    await session.commit()
-    await session.refresh(user)
+    # RETURNING으로 바뀐 값을 받아 세션의 user 객체에 반영 (refresh 조회 없음)
+    stmt = update(User).where(User.id == user.id).values(**updated_data).returning(User)
+    result = await session.execute(stmt)
+    user = result.scalar_one()
+    if session_store is not None:
+        await session_store.update_user(user, session)
     return user
 
 
 @router.delete("/logout", status_code=status.HTTP_200_OK)
-async def logout(user: CurrentUserDep) -> JSONResponse:
+@transactional
+async def logout(
+    user: CurrentUserDep,
+    session: DbSessionDep,
+    session_store: SessionStoreDep,
+    auth_token: Annotated[str | None, Cookie()] = None,
+) -> JSONResponse:
+    # JWT 방식은 토큰이 만료될 때까지 유효하지만, 세션 방식은 바로 무효화됨
+    if session_store is not None and auth_token:
+        await session_store.revoke(auth_token, session)
+
     res = JSONResponse({})
     res.delete_cookie(AUTH_TOKEN_COOKIE_NAME)
     return res
 
 
 @router.delete("/unregister", status_code=status.HTTP_204_NO_CONTENT)
-async def unregister(user: CurrentUserDep, session: DbSessionDep) -> None:
+@transactional
+async def unregister(
+    user: CurrentUserDep,
+    session: DbSessionDep,
+    session_store: SessionStoreDep,
+    user_id_cache: UserIdCacheDep,
+) -> None:
+    if session_store is not None:
+        await session_store.revoke_user(user.id, session)
+    user_id_cache.invalidate(user.username)
+
     stmt = delete(User).where(User.id == user.id)
     await session.execute(stmt)
-    await session.commit()
     return None
 
@@ -1,3 +1,4 @@
+import math
 from fastapi import HTTPException, status
 
 class DuplicateUsernameError(HTTPException):
@@ -46,4 +47,13 @@ class ExpiredTokenError(HTTPException):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="만료된 인증 토큰입니다.",
             headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+class TooManyLoginAttemptsError(HTTPException):
+    def __init__(self, retry_after: float):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="로그인 시도가 너무 많습니다. 잠시 후 다시 시도하세요.",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
         )
\ No newline at end of file
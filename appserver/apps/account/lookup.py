@@ -0,0 +1,96 @@
+"""
+username으로 사용자 찾기
+
+- username은 대소문자를 구분하지 않음 → users.username_lower(소문자, UNIQUE 인덱스)로 조회
+- username → 사용자 ID를 프로세스 안에 보관(UserIdCache)
+  → 두 번째 조회부터는 기본 키로 읽고, 같은 요청 안에서는 세션의 식별자 맵에서 바로 꺼냄
+- 여러 명은 get_users_by_usernames()로 한 번에 조회 (요청 안에서는 UserLoaderDep으로 중복 조회를 없앰)
+- 사용자 ID는 바뀌지 않으므로 탈퇴할 때만 지우면 되고,
+  다른 워커에서 탈퇴한 사용자는 기본 키 조회가 비어 있거나 다른 사용자일 때 지우고 다시 찾음
+  (탈퇴한 사용자의 ID를 새로 가입한 사용자가 받을 수 있으므로 username이 같은지 확인)
+"""
+from collections import OrderedDict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import User
+from .queries import USER_BY_USERNAME, USERS_BY_USERNAMES
+
+
+def normalize_username(username: str) -> str:
+    """
+    >>> normalize_username("PuddingCamp")
+    'puddingcamp'
+    """
+    return username.lower()
+
+
+class UserIdCache:
+    """
+    정규화한 username → 사용자 ID (프로세스 안, LRU)
+
+    >>> cache = UserIdCache(max_entries=1)
+    >>> cache.set("PuddingCamp", 1)
+    >>> cache.get("puddingcamp")
+    1
+    >>> cache.set("guest", 2)
+    >>> cache.get("puddingcamp") is None
+    True
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self._user_ids: OrderedDict[str, int] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._user_ids)
+
+    def get(self, username: str) -> int | None:
+        key = normalize_username(username)
+        user_id = self._user_ids.get(key)
+        if user_id is not None:
+            self._user_ids.move_to_end(key)
+        return user_id
+
+    def set(self, username: str, user_id: int) -> None:
+        key = normalize_username(username)
+        self._user_ids[key] = user_id
+        self._user_ids.move_to_end(key)
+        while len(self._user_ids) > self.max_entries:
+            self._user_ids.popitem(last=False)
+
+    def invalidate(self, username: str) -> None:
+        self._user_ids.pop(normalize_username(username), None)
+
+
+async def get_user_by_username(
+    session: AsyncSession,
+    username: str,
+    cache: UserIdCache | None = None,
+) -> User | None:
+    if cache is not None and (user_id := cache.get(username)) is not None:
+        user = await session.get(User, user_id)
+        if user is not None and user.username_lower == normalize_username(username):
+            return user
+        cache.invalidate(username)
+
+    result = await session.execute(USER_BY_USERNAME, {"username": normalize_username(username)})
+    user = result.scalar_one_or_none()
+    if user is not None and cache is not None:
+        cache.set(username, user.id)
+    return user
+
+
+async def get_users_by_usernames(
+    session: AsyncSession,
+    usernames: list[str],
+    cache: UserIdCache | None = None,
+) -> dict[str, User]:
+    """정규화한 username → User (없는 사용자는 빠짐), 조회는 IN (...) 한 번"""
+    keys = list(dict.fromkeys(normalize_username(username) for username in usernames))
+    result = await session.execute(USERS_BY_USERNAMES, {"usernames": keys})
+    users = {user.username_lower: user for user in result.unique().scalars()}
+    if cache is not None:
+        for key, user in users.items():
+            cache.set(key, user.id)
+    return users
@@ -1,7 +1,8 @@
 import random
 import string
 from datetime import datetime, timezone
-from sqlmodel import SQLModel, Field, Relationship, func, Column, AutoString
+from sqlmodel import SQLModel, Field, Relationship, func, Column, AutoString, JSON, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from pydantic import EmailStr, AwareDatetime, model_validator
 from sqlalchemy import UniqueConstraint
 from sqlalchemy_utc import UtcDateTime
@@ -10,6 +11,13 @@ if TYPE_CHECKING:
     from appserver.apps.calendar.models import Calendar, Booking
 
 
+def _lower_username(context) -> str:
+    # INSERT 값의 username으로 username_lower를 채움
+    # 여러 행 VALUES INSERT에서는 행마다 불리지만 여기서 username을 찾지 못하므로 값을 직접 넣어야 함
+    # (appserver.apps.account.bulk_import 참고)
+    return context.get_current_parameters()["username"].lower()
+
+
 class User(SQLModel, table=True):
     __tablename__ = "users"
     __table_args__ = (
@@ -19,6 +27,16 @@ class User(SQLModel, table=True):
 
     id: int = Field(default=None, primary_key=True)
     username: str = Field(unique=True, min_length=4,max_length=40, description="사용자 계정 ID")
+    # 대소문자를 구분하지 않는 조회용 (appserver.apps.account.lookup 참고)
+    username_lower: str = Field(
+        default=None,
+        nullable=False,
+        unique=True,
+        index=True,
+        max_length=40,
+        sa_column_kwargs={"default": _lower_username},
+        description="소문자로 바꾼 사용자 계정 ID",
+    )
     email: EmailStr = Field(max_length=128, description="사용자 이메일")
     display_name: str = Field(min_length=4, max_length=40, description="사용자 표시 이름")
     # display_name: str | None = Field(min_length=4, max_length=40, description="사용자 표시 이름")
@@ -87,3 +105,25 @@ class OAuthAccount(SQLModel, table=True):
     )
 
 
+class UserSession(SQLModel, table=True):
+    """
+    서버 측 세션 (auth_backend=session, session_store=database일 때 사용)
+    로그인한 사용자 정보(스냅샷)를 함께 저장해서 요청마다 users 테이블을 조회하지 않음
+    """
+    __tablename__ = "user_sessions"
+
+    id: str = Field(primary_key=True, max_length=64, description="세션 ID")
+    user_id: int = Field(foreign_key="users.id", index=True)
+    snapshot: dict = Field(
+        sa_type=JSON().with_variant(JSONB(astext_type=Text()), "postgresql"),
+        description="사용자 정보 스냅샷",
+    )
+    expires_at: AwareDatetime = Field(sa_type=UtcDateTime, nullable=False, index=True)
+    created_at: AwareDatetime = Field(
+        default=None,
+        nullable=False,
+        sa_type=UtcDateTime,
+        sa_column_kwargs={
+            "server_default": func.now(),
+        }
+    )
@@ -0,0 +1,19 @@
+"""
+자주 실행하는 계정 조회문
+
+문장 객체는 모듈을 불러올 때 한 번만 만들고, 값은 bindparam으로 넘깁니다.
+→ 요청마다 select()를 새로 만들고 캐시 키를 계산하는 비용이 없고,
+  컴파일한 SQL은 엔진의 컴파일 캐시(query_cache_size)에서 그대로 재사용
+
+    result = await session.execute(USER_BY_USERNAME, {"username": username.lower()})
+"""
+from sqlalchemy import bindparam
+from sqlmodel import select
+
+from .models import User
+
+# username은 소문자로 바꿔서 넘김 (lookup.get_user_by_username() 사용)
+USER_BY_USERNAME = select(User).where(User.username_lower == bindparam("username"))
+
+# username 여러 개를 IN (...) 한 번으로: 소문자로 바꾼 목록을 넘김 (lookup.get_users_by_usernames() 사용)
+USERS_BY_USERNAMES = select(User).where(User.username_lower.in_(bindparam("usernames", expanding=True)))
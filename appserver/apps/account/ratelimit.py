@@ -0,0 +1,43 @@
+from appserver.libs.kvstore.local import KeyValueStore, LocalKeyValueStore
+from appserver.libs.ratelimit.token_bucket import TokenBucket, SharedTokenBucket
+from appserver.settings import Settings
+
+
+class LoginRateLimiter:
+    """
+    로그인 시도를 계정 ID와 클라이언트 IP 기준으로 각각 제한
+    - IP 기준: 한 곳에서 여러 계정을 두드리는 경우
+    - 계정 ID 기준: 여러 곳에서 한 계정을 두드리는 경우
+    """
+
+    def __init__(self, by_username: TokenBucket | SharedTokenBucket, by_ip: TokenBucket | SharedTokenBucket):
+        self.by_username = by_username
+        self.by_ip = by_ip
+
+    async def check(self, username: str, client_ip: str) -> float:
+        """
+        허용하면 0, 아니면 다시 시도할 때까지 기다려야 하는 초를 반환
+        """
+        retry_after = await self.by_ip.consume(client_ip)
+        if retry_after > 0:
+            return retry_after
+        return await self.by_username.consume(username.lower())
+
+
+def create_login_rate_limiter(settings: Settings, store: KeyValueStore | None = None) -> LoginRateLimiter:
+    per_username = (settings.login_attempts_per_minute / 60, settings.login_attempts_burst)
+    per_ip = (settings.login_ip_attempts_per_minute / 60, settings.login_ip_attempts_burst)
+
+    if settings.login_rate_limit_backend == "shared":
+        # 공용 저장소를 주지 않으면 프로세스 안 저장소로 대신함 (테스트, 단일 워커)
+        if store is None:
+            store = LocalKeyValueStore(max_entries=settings.rate_limit_max_keys)
+        return LoginRateLimiter(
+            by_username=SharedTokenBucket(store, *per_username, prefix="login:username"),
+            by_ip=SharedTokenBucket(store, *per_ip, prefix="login:ip"),
+        )
+
+    return LoginRateLimiter(
+        by_username=TokenBucket(*per_username, max_keys=settings.rate_limit_max_keys),
+        by_ip=TokenBucket(*per_ip, max_keys=settings.rate_limit_max_keys),
+    )
@@ -1,7 +1,7 @@
 import random
 import string
-from typing import Self
-from pydantic import AwareDatetime, EmailStr, model_validator, computed_field
+from typing import Annotated, Self
+from pydantic import AwareDatetime, EmailStr, StringConstraints, model_validator, computed_field
 from sqlmodel import SQLModel, Field
 from .utils import hash_password
 
@@ -36,6 +36,18 @@ class UserOut(SQLModel):
     is_host: bool
 
 
+# 한 번에 조회할 수 있는 username 수
+MAX_BATCH_USERNAMES = 100
+
+
+class UsernamesBatchIn(SQLModel):
+    usernames: list[Annotated[str, StringConstraints(min_length=1, max_length=40)]] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_USERNAMES,
+        description="조회할 username 목록 (대소문자 무시, 중복은 한 번만 조회)",
+    )
+
+
 class LoginPayload(SQLModel):
     username: str = Field(min_length=4, max_length=40)
     password: str = Field(min_length=8, max_length=128)
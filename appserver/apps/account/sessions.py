@@ -0,0 +1,238 @@
+import secrets
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from sqlalchemy import DateTime, inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import SQLModel, select, update, delete
+
+from appserver.apps.calendar.models import Calendar
+from appserver.settings import Settings
+from .models import User, UserSession
+
+
+Snapshot = dict[str, Any]
+
+# 세션에 저장하지 않는 사용자 정보
+SNAPSHOT_EXCLUDE = {"hashed_password"}
+
+
+def user_snapshot(user: User) -> Snapshot:
+    """
+    세션에 저장할 사용자 정보 (JSON으로 저장할 수 있는 값만)
+    CurrentUserDep을 쓰는 엔드포인트가 user.calendar를 쓰므로 캘린더도 함께 저장
+    """
+    snapshot = user.model_dump(mode="json", exclude=SNAPSHOT_EXCLUDE)
+    calendar = user.calendar
+    snapshot["calendar"] = calendar.model_dump(mode="json") if calendar is not None else None
+    return snapshot
+
+
+def _from_snapshot(model: type[SQLModel], data: Snapshot) -> SQLModel:
+    values = {}
+    for column in sa_inspect(model).columns:
+        if column.key not in data:
+            continue
+        value = data[column.key]
+        column_type = getattr(column.type, "impl", column.type)
+        if isinstance(column_type, DateTime) and isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        values[column.key] = value
+    return model(**values)
+
+
+async def restore_user(db_session: AsyncSession, snapshot: Snapshot) -> User:
+    """
+    스냅샷으로 User 객체를 만들어 DB 조회 없이 세션에 붙임
+    → 엔드포인트에서 user.calendar를 고치고 커밋하는 등 ORM 객체처럼 그대로 쓸 수 있음
+    """
+    user = _from_snapshot(User, snapshot)
+    calendar = None
+    if snapshot.get("calendar") is not None:
+        calendar = _from_snapshot(Calendar, snapshot["calendar"])
+    user.calendar = calendar
+
+    # 이미 DB에서 읽은 객체처럼 표시(변경 이력 초기화)하고,
+    # load=False로 병합해서 SELECT 없이 세션의 식별자 맵에 넣음
+    make_transient_to_detached(user)
+    if calendar is not None:
+        make_transient_to_detached(calendar)
+    return await db_session.merge(user, load=False)
+
+
+def new_session_id() -> str:
+    return secrets.token_urlsafe(32)
+
+
+class SessionStore(ABC):
+    """
+    서버 측 세션 저장소
+
+    db_session은 요청에서 쓰는 DB 세션으로, DB에 저장하는 구현에서만 사용
+    쓰기 메서드는 커밋하지 않음 → 요청의 트랜잭션(appserver.db.transactional)과 함께 커밋
+    """
+
+    def __init__(self, ttl: timedelta):
+        self.ttl = ttl
+
+    @abstractmethod
+    async def create(self, user: User, db_session: AsyncSession) -> str:
+        """세션을 만들고 세션 ID를 반환"""
+
+    @abstractmethod
+    async def get(self, session_id: str, db_session: AsyncSession) -> Snapshot | None:
+        """세션의 사용자 스냅샷 (없거나 만료되었으면 None)"""
+
+    @abstractmethod
+    async def update_user(self, user: User, db_session: AsyncSession) -> None:
+        """사용자 정보가 바뀌었을 때 그 사용자의 모든 세션 스냅샷을 갱신"""
+
+    @abstractmethod
+    async def revoke(self, session_id: str, db_session: AsyncSession) -> None:
+        """세션 하나를 즉시 무효화 (로그아웃)"""
+
+    @abstractmethod
+    async def revoke_user(self, user_id: int, db_session: AsyncSession) -> None:
+        """사용자의 모든 세션을 즉시 무효화 (탈퇴)"""
+
+    @abstractmethod
+    async def purge_expired(self, db_session: AsyncSession) -> int:
+        """만료된 세션을 지우고 지운 개수를 반환 (요청 밖에서 실행하므로 직접 커밋)"""
+
+
+class MemorySessionStore(SessionStore):
+    """
+    프로세스 안 세션 저장소
+
+    - 세션 ID → (사용자 ID, 만료 시각), 사용자 ID → 스냅샷으로 나눠 저장
+      → 스냅샷은 사용자마다 하나만 두고, 사용자 정보가 바뀌면 한 번만 고침
+    - max_entries를 넘으면 가장 오래 쓰지 않은 세션부터 버림(LRU)
+    - 워커마다 따로 저장하므로 워커가 여러 개이면 database 저장소를 사용
+    """
+
+    def __init__(
+        self,
+        ttl: timedelta,
+        max_entries: int = 100_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._sessions: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._snapshots: dict[int, Snapshot] = {}
+        self._user_sessions: dict[int, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _discard(self, session_id: str) -> None:
+        item = self._sessions.pop(session_id, None)
+        if item is None:
+            return
+        user_id, _ = item
+        session_ids = self._user_sessions.get(user_id)
+        if session_ids is not None:
+            session_ids.discard(session_id)
+            if not session_ids:
+                del self._user_sessions[user_id]
+                self._snapshots.pop(user_id, None)
+
+    async def create(self, user: User, db_session: AsyncSession) -> str:
+        session_id = new_session_id()
+        self._sessions[session_id] = (user.id, self._clock() + self.ttl.total_seconds())
+        self._snapshots[user.id] = user_snapshot(user)
+        self._user_sessions.setdefault(user.id, set()).add(session_id)
+        while len(self._sessions) > self.max_entries:
+            self._discard(next(iter(self._sessions)))
+        return session_id
+
+    async def get(self, session_id: str, db_session: AsyncSession) -> Snapshot | None:
+        item = self._sessions.get(session_id)
+        if item is None:
+            return None
+        user_id, expires_at = item
+        if expires_at <= self._clock():
+            self._discard(session_id)
+            return None
+        self._sessions.move_to_end(session_id)
+        return self._snapshots.get(user_id)
+
+    async def update_user(self, user: User, db_session: AsyncSession) -> None:
+        if user.id in self._snapshots:
+            self._snapshots[user.id] = user_snapshot(user)
+
+    async def revoke(self, session_id: str, db_session: AsyncSession) -> None:
+        self._discard(session_id)
+
+    async def revoke_user(self, user_id: int, db_session: AsyncSession) -> None:
+        for session_id in list(self._user_sessions.get(user_id, ())):
+            self._discard(session_id)
+
+    async def purge_expired(self, db_session: AsyncSession) -> int:
+        now = self._clock()
+        expired = [sid for sid, (_, expires_at) in self._sessions.items() if expires_at <= now]
+        for session_id in expired:
+            self._discard(session_id)
+        return len(expired)
+
+
+class DatabaseSessionStore(SessionStore):
+    """
+    user_sessions 테이블에 저장하는 세션 저장소 (워커끼리 공유)
+    조회는 기본 키 한 번으로 끝나고 users 테이블은 읽지 않음
+    """
+
+    async def create(self, user: User, db_session: AsyncSession) -> str:
+        session_id = new_session_id()
+        db_session.add(UserSession(
+            id=session_id,
+            user_id=user.id,
+            snapshot=user_snapshot(user),
+            expires_at=datetime.now(timezone.utc) + self.ttl,
+        ))
+        await db_session.flush()
+        return session_id
+
+    async def get(self, session_id: str, db_session: AsyncSession) -> Snapshot | None:
+        stmt = (
+            select(UserSession.snapshot)
+            .where(UserSession.id == session_id)
+            .where(UserSession.expires_at > datetime.now(timezone.utc))
+        )
+        result = await db_session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def update_user(self, user: User, db_session: AsyncSession) -> None:
+        stmt = (
+            update(UserSession)
+            .where(UserSession.user_id == user.id)
+            .values(snapshot=user_snapshot(user))
+        )
+        await db_session.execute(stmt)
+
+    async def revoke(self, session_id: str, db_session: AsyncSession) -> None:
+        await db_session.execute(delete(UserSession).where(UserSession.id == session_id))
+
+    async def revoke_user(self, user_id: int, db_session: AsyncSession) -> None:
+        await db_session.execute(delete(UserSession).where(UserSession.user_id == user_id))
+
+    async def purge_expired(self, db_session: AsyncSession) -> int:
+        stmt = delete(UserSession).where(UserSession.expires_at <= datetime.now(timezone.utc))
+        result = await db_session.execute(stmt)
+        await db_session.commit()
+        return result.rowcount
+
+
+def create_session_store(settings: Settings) -> SessionStore | None:
+    if settings.auth_backend != "session":
+        return None
+
+    ttl = timedelta(minutes=settings.access_token_expire_minutes)
+    if settings.session_store == "database":
+        return DatabaseSessionStore(ttl)
+    return MemorySessionStore(ttl, max_entries=settings.session_store_max_entries)
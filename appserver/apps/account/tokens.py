@@ -0,0 +1,141 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from appserver.settings import Settings
+if TYPE_CHECKING:
+    from jose.backends.base import Key
+
+
+class TokenDecodeError(Exception):
+    pass
+
+
+class TokenKeyError(TokenDecodeError):
+    pass
+
+
+class TokenExpiredError(TokenDecodeError):
+    pass
+
+
+class TokenService:
+    """
+    JWT 발급/검증 서비스
+
+    - 키 문자열(비밀 값, PEM)을 요청마다 파싱하지 않도록 키 객체를 미리 만들어 둠
+    - 토큰 헤더에 kid를 넣어 여러 키를 함께 운용(키 교체)
+      → 새 토큰은 active_kid 키로 서명하고, 이전 키로 서명한 토큰도 만료 전까지 검증
+    - HS256 외에 ES256, EdDSA 같은 비대칭 알고리즘도 지원
+      → 공개 키만 가진 곳(엣지)에서도 서명 없이 검증만 할 수 있음
+
+    keys: {kid: 비밀 값 또는 PEM}, algorithms: {kid: 알고리즘} (없으면 algorithm 사용)
+    """
+
+    def __init__(
+        self,
+        keys: dict[str, str],
+        active_kid: str,
+        algorithm: str = "HS256",
+        algorithms: dict[str, str] | None = None,
+        expire_minutes: int = 30,
+    ):
+        # jose(cryptography 포함)는 불러오는 비용이 커서 서비스를 만들 때 불러옴
+        from jose import jwk
+        from jose.constants import ALGORITHMS
+        from .eddsa import register_eddsa
+
+        register_eddsa()
+
+        if active_kid not in keys:
+            raise TokenKeyError(f"서명에 쓸 키({active_kid})가 없습니다.")
+
+        algorithms = algorithms or {}
+        self.active_kid = active_kid
+        self.expire_minutes = expire_minutes
+        # kid → (알고리즘, 서명용 키, 검증용 키)
+        self._keys: dict[str, tuple[str, "Key", "Key"]] = {}
+        for kid, material in keys.items():
+            alg = algorithms.get(kid, algorithm)
+            key = jwk.construct(material, alg)
+            # 비대칭 키는 공개 키로 검증함 (개인 키 객체로는 검증할 수 없음)
+            verify_key = key if alg in ALGORITHMS.HMAC else key.public_key()
+            self._keys[kid] = (alg, key, verify_key)
+
+        self._signing_alg, self._signing_key, _ = self._keys[active_kid]
+        self._headers = {"kid": active_kid}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "TokenService":
+        return cls(
+            keys=settings.jwt_keys,
+            active_kid=settings.jwt_active_kid,
+            algorithm=settings.jwt_algorithm,
+            algorithms=settings.jwt_key_algorithms,
+            expire_minutes=settings.access_token_expire_minutes,
+        )
+
+    def encode(self, data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
+        from jose import jwt
+
+        to_encode = data.copy()
+        if expires_delta is None:
+            expires_delta = timedelta(minutes=self.expire_minutes)
+        to_encode["exp"] = datetime.now(timezone.utc) + expires_delta
+
+        return jwt.encode(
+            to_encode,
+            self._signing_key,
+            algorithm=self._signing_alg,
+            headers=self._headers,
+        )
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """
+        서명과 만료 시각(exp)을 검증하고 클레임을 반환
+
+        jose.jwt.decode()는 헤더를 두 번 파싱하고 쓰지 않는 클레임 검증까지 하므로,
+        요청마다 실행되는 경로라서 미리 만든 키 객체로 서명만 직접 검증합니다.
+        """
+        from jose.utils import base64url_decode
+
+        try:
+            header_segment, claims_segment, signature_segment = token.split(".")
+            header = json.loads(base64url_decode(header_segment.encode("ascii")))
+        except (ValueError, UnicodeError) as e:
+            raise TokenDecodeError("토큰 형식이 올바르지 않습니다.") from e
+
+        # kid가 없는 토큰은 kid 도입 이전에 발급된 토큰으로 보고 현재 키로 검증
+        kid = header.get("kid", self.active_kid)
+        try:
+            alg, _, verify_key = self._keys[kid]
+        except KeyError:
+            raise TokenKeyError(f"알 수 없는 키({kid})로 서명한 토큰입니다.")
+
+        # 키에 정해진 알고리즘만 허용 (헤더의 alg를 믿고 검증 방식을 바꾸지 않음)
+        if header.get("alg") != alg:
+            raise TokenKeyError(f"키({kid})에 허용하지 않는 알고리즘입니다.")
+
+        signing_input = f"{header_segment}.{claims_segment}".encode("ascii")
+        try:
+            signature = base64url_decode(signature_segment.encode("ascii"))
+            is_valid = verify_key.verify(signing_input, signature)
+        except Exception as e:
+            raise TokenDecodeError("서명을 검증할 수 없습니다.") from e
+        if not is_valid:
+            raise TokenDecodeError("서명이 올바르지 않습니다.")
+
+        try:
+            claims = json.loads(base64url_decode(claims_segment.encode("ascii")))
+        except ValueError as e:
+            raise TokenDecodeError("클레임 형식이 올바르지 않습니다.") from e
+        if not isinstance(claims, dict):
+            raise TokenDecodeError("클레임 형식이 올바르지 않습니다.")
+
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            raise TokenDecodeError("만료 시각(exp)이 없습니다.")
+        if exp < time.time():
+            raise TokenExpiredError("만료된 토큰입니다.")
+        return claims
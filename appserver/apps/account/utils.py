@@ -1,13 +1,27 @@
-from datetime import datetime, timedelta, timezone
-from jose import jwt
-from typing import Any, Union
-from pwdlib import PasswordHash
-from pwdlib.hashers.argon2 import Argon2Hasher
-from pwdlib.hashers.bcrypt import BcryptHasher
+from datetime import timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Union
 
-SECRET_KEY = "your-secret-key-here"
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+from appserver.settings import get_settings
+from .tokens import TokenService
+if TYPE_CHECKING:
+    from pwdlib import PasswordHash
+
+
+# pwdlib(argon2, bcrypt)과 python-jose(cryptography)는 불러오는 비용이 큽니다.
+# 모듈을 import할 때가 아니라 처음 사용할 때 불러와서 앱 시작 시간을 줄입니다.
+@lru_cache
+def get_password_hash() -> "PasswordHash":
+    """
+    비밀번호 해셔 인스턴스를 한 번만 만들어서 재사용
+    1순위. Argon2 알고리즘
+    2순위. Bcrypt 알고리즘
+    """
+    from pwdlib import PasswordHash
+    from pwdlib.hashers.argon2 import Argon2Hasher
+    from pwdlib.hashers.bcrypt import BcryptHasher
+
+    return PasswordHash((Argon2Hasher(), BcryptHasher()))
 
 
 def hash_password(password: str) -> str:
@@ -16,27 +30,25 @@ def hash_password(password: str) -> str:
     1순위. Argon2 알고리즘으로 해싱
     2순위. Bcrypt 알고리즘으로 해싱
     """
-    password_hash = PasswordHash((Argon2Hasher(), BcryptHasher()))
-    return password_hash.hash(password)
+    return get_password_hash().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    password_hash = PasswordHash((Argon2Hasher(), BcryptHasher()))
-    return password_hash.verify(plain_password, hashed_password)
+    return get_password_hash().verify(plain_password, hashed_password)
 
 
-def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
-    to_encode = data.copy()
-    now = datetime.now(timezone.utc)
-    if expires_delta:
-        expire = now + expires_delta
-    else:
-        expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+@lru_cache
+def get_token_service() -> TokenService:
+    """
+    기본 설정으로 만든 토큰 서비스
+    (앱에서는 app.state.token_service를 사용합니다.)
+    """
+    return TokenService.from_settings(get_settings())
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+
+def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
+    return get_token_service().encode(data, expires_delta)
 
 
 def decode_token(token: str) -> dict:
-    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
\ No newline at end of file
+    return get_token_service().decode(token)
@@ -0,0 +1,165 @@
+"""
+예약 보관(archive)
+
+- bookings에는 최근 예약만 두고, 보관 기준일보다 오래된 예약은 bookings_archive로 옮김
+  → 호스트 예약 목록처럼 자주 쓰는 조회는 작은 테이블만 읽음
+- PostgreSQL에서 bookings_archive는 when 기준 월 단위 범위 파티션 테이블
+  → 옮기기 전에 필요한 달의 파티션을 만들고, 날짜 범위로 조회하면 해당 파티션만 읽음
+- 조회할 날짜 범위가 보관 기준일 이후이면 bookings_archive를 아예 읽지 않음
+- 반복 예약은 마지막 반복 날짜가 보관 기준일보다 이전일 때만 옮김
+- bookings는 파티션으로 나누지 않음
+  - 반복 예약의 when은 첫 번째 날짜라서, 기간 조회는 기간 이전 달의 예약도 모두 읽어야 함
+    → when으로 나눠도 최근 예약 조회에서 건너뛸 파티션이 거의 없음
+  - PostgreSQL은 파티션 키가 기본 키에 들어가야 해서 id만으로 예약을 가리킬 수 없게 됨
+  - 대신 오래된 예약을 옮겨서 bookings를 작게 유지 (보관 테이블의 반복 예약은 모두 끝난 것)
+- 옮긴 예약의 id는 bookings에서 다시 쓰지 않음 (SQLite는 AUTOINCREMENT, PostgreSQL은 시퀀스)
+"""
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator
+
+from sqlalchemy import insert, delete, or_, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel, select
+
+from appserver.settings import Settings
+from .models import Booking, BookingArchive
+
+logger = logging.getLogger(__name__)
+
+# bookings → bookings_archive로 그대로 옮기는 컬럼
+ARCHIVED_COLUMNS = (
+    "id", "when", "topic", "description", "recurrence", "recurrence_until",
+    "created_at", "updated_at", "time_slot_id", "guest_id",
+)
+
+
+def get_month_bounds(year: int, month: int) -> tuple[date, date]:
+    """
+    달의 시작일과 다음 달 시작일 [시작, 끝)
+
+    >>> get_month_bounds(2024, 12)
+    (datetime.date(2024, 12, 1), datetime.date(2025, 1, 1))
+    >>> get_month_bounds(2025, 2)
+    (datetime.date(2025, 2, 1), datetime.date(2025, 3, 1))
+    """
+    start = date(year, month, 1)
+    if month == 12:
+        return start, date(year + 1, 1, 1)
+    return start, date(year, month + 1, 1)
+
+
+def get_archive_cutoff(today: date, archive_after_days: int) -> date:
+    """
+    보관 기준일: 이 날짜보다 이전 예약은 보관 대상
+    파티션이 달 단위이므로 달의 첫날로 맞춤
+
+    >>> get_archive_cutoff(date(2025, 3, 15), 30)
+    datetime.date(2025, 2, 1)
+    >>> get_archive_cutoff(date(2025, 3, 15), 0)
+    datetime.date(2025, 3, 1)
+    """
+    day = today - timedelta(days=archive_after_days)
+    return day.replace(day=1)
+
+
+def get_booking_sources(start: date | None, cutoff: date) -> tuple[type[SQLModel], ...]:
+    """
+    start 이후의 예약을 찾을 때 읽어야 하는 테이블
+    bookings는 항상 읽고, 범위가 보관 기준일 이전까지 걸칠 때만 bookings_archive도 읽음
+    (보관 작업이 아직 옮기지 않은 예약도 bookings에 남아 있을 수 있으므로)
+
+    >>> get_booking_sources(date(2025, 3, 1), cutoff=date(2025, 2, 1))
+    (<class 'appserver.apps.calendar.models.Booking'>,)
+    >>> len(get_booking_sources(date(2025, 1, 1), cutoff=date(2025, 2, 1)))
+    2
+    >>> len(get_booking_sources(None, cutoff=date(2025, 2, 1)))
+    2
+    """
+    if start is not None and start >= cutoff:
+        return (Booking,)
+    return (Booking, BookingArchive)
+
+
+def iter_month_partitions(start: date, end: date) -> Iterator[tuple[str, date, date]]:
+    """
+    [start, end) 범위를 덮는 월 파티션 (이름, 시작일, 끝일)
+
+    >>> list(iter_month_partitions(date(2024, 12, 3), date(2025, 1, 7)))
+    [('bookings_archive_2024_12', datetime.date(2024, 12, 1), datetime.date(2025, 1, 1)), ('bookings_archive_2025_01', datetime.date(2025, 1, 1), datetime.date(2025, 2, 1))]
+    """
+    month_start, month_end = get_month_bounds(start.year, start.month)
+    while month_start < end:
+        name = f"{BookingArchive.__tablename__}_{month_start.year}_{month_start.month:02d}"
+        yield name, month_start, month_end
+        month_start, month_end = get_month_bounds(month_end.year, month_end.month)
+
+
+async def ensure_archive_partitions(session: AsyncSession, start: date, end: date) -> None:
+    """PostgreSQL에서 [start, end) 범위의 월 파티션이 없으면 만듦"""
+    for name, lower, upper in iter_month_partitions(start, end):
+        await session.execute(text(
+            f'CREATE TABLE IF NOT EXISTS "{name}" '
+            f'PARTITION OF "{BookingArchive.__tablename__}" '
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        ))
+
+
+async def archive_bookings(session: AsyncSession, before: date, batch_size: int = 1000) -> int:
+    """
+    before 이전 예약을 batch_size개씩 bookings_archive로 옮기고 옮긴 개수를 반환
+
+    묶음마다 복사와 삭제를 한 트랜잭션으로 커밋하므로,
+    중간에 멈춰도 예약이 사라지거나 두 테이블에 겹쳐 남지 않고 다시 실행하면 이어서 옮깁니다.
+    """
+    connection = await session.connection()
+    is_postgresql = connection.dialect.name == "postgresql"
+    columns = [getattr(Booking, name) for name in ARCHIVED_COLUMNS]
+
+    moved = 0
+    while True:
+        stmt = (
+            select(Booking.id, Booking.when)
+            .where(Booking.when < before)
+            # 반복 예약은 마지막 반복 날짜까지 지나야 옮김 (끝없이 반복하면 옮기지 않음)
+            .where(or_(Booking.recurrence.is_(None), Booking.recurrence_until < before))
+            .order_by(Booking.id)
+            .limit(batch_size)
+        )
+        rows = (await session.execute(stmt)).all()
+        if not rows:
+            break
+
+        ids = [row.id for row in rows]
+        if is_postgresql:
+            whens = [row.when for row in rows]
+            await ensure_archive_partitions(session, min(whens), max(whens) + timedelta(days=1))
+
+        await session.execute(
+            insert(BookingArchive).from_select(
+                list(ARCHIVED_COLUMNS),
+                select(*columns).where(Booking.id.in_(ids)),
+            )
+        )
+        await session.execute(delete(Booking).where(Booking.id.in_(ids)))
+        await session.commit()
+
+        moved += len(ids)
+        logger.info("archived %d bookings (before %s)", moved, before.isoformat())
+    return moved
+
+
+async def run_archive_job(settings: Settings, before: date | None = None, batch_size: int = 1000) -> int:
+    """`python -m appserver archive-bookings`에서 실행하는 보관 작업"""
+    from appserver.db import create_engine_from_settings, create_session
+
+    if before is None:
+        today = datetime.now(timezone.utc).date()
+        before = get_archive_cutoff(today, settings.booking_archive_after_days)
+
+    engine = create_engine_from_settings(settings)
+    try:
+        async with create_session(engine)() as session:
+            return await archive_bookings(session, before, batch_size)
+    finally:
+        await engine.dispose()
@@ -0,0 +1,57 @@
+from collections import Counter
+from datetime import date
+
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+from appserver.libs.datetime.calendar import get_range_days_of_month
+from .archive import get_month_bounds
+from .models import Booking, BookingDayCount
+from .queries import BOOKING_DAY_COUNTS_IN_RANGE, RECURRING_BOOKING_DATES_IN_RANGE
+from .recurrence import iter_booking_dates
+
+
+async def add_booking_day_count(
+    session: AsyncSession,
+    calendar_id: int,
+    day: date,
+    delta: int = 1,
+) -> None:
+    """
+    날짜별 예약 수를 delta만큼 바꿈 (예약 생성: 1, 예약 삭제: -1)
+    읽고 고치는 대신 upsert 한 번으로 처리하므로 동시에 예약해도 수가 어긋나지 않음
+    커밋은 예약을 저장하는 쪽에서 함께 함
+    """
+    dialect = (await session.connection()).dialect.name
+    insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+
+    stmt = insert(BookingDayCount).values(calendar_id=calendar_id, day=day, count=delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[BookingDayCount.calendar_id, BookingDayCount.day],
+        set_={"count": BookingDayCount.count + stmt.excluded.count},
+    )
+    await session.execute(stmt)
+
+
+async def get_month_booking_counts(
+    session: AsyncSession,
+    calendar_id: int,
+    year: int,
+    month: int,
+    sources: tuple[type[SQLModel], ...] = (Booking,),
+) -> list[tuple[int, int]]:
+    """
+    달력 칸(get_range_days_of_month)마다 (날짜, 예약 수)
+    앞쪽 빈칸은 (0, 0)
+    반복 예약은 날짜별 예약 수에 넣지 않으므로, sources에서 그 달에 걸친 반복 예약만 읽어 날짜를 펼쳐 더함
+    """
+    start, end = get_month_bounds(year, month)
+    params = {"calendar_id": calendar_id, "start": start, "end": end}
+    result = await session.execute(BOOKING_DAY_COUNTS_IN_RANGE, params)
+    counts = Counter({row.day.day: row.count for row in result})
+    for model in sources:
+        result = await session.execute(RECURRING_BOOKING_DATES_IN_RANGE[model], params)
+        for row in result:
+            counts.update(day.day for day in iter_booking_dates(row.when, row.recurrence, start, end))
+    return [(day, counts[day]) for day in get_range_days_of_month(year, month)]
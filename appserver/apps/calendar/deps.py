@@ -0,0 +1,56 @@
+from typing import Annotated
+from datetime import date, datetime, timezone
+
+from fastapi import Depends, Query, Request
+from fastapi.requests import HTTPConnection
+
+from pydantic import BaseModel
+
+from appserver.libs.http.fields import FieldSelection
+from appserver.libs.pubsub.hub import PubSubHub
+from .archive import get_archive_cutoff
+from .exceptions import InvalidFieldsError
+from .schedule import ScheduleCache
+from .schemas import BookingOut, BookingSearchHitOut, CalendarSearchResultOut
+
+
+def use_archive_cutoff(request: Request) -> date:
+    # 이 날짜 이전 예약은 bookings_archive로 옮겨졌을 수 있음
+    settings = request.app.state.settings
+    today = datetime.now(timezone.utc).date()
+    return get_archive_cutoff(today, settings.booking_archive_after_days)
+
+ArchiveCutoffDep = Annotated[date, Depends(use_archive_cutoff)]
+
+
+def use_schedule_cache(request: Request) -> ScheduleCache:
+    return request.app.state.schedule_cache
+
+ScheduleCacheDep = Annotated[ScheduleCache, Depends(use_schedule_cache)]
+
+
+def use_event_hub(connection: HTTPConnection) -> PubSubHub:
+    return connection.app.state.event_hub
+
+EventHubDep = Annotated[PubSubHub, Depends(use_event_hub)]
+
+
+def fields_dependency(schema: type[BaseModel]):
+    # ?fields=when,time_slot.start_time → 응답에 넣을 필드 (없으면 None → 전체)
+    def use_fields(
+        fields: Annotated[
+            str | None,
+            Query(max_length=500, description="응답에 넣을 필드 (쉼표로 구분, 중첩 필드는 time_slot.start_time처럼)"),
+        ] = None,
+    ) -> FieldSelection | None:
+        if fields is None:
+            return None
+        try:
+            return FieldSelection.parse(fields, schema)
+        except ValueError as e:
+            raise InvalidFieldsError(str(e)) from e
+    return use_fields
+
+BookingFieldsDep = Annotated[FieldSelection | None, Depends(fields_dependency(BookingOut))]
+BookingSearchFieldsDep = Annotated[FieldSelection | None, Depends(fields_dependency(BookingSearchHitOut))]
+CalendarSearchFieldsDep = Annotated[FieldSelection | None, Depends(fields_dependency(CalendarSearchResultOut))]
@@ -1,43 +1,93 @@
 from typing import Annotated
+from datetime import date, timedelta
 
-from fastapi import APIRouter, status, Query
-from sqlmodel import select, and_, extract
+from fastapi import (
+    APIRouter, BackgroundTasks, Query, Request, Response, WebSocket, WebSocketException, status,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlmodel import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from appserver.apps.account.models import User
 from appserver.apps.calendar.models import Calendar, TimeSlot
-from appserver.db import DbSessionDep
-from appserver.apps.account.deps import CurrentUserOptionalDep, CurrentUserDep
-from .models import Booking
+from appserver.db import DbSessionDep, transactional
+from appserver.libs.http.conditional import set_last_modified
+from appserver.libs.datetime.zones import get_zone_table
+from appserver.libs.pubsub.hub import PubSubHub, SubscriberLimitError, Subscription
+from appserver.apps.account.deps import (
+    CurrentUserOptionalDep, CurrentUserDep, SessionStoreDep, UserIdCacheDep, UserLoaderDep,
+)
+from appserver.apps.account.schemas import UsernamesBatchIn
+from appserver.apps.account.lookup import UserIdCache, get_user_by_username
+from .models import Booking, BookingArchive
+from .archive import get_month_bounds, get_booking_sources
+from .deps import (
+    ArchiveCutoffDep, BookingFieldsDep, BookingSearchFieldsDep, CalendarSearchFieldsDep, EventHubDep,
+    ScheduleCacheDep,
+)
+from .events import (
+    booking_created_message, calendar_topic, stream_sse, stream_websocket, time_slot_created_message,
+)
+from .queries import (
+    BOOKINGS_IN_RANGE, BOOKING_DATES_IN_RANGE, BOOKINGS_PAGE, RECENT_BOOKINGS_COUNT, SLOT_BOOKING_DATES_IN_RANGE,
+    bookings_page_projection,
+)
+from .recurrence import find_common_date, iter_booking_dates, parse_recurrence
+from .day_counts import add_booking_day_count, get_month_booking_counts
+from .topics import search_calendar_fields, search_calendars, sync_calendar_topics
+from .search import search_booking_fields, search_bookings, encode_cursor, decode_cursor
 from .schemas import (
     CalendarCreateIn, CalendarDetailOut, CalendarOut, CalendarUpdateIn,
     TimeSlotOut, TimeSlotCreateIn, BookingCreateIn, BookingOut,
-    SimpleBookingOut,
+    SimpleBookingOut, MonthBookingCountsOut, BookingDayCountOut, AvailableTimeSlotOut, AvailableSlotOut,
+    CalendarSearchResultOut, BookingSearchOut, BookingSearchHitOut,
+    PartialBookingOut, PartialBookingSearchOut, PartialCalendarSearchResultOut,
 )
 from .exceptions import (
     HostNotFoundError, CalendarNotFoundError, CalendarAlreadyExistsError,
-    GuestPermissionError, TimeSlotOverLapError, TimeSlotNotFoundError,
+    GuestPermissionError, TimeSlotOverLapError, TimeSlotNotFoundError, SearchQueryRequiredError,
+    InvalidCursorError, RecurrenceMismatchError, RecurrenceConflictError, AvailabilityRangeError,
+    EventSubscriberLimitError, BookingConflictError,
 )
 
 
 router = APIRouter()
 
+# 기간 예약 가능 시각 조회의 최대 일수
+MAX_AVAILABILITY_DAYS = 92
+# 실시간 이벤트 구독자가 가득 찼을 때 다시 연결하기까지 기다릴 시간 (초)
+SUBSCRIBER_LIMIT_RETRY_AFTER = 5
+
+
+async def get_host(session: AsyncSession, host_username: str, user_id_cache: UserIdCache | None) -> User:
+    """캘린더가 있는 호스트 (없으면 HostNotFoundError)"""
+    host = await get_user_by_username(session, host_username, user_id_cache)
+    if host is None or not host.is_host or host.calendar is None:
+        raise HostNotFoundError()
+    return host
+
 
 @router.get("/calendar/{host_username}", status_code=status.HTTP_200_OK)
 async def host_calendar_detail(
     host_username: str,             
     user: CurrentUserOptionalDep,
     session: DbSessionDep,
+    user_id_cache: UserIdCacheDep,
+    response: Response,
 ) -> CalendarDetailOut | CalendarOut:
     """
     매개변수
     - host_username: 호스트 사용자의 username
     - user: 캘린더 정보를 요청하는 사용자
     - session: 데이터베이스 세션
+
+    호스트 본인에게는 자세한 정보(CalendarDetailOut)를 주므로 응답이 인증 정보에 따라 다름
+    - Vary: Cookie, Authorization → 캐시가 다른 사용자의 응답을 돌려주지 않음
+    - Last-Modified(304)는 누구에게나 같은 CalendarOut에만 붙이고, 본인 응답은 Cache-Control: private
     """
-    stmt = select(User).where(User.username == host_username)
-    result = await session.execute(stmt)
-    host = result.scalar_one_or_none()
+    host = await get_user_by_username(session, host_username, user_id_cache)
     if host is None:
         raise HostNotFoundError()
 
@@ -47,21 +97,95 @@ async def host_calendar_detail(
     if calendar is None:
         raise CalendarNotFoundError()
 
-
+    response.headers["Vary"] = "Cookie, Authorization"
     if user is not None and user.id == host.id:
+        response.headers["Cache-Control"] = "private"
         return CalendarDetailOut.model_validate(calendar)
 
+    set_last_modified(response, calendar.updated_at)
     return CalendarOut.model_validate(calendar)
 
 
+@router.post("/calendars:batchGet", status_code=status.HTTP_200_OK)
+async def batch_get_host_calendars(
+    payload: UsernamesBatchIn,
+    user: CurrentUserOptionalDep,
+    user_loader: UserLoaderDep,
+) -> dict[str, CalendarDetailOut | CalendarOut | None]:
+    """
+    호스트 여러 명의 캘린더를 한 번에 (호스트와 캘린더를 함께 읽는 IN (...) 조회 한 번)
+    요청한 username을 그대로 키로 쓰고, 캘린더가 없으면 null
+    자기 캘린더는 host_calendar_detail처럼 자세한 정보로
+    """
+    if user is not None:
+        # 인증 의존성에서 이미 읽은 사용자는 다시 조회하지 않음
+        user_loader.prime(user.username, user)
+    hosts = await user_loader.load_many(payload.usernames)
+    calendars = {}
+    for username, host in zip(payload.usernames, hosts):
+        calendar = host.calendar if host is not None and host.is_host else None
+        if calendar is None:
+            calendars[username] = None
+        elif user is not None and user.id == host.id:
+            calendars[username] = CalendarDetailOut.model_validate(calendar)
+        else:
+            calendars[username] = CalendarOut.model_validate(calendar)
+    return calendars
+
+
+@router.get(
+    "/calendars/search",
+    status_code=status.HTTP_200_OK,
+    response_model=list[CalendarSearchResultOut] | list[PartialCalendarSearchResultOut],
+)
+async def search_host_calendars(
+    session: DbSessionDep,
+    fields: CalendarSearchFieldsDep,
+    topic: Annotated[str | None, Query(max_length=100)] = None,
+    q: Annotated[str | None, Query(max_length=200)] = None,
+    page: Annotated[int, Query(ge=1)] = 1,
+    page_size: Annotated[int, Query(ge=1, le=50)] = 20,
+) -> list[CalendarSearchResultOut] | list[PartialCalendarSearchResultOut]:
+    """
+    주제로 호스트 캘린더 찾기
+    - topic: 이 주제가 있는 캘린더만 (대소문자 무시)
+    - q: 검색어 (단어마다 주제의 앞부분과 비교)
+    - fields: 응답에 넣을 필드 (예: host_username,timezone) → 고른 열만 읽음 (PartialCalendarSearchResultOut)
+    """
+    if not (topic and topic.strip()) and not (q and q.strip()):
+        raise SearchQueryRequiredError()
+
+    offset = (page - 1) * page_size
+    if fields is not None:
+        rows = await search_calendar_fields(
+            session, topic, q, offset=offset, limit=page_size, fields=[path[0] for path in fields.paths()],
+        )
+        return JSONResponse([fields.dump_row(row) for row in rows])
+
+    rows = await search_calendars(session, topic, q, offset=offset, limit=page_size)
+    return [
+        CalendarSearchResultOut(
+            topics=calendar.topics,
+            description=calendar.description,
+            timezone=calendar.timezone,
+            host_username=username,
+            host_display_name=display_name,
+            score=score,
+        )
+        for calendar, username, display_name, score in rows
+    ]
+
+
 @router.post(
     "/calendar",
     status_code=status.HTTP_201_CREATED,
     response_model=CalendarDetailOut
 )
+@transactional
 async def create_calendar(
     user: CurrentUserDep,
     session: DbSessionDep,
+    session_store: SessionStoreDep,
     payload: CalendarCreateIn
 ) -> CalendarDetailOut:
     if user.is_host is False:
@@ -72,13 +196,20 @@ async def create_calendar(
         topics=payload.topics,
         description=payload.description,
         google_calendar_id=payload.google_calendar_id,
+        timezone=payload.timezone,
     )    
 
     session.add(calendar)
     try:
-        await session.commit()
+        await session.flush()
     except IntegrityError as e:
         raise CalendarAlreadyExistsError()
+    await sync_calendar_topics(session, calendar.id, calendar.topics)
+
+    if session_store is not None:
+        # 세션에 저장한 사용자 스냅샷에도 새 캘린더를 반영
+        user.calendar = calendar
+        await session_store.update_user(user, session)
 
     return calendar
 
@@ -88,9 +219,11 @@ async def create_calendar(
     status_code=status.HTTP_200_OK,
     response_model=CalendarDetailOut,
 )
+@transactional
 async def update_calendar(
     user: CurrentUserDep,
     session: DbSessionDep,
+    session_store: SessionStoreDep,
     payload: CalendarUpdateIn,
 ) -> CalendarDetailOut:
 
@@ -105,14 +238,21 @@ async def update_calendar(
     # topics 값이 있으면 변경하고
     if payload.topics is not None:
         user.calendar.topics = payload.topics
+        await sync_calendar_topics(session, user.calendar.id, payload.topics)
     # description 값이 있으면 변경하고
     if payload.description is not None:
         user.calendar.description = payload.description
     # 구글 캘린더 ID 값이 있으면 변경하고
     if payload.google_calendar_id is not None:
         user.calendar.google_calendar_id = payload.google_calendar_id
+    # 시간대 값이 있으면 변경한다.
+    if payload.timezone is not None:
+        user.calendar.timezone = payload.timezone
 
-    await session.commit()
+    # updated_at은 파이썬에서 정하는 값(onupdate)이므로 UPDATE 뒤에 다시 읽지 않음
+    await session.flush()
+    if session_store is not None:
+        await session_store.update_user(user, session)
 
     return user.calendar
 
@@ -122,37 +262,23 @@ async def update_calendar(
     status_code=status.HTTP_201_CREATED,
     response_model=TimeSlotOut,
 )
+@transactional
 async def create_time_slot(
     user: CurrentUserDep,
     session: DbSessionDep,
+    schedule_cache: ScheduleCacheDep,
+    event_hub: EventHubDep,
+    background_tasks: BackgroundTasks,
     payload: TimeSlotCreateIn
 ) -> TimeSlotOut:
     if not user.is_host:
         raise GuestPermissionError()
 
     # 이미 존재하는 타임슬롯과 겹치는지 확인
-    # and_ 연산자 사용 방법
-    stmt = select(TimeSlot).where(
-        and_(
-            TimeSlot.calendar_id == user.calendar.id,
-            TimeSlot.start_time < payload.end_time,
-            TimeSlot.end_time > payload.start_time,
-        )
-    )
-
-    # # & 연산자 사용 방법
-    # stmt = select(TimeSlot).where(
-    #     (TimeSlot.calendar_id == user.calendar.id) &
-    #     (TimeSlot.start_time < payload.end_time) &
-    #     (TimeSlot.end_time > payload.start_time)
-    # )
-
-    result = await session.execute(stmt)
-    existing_time_slots = result.scalars().all()
-
-    for existing_time_slot in existing_time_slots:
-        if any(day in existing_time_slot.weekdays for day in payload.weekdays):
-            raise TimeSlotOverLapError()
+    # 다른 워커에서 만든 시간대도 반영하도록 일정표를 DB에서 새로 읽어서 확인
+    schedule = await schedule_cache.load(session, user.calendar.id)
+    if schedule.overlaps(payload.start_time, payload.end_time, payload.weekdays):
+        raise TimeSlotOverLapError()
 
     time_slot = TimeSlot(
         calendar_id=user.calendar.id,
@@ -161,7 +287,13 @@ async def create_time_slot(
         weekdays=payload.weekdays,
     )
     session.add(time_slot)
-    await session.commit()
+    await session.flush()
+    # 시간대가 바뀌었으므로 다음 조회 때 일정표를 다시 만듦
+    schedule_cache.invalidate(user.calendar.id)
+    # 백그라운드 작업은 커밋하고 응답한 뒤에 실행됨
+    background_tasks.add_task(
+        event_hub.publish, calendar_topic(user.calendar.id), time_slot_created_message(time_slot),
+    )
     return time_slot
 
 
@@ -170,72 +302,154 @@ async def create_time_slot(
     status_code=status.HTTP_201_CREATED,
     response_model=BookingOut,
 )
+@transactional
 async def create_booking(
     host_username: str,
     user: CurrentUserDep,
     session: DbSessionDep,
+    schedule_cache: ScheduleCacheDep,
+    user_id_cache: UserIdCacheDep,
+    event_hub: EventHubDep,
+    archive_cutoff: ArchiveCutoffDep,
+    background_tasks: BackgroundTasks,
     payload: BookingCreateIn
 ) -> BookingOut:
-    stmt = (
-        select(User)
-        .where(User.username == host_username)
-        .where(User.is_host.is_(True)) # is_는 동등성 비교, 간단히 말해 등호 비교를 하는 데 사용합니다.
-    )
-    result = await session.execute(stmt)
-    host = result.scalar_one_or_none()
+    host = await get_host(session, host_username, user_id_cache)
 
-    if host is None or host.calendar is None:
-        raise HostNotFoundError()
+    # 시간대와 요일은 일정표로 확인 (시간대 조회 없이)
+    schedule = await schedule_cache.get(session, host.calendar.id, payload.time_slot_id)
+    if not schedule.allows(payload.time_slot_id, payload.when):
+        raise TimeSlotNotFoundError()
 
-    stmt = (
-        select(TimeSlot)
-        .where(TimeSlot.id == payload.time_slot_id)
-        .where(TimeSlot.calendar_id == host.calendar.id)
+    recurrence_until = None
+    if payload.recurrence is not None:
+        # 반복 날짜의 요일은 7번 안에 되풀이되므로 처음 7번만 확인 (recurrence 모듈 설명 참고)
+        rule = parse_recurrence(payload.recurrence)
+        days = rule.first_dates(payload.when)
+        if not days or days[0] != payload.when:
+            raise RecurrenceMismatchError()
+        if not all(schedule.allows(payload.time_slot_id, day) for day in days):
+            raise RecurrenceConflictError()
+        recurrence_until = rule.last_date(payload.when)
+
+    # 같은 시간대에 날짜가 겹치는 예약(반복 예약 포함)이 있으면 거절
+    conflict = await find_booking_conflict(
+        session, payload.time_slot_id, payload.when, payload.recurrence, recurrence_until, archive_cutoff,
     )
-    result = await session.execute(stmt)
-    time_slot = result.scalar_one_or_none()
-
-    if time_slot is None:
-        raise TimeSlotNotFoundError()
-    if payload.when.weekday() not in time_slot.weekdays:
-        raise TimeSlotNotFoundError()
+    if conflict is not None:
+        raise BookingConflictError(conflict)
 
+    # 응답에 담을 시간대 (식별자 맵에 있으면 조회하지 않음)
+    time_slot = await session.get(TimeSlot, payload.time_slot_id)
     booking = Booking(
         guest_id=user.id,
         when=payload.when,
         topic=payload.topic,
         description=payload.description,
-        time_slot_id=payload.time_slot_id,
+        recurrence=payload.recurrence,
+        recurrence_until=recurrence_until,
+        time_slot=time_slot,
     )
     session.add(booking)
-    await session.commit()
-    await session.refresh(booking)
-    
+    # 반복 예약은 날짜별 예약 수에 넣지 않고 조회할 때 펼쳐서 셈 (get_month_booking_counts)
+    if booking.recurrence is None:
+        await add_booking_day_count(session, host.calendar.id, booking.when)
+    # INSERT ... RETURNING으로 id, created_at, updated_at을 받아옴 (refresh 조회 없음)
+    await session.flush()
+    # 백그라운드 작업은 커밋하고 응답한 뒤에 실행됨 → 롤백된 예약은 알리지 않음
+    background_tasks.add_task(
+        event_hub.publish, calendar_topic(host.calendar.id), booking_created_message(booking),
+    )
     return booking
 
 
+@router.get(
+    "/bookings/search",
+    status_code=status.HTTP_200_OK,
+    response_model=BookingSearchOut | PartialBookingSearchOut,
+)
+async def search_host_bookings(
+    user: CurrentUserDep,
+    session: DbSessionDep,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    fields: BookingSearchFieldsDep,
+    limit: Annotated[int, Query(ge=1, le=50)] = 20,
+    cursor: str | None = None,
+) -> BookingSearchOut | PartialBookingSearchOut:
+    """
+    호스트 캘린더의 예약을 주제와 설명으로 검색 (날짜 최신순)
+    - cursor: 앞 쪽 응답의 next_cursor
+    - fields: 항목에 넣을 필드 (예: when,topic,snippet) → 고른 열만 읽음 (PartialBookingSearchOut)
+    """
+    if not user.is_host or user.calendar is None:
+        raise HostNotFoundError()
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise InvalidCursorError()
+
+    if fields is not None:
+        rows, next_cursor = await search_booking_fields(
+            session, user.calendar.id, q, limit, after, list(fields.paths()),
+        )
+        return JSONResponse(PartialBookingSearchOut(
+            items=[fields.dump_row(row) for row in rows],
+            next_cursor=encode_cursor(*next_cursor) if next_cursor else None,
+        ).model_dump(mode="json", exclude_unset=True))
+
+    hits, next_cursor = await search_bookings(session, user.calendar.id, q, limit, after)
+    return BookingSearchOut(
+        items=[
+            BookingSearchHitOut.model_validate(booking, update={"snippet": snippet})
+            for booking, snippet in hits
+        ],
+        next_cursor=encode_cursor(*next_cursor) if next_cursor else None,
+    )
+
+
 @router.get(
     "/bookings",
     status_code=status.HTTP_200_OK,
-    response_model=list[BookingOut],
+    response_model=list[BookingOut] | list[PartialBookingOut],
 )
 async def get_host_bookings_by_month(
     user: CurrentUserDep,
     session: DbSessionDep,
     page: Annotated[int, Query(ge=1)],
-    page_size: Annotated[int, Query(ge=1, le=50)]
-) -> list[BookingOut]:
+    page_size: Annotated[int, Query(ge=1, le=50)],
+    fields: BookingFieldsDep,
+) -> list[BookingOut] | list[PartialBookingOut]:
+    """
+    호스트의 예약 목록 (최근 예약부터)
+    - fields: 응답에 넣을 필드 (예: when,topic,time_slot.start_time) → 고른 열만 읽음 (PartialBookingOut)
+    """
     if not user.is_host or user.calendar is None:
         raise HostNotFoundError()
-    stmt = (
-        select(Booking)
-        .where(Booking.time_slot.has(TimeSlot.calendar_id == user.calendar.id))
-        .order_by(Booking.when.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
-    result = await session.execute(stmt)
-    return result.scalars().all()
+
+    async def read_page(model: type[Booking | BookingArchive], offset: int, limit: int) -> list:
+        params = {"calendar_id": user.calendar.id, "offset": offset, "limit": limit}
+        if fields is None:
+            result = await session.execute(BOOKINGS_PAGE[model], params)
+            return list(result.scalars().all())
+        result = await session.execute(bookings_page_projection(model, tuple(fields.paths())), params)
+        return [fields.dump_row(row) for row in result.mappings()]
+
+    # 최근 예약(bookings)부터 채우고, 모자랄 때만 보관된 예약(bookings_archive)을 읽음
+    offset = (page - 1) * page_size
+    bookings = await read_page(Booking, offset, page_size)
+    if len(bookings) < page_size:
+        if bookings:
+            recent_count = offset + len(bookings)
+        else:
+            result = await session.execute(RECENT_BOOKINGS_COUNT, {"calendar_id": user.calendar.id})
+            recent_count = result.scalar_one()
+        bookings += await read_page(BookingArchive, max(offset - recent_count, 0), page_size - len(bookings))
+
+    if fields is not None:
+        # 행마다 PartialBookingOut으로 검증했으므로 (dump_row) 그대로 보냄
+        return JSONResponse(bookings)
+    return bookings
 
 
 @router.get(
@@ -246,21 +460,228 @@ async def get_host_bookings_by_month(
 async def host_calendar_bookings(
     host_username: str,
     session: DbSessionDep,
+    archive_cutoff: ArchiveCutoffDep,
+    user_id_cache: UserIdCacheDep,
     year: Annotated[int, Query(ge=2024, le=2025)],
     month: Annotated[int, Query(ge=1, le=12)],
+    response: Response,
 ) -> list[SimpleBookingOut]:
-    stmt = select(User).where(User.username == host_username)
-    result = await session.execute(stmt)
-    host = result.scalar_one_or_none()
-    if host is None or host.calendar is None:
-        raise HostNotFoundError()
+    host = await get_host(session, host_username, user_id_cache)
+
+    # extract(year/month) 대신 날짜 범위로 비교해야 인덱스와 파티션 제외(pruning)가 동작함
+    start, end = get_month_bounds(year, month)
+    bookings = []
+    params = {"calendar_id": host.calendar.id, "start": start, "end": end}
+    for model in get_booking_sources(start, archive_cutoff):
+        result = await session.execute(BOOKINGS_IN_RANGE[model], params)
+        bookings.extend(result.scalars().all())
+
+    # 예약은 지우지 않으므로 (보관 테이블로 옮길 때도 그대로 복사) 가장 최근 updated_at으로 충분
+    set_last_modified(
+        response,
+        *(booking.updated_at for booking in bookings),
+        *(booking.time_slot.updated_at for booking in bookings),
+    )
+    # 반복 예약은 그 달의 반복 날짜마다 한 건씩
+    occurrences = [
+        SimpleBookingOut(when=day, time_slot=booking.time_slot)
+        for booking in bookings
+        for day in iter_booking_dates(booking.when, booking.recurrence, start, end)
+    ]
+    return sorted(occurrences, key=lambda occurrence: occurrence.when, reverse=True)
+
 
-    stmt = (
-        select(Booking)
-        .where(Booking.time_slot.has(TimeSlot.calendar_id == host.calendar.id))
-        .where(extract('year', Booking.when) == year)
-        .where(extract('month', Booking.when) == month)
-        .order_by(Booking.when.desc())
+@router.get(
+    "/calendar/{host_username}/booking-counts",
+    status_code=status.HTTP_200_OK,
+    response_model=MonthBookingCountsOut,
+)
+async def host_calendar_booking_counts(
+    host_username: str,
+    session: DbSessionDep,
+    archive_cutoff: ArchiveCutoffDep,
+    user_id_cache: UserIdCacheDep,
+    year: Annotated[int, Query(ge=2024, le=2025)],
+    month: Annotated[int, Query(ge=1, le=12)],
+) -> MonthBookingCountsOut:
+    """
+    달력 칸마다 예약 수
+    예약을 모두 읽지 않고 booking_day_counts에서 그 달의 날짜만 읽음 (반복 예약은 펼쳐서 더함)
+    """
+    host = await get_host(session, host_username, user_id_cache)
+
+    sources = get_booking_sources(get_month_bounds(year, month)[0], archive_cutoff)
+    counts = await get_month_booking_counts(session, host.calendar.id, year, month, sources)
+    return MonthBookingCountsOut(
+        year=year,
+        month=month,
+        days=[BookingDayCountOut(day=day, count=count) for day, count in counts],
     )
-    result = await session.execute(stmt)
-    return result.scalars().all()
\ No newline at end of file
+
+
+async def get_booked_slots(
+    session: AsyncSession,
+    calendar_id: int,
+    start: date,
+    end: date,
+    archive_cutoff: date,
+) -> set[tuple[int, date]]:
+    """[start, end)에 예약된 (시간대 ID, 날짜) (반복 예약은 기간 안의 날짜만 펼침)"""
+    params = {"calendar_id": calendar_id, "start": start, "end": end}
+    booked = set()
+    for model in get_booking_sources(start, archive_cutoff):
+        result = await session.execute(BOOKING_DATES_IN_RANGE[model], params)
+        for row in result:
+            booked.update((row.time_slot_id, day) for day in iter_booking_dates(row.when, row.recurrence, start, end))
+    return booked
+
+
+async def find_booking_conflict(
+    session: AsyncSession,
+    time_slot_id: int,
+    when: date,
+    recurrence: str | None,
+    recurrence_until: date | None,
+    archive_cutoff: date,
+) -> date | None:
+    """
+    새 예약(반복 예약이면 [when, recurrence_until] 기간)과 같은 시간대, 같은 날짜인 예약의 첫 날짜
+    get_booked_slots와 같은 기간 조건으로 그 시간대의 예약 행만 읽고, 반복 규칙끼리는 find_common_date로 비교
+    """
+    if recurrence is None:
+        end = when + timedelta(days=1)
+    else:
+        # 끝없이 반복하면 when 이후의 예약을 모두 봄
+        end = recurrence_until + timedelta(days=1) if recurrence_until is not None else date.max
+    params = {"time_slot_id": time_slot_id, "start": when, "end": end}
+    conflicts = []
+    for model in get_booking_sources(when, archive_cutoff):
+        result = await session.execute(SLOT_BOOKING_DATES_IN_RANGE[model], params)
+        for row in result:
+            day = find_common_date(when, recurrence, row.when, row.recurrence)
+            if day is not None:
+                conflicts.append(day)
+    return min(conflicts, default=None)
+
+
+@router.get(
+    "/calendar/{host_username}/availability",
+    status_code=status.HTTP_200_OK,
+    response_model=list[AvailableTimeSlotOut],
+)
+async def host_calendar_availability(
+    host_username: str,
+    session: DbSessionDep,
+    schedule_cache: ScheduleCacheDep,
+    archive_cutoff: ArchiveCutoffDep,
+    user_id_cache: UserIdCacheDep,
+    when: date,
+) -> list[AvailableTimeSlotOut]:
+    """when 날짜(캘린더 시간대)에 예약할 수 있는 시간대 (시작 시각 순, 그날 예약된 시간대는 뺌)"""
+    host = await get_host(session, host_username, user_id_cache)
+
+    schedule = await schedule_cache.get(session, host.calendar.id)
+    end = when + timedelta(days=1)
+    booked = await get_booked_slots(session, host.calendar.id, when, end, archive_cutoff)
+    zone = get_zone_table(host.calendar.timezone)
+    return [
+        AvailableTimeSlotOut(
+            id=slot.id,
+            start_time=slot.start_time,
+            end_time=slot.end_time,
+            start_at=start_at,
+            end_at=end_at,
+        )
+        for slot, day, start_at, end_at in schedule.iter_open_instants(when, end, zone)
+        if (slot.id, day) not in booked
+    ]
+
+
+@router.get(
+    "/calendar/{host_username}/availability/range",
+    status_code=status.HTTP_200_OK,
+    response_model=list[AvailableSlotOut],
+)
+async def host_calendar_availability_range(
+    host_username: str,
+    session: DbSessionDep,
+    schedule_cache: ScheduleCacheDep,
+    archive_cutoff: ArchiveCutoffDep,
+    user_id_cache: UserIdCacheDep,
+    start: date,
+    end: date,
+) -> list[AvailableSlotOut]:
+    """
+    [start, end) 날짜(캘린더 시간대)에 예약할 수 있는 시각을 UTC로 (시각 순)
+    시간대 변환은 캘린더 시간대의 변환표로 하므로 기간이 길어도 날짜마다 zoneinfo를 부르지 않음
+    """
+    if not 0 < (end - start).days <= MAX_AVAILABILITY_DAYS:
+        raise AvailabilityRangeError(MAX_AVAILABILITY_DAYS)
+    host = await get_host(session, host_username, user_id_cache)
+
+    schedule = await schedule_cache.get(session, host.calendar.id)
+    booked = await get_booked_slots(session, host.calendar.id, start, end, archive_cutoff)
+    zone = get_zone_table(host.calendar.timezone)
+    return [
+        AvailableSlotOut(time_slot_id=slot.id, when=day, start_at=start_at, end_at=end_at)
+        for slot, day, start_at, end_at in schedule.iter_open_instants(start, end, zone)
+        if (slot.id, day) not in booked
+    ]
+
+
+def subscribe_calendar(event_hub: PubSubHub, calendar_id: int) -> Subscription:
+    try:
+        return event_hub.subscribe(calendar_topic(calendar_id))
+    except SubscriberLimitError:
+        raise EventSubscriberLimitError(retry_after=SUBSCRIBER_LIMIT_RETRY_AFTER)
+
+
+@router.get(
+    "/calendar/{host_username}/events",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def host_calendar_events(
+    host_username: str,
+    request: Request,
+    session: DbSessionDep,
+    event_hub: EventHubDep,
+    user_id_cache: UserIdCacheDep,
+) -> StreamingResponse:
+    """캘린더의 예약/시간대 변경 이벤트 (Server-Sent Events, appserver.apps.calendar.events 참고)"""
+    host = await get_host(session, host_username, user_id_cache)
+    # 스트림이 열려 있는 동안 DB 연결을 붙잡지 않도록 바로 풀에 돌려줌
+    await session.commit()
+
+    subscription = subscribe_calendar(event_hub, host.calendar.id)
+    heartbeat = request.app.state.settings.event_heartbeat_seconds
+    return StreamingResponse(
+        stream_sse(subscription, heartbeat),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # 스트림을 시작하기 전에 연결이 끊겨도 구독을 정리
+        background=BackgroundTask(subscription.close),
+    )
+
+
+@router.websocket("/calendar/{host_username}/events/ws")
+async def host_calendar_events_websocket(
+    websocket: WebSocket,
+    host_username: str,
+    session: DbSessionDep,
+    event_hub: EventHubDep,
+    user_id_cache: UserIdCacheDep,
+) -> None:
+    """host_calendar_events의 WebSocket 버전 (이벤트마다 {"type", "data"} JSON 텍스트 메시지)"""
+    try:
+        host = await get_host(session, host_username, user_id_cache)
+    except HostNotFoundError as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
+    await session.commit()
+
+    try:
+        subscription = event_hub.subscribe(calendar_topic(host.calendar.id))
+    except SubscriberLimitError:
+        raise WebSocketException(code=status.WS_1013_TRY_AGAIN_LATER)
+    await websocket.accept()
+    await stream_websocket(websocket, subscription, websocket.app.state.settings.event_heartbeat_seconds)
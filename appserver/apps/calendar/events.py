@@ -0,0 +1,109 @@
+"""
+캘린더 실시간 이벤트 (SSE / WebSocket)
+
+- 예약이나 시간대가 생기면 캘린더 주제(calendar:{id})로 이벤트를 발행하고,
+  /calendar/{host_username}/events 구독자에게 밀어 줌 → 클라이언트가 예약 내역을 주기적으로 다시 읽지 않음
+- 이벤트에는 공개 예약 내역(SimpleBookingOut)에 나오는 정보만 담음
+- 발행은 커밋한 뒤(응답 뒤 백그라운드 작업)에 하므로 롤백된 예약은 알리지 않음
+- 느린 구독자는 overflow 이벤트를 받고 연결이 끊기며, 다시 연결해서 예약 내역을 새로 읽어야 함
+- 구독자는 워커마다 따로 관리하고, 다른 워커의 구독자에게는 Broker가 전달함 (Settings.event_broker)
+  local이면 이벤트를 발행한 워커의 구독자만 받음
+"""
+from datetime import timedelta
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import WebSocket, WebSocketDisconnect, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.libs.pubsub.broker import Broker, LocalBroker
+from appserver.libs.pubsub.database import DatabaseBroker
+from appserver.libs.pubsub.hub import OVERFLOW, PubSubHub, Subscription
+from appserver.settings import Settings
+from .models import Booking, TimeSlot
+
+# SSE 연결이 끊겼을 때 브라우저(EventSource)가 다시 연결하기까지 기다리는 시간 (밀리초)
+SSE_RETRY_MILLISECONDS = 3000
+PING_MESSAGE = '{"type":"ping"}'
+
+
+def calendar_topic(calendar_id: int) -> str:
+    """
+    >>> calendar_topic(3)
+    'calendar:3'
+    """
+    return f"calendar:{calendar_id}"
+
+
+def booking_created_message(booking: Booking) -> dict[str, Any]:
+    return {
+        "type": "booking.created",
+        "data": {
+            "when": booking.when.isoformat(),
+            "time_slot_id": booking.time_slot_id,
+            "recurrence": booking.recurrence,
+        },
+    }
+
+
+def time_slot_created_message(time_slot: TimeSlot) -> dict[str, Any]:
+    return {
+        "type": "time_slot.created",
+        "data": {
+            "id": time_slot.id,
+            "start_time": time_slot.start_time.isoformat(),
+            "end_time": time_slot.end_time.isoformat(),
+            "weekdays": time_slot.weekdays,
+        },
+    }
+
+
+def create_event_hub(
+    settings: Settings,
+    session_factory: Callable[[], AsyncSession] | None = None,
+) -> PubSubHub:
+    broker: Broker = LocalBroker()
+    if settings.event_broker == "database":
+        broker = DatabaseBroker(
+            session_factory,
+            poll_interval=settings.event_poll_seconds,
+            retention=timedelta(seconds=settings.event_retention_seconds),
+        )
+    return PubSubHub(
+        broker,
+        max_queue_size=settings.event_queue_size,
+        max_subscribers=settings.event_max_subscribers,
+    )
+
+
+async def stream_sse(subscription: Subscription, heartbeat: float) -> AsyncIterator[bytes]:
+    """
+    구독한 이벤트를 SSE 형식으로 (heartbeat초 동안 이벤트가 없으면 주석 줄을 보내 연결을 유지)
+    연결이 끊기거나 overflow가 되면 구독을 끝냄
+    """
+    with subscription:
+        yield f"retry: {SSE_RETRY_MILLISECONDS}\n\n".encode()
+        while True:
+            event = await subscription.get(heartbeat)
+            if event is None:
+                yield b": ping\n\n"
+                continue
+            yield event.sse
+            if event.type == OVERFLOW:
+                return
+
+
+async def stream_websocket(websocket: WebSocket, subscription: Subscription, heartbeat: float) -> None:
+    """구독한 이벤트를 JSON 텍스트 메시지로 (연결을 확인하려고 heartbeat초마다 ping을 보냄)"""
+    with subscription:
+        try:
+            while True:
+                event = await subscription.get(heartbeat)
+                if event is None:
+                    await websocket.send_text(PING_MESSAGE)
+                    continue
+                await websocket.send_text(event.json)
+                if event.type == OVERFLOW:
+                    await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+                    return
+        except WebSocketDisconnect:
+            return
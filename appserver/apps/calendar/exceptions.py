@@ -1,3 +1,5 @@
+from datetime import date
+
 from fastapi import HTTPException, status
 
 
@@ -24,6 +26,30 @@ class CalendarAlreadyExistsError(HTTPException):
         )
 
 
+class SearchQueryRequiredError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="topic이나 q 중 하나는 있어야 합니다.",
+        )
+
+
+class InvalidCursorError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="잘못된 커서입니다.",
+        )
+
+
+class InvalidFieldsError(HTTPException):
+    def __init__(self, reason: str):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"잘못된 fields입니다. {reason}",
+        )
+
+
 class GuestPermissionError(HTTPException):
     def __init__(self):
         super().__init__(
@@ -45,4 +71,44 @@ class TimeSlotNotFoundError(HTTPException):
         super().__init__(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="시간대가 없습니다.",
-        )
\ No newline at end of file
+        )
+
+class BookingConflictError(HTTPException):
+    def __init__(self, day: date):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"{day.isoformat()}에 이미 예약된 시간대입니다.",
+        )
+
+
+class RecurrenceMismatchError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="예약 날짜가 반복 규칙의 첫 날짜가 아닙니다.",
+        )
+
+
+class RecurrenceConflictError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="반복 날짜 중 시간대의 요일과 맞지 않는 날짜가 있습니다.",
+        )
+
+
+class AvailabilityRangeError(HTTPException):
+    def __init__(self, max_days: int):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"조회 기간은 1일부터 {max_days}일까지입니다.",
+        )
+
+
+class EventSubscriberLimitError(HTTPException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="실시간 이벤트 구독자가 너무 많습니다. 잠시 후 다시 연결하세요.",
+            headers={"Retry-After": str(retry_after)},
+        )
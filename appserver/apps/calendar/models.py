@@ -2,12 +2,17 @@ from datetime import timezone, datetime, date, time
 from typing import TYPE_CHECKING
 from pydantic import AwareDatetime
 from sqlalchemy_utc import UtcDateTime
+from sqlalchemy import DDL, Index, event
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import SQLModel, Field, Relationship, Text, JSON, func, String, Column
 if TYPE_CHECKING:
     from appserver.apps.account.models import User
 
 
+# 시간대를 정하지 않은 캘린더(기존 캘린더 포함)의 시간대
+DEFAULT_TIMEZONE = "Asia/Seoul"
+
+
 class Calendar(SQLModel, table=True):
     __tablename__ = "calendars"
 
@@ -18,6 +23,13 @@ class Calendar(SQLModel, table=True):
     topics: list[str] = Field(sa_type=JSON().with_variant(JSONB(astext_type=Text()), "postgresql"), description="게스트와 나눌 주제들")
     description: str = Field(sa_type=Text, description="게스트에게 보여 줄 설명")
     google_calendar_id: str = Field(max_length=1024, description="Google Calendar ID")
+    # 시간대(TimeSlot)의 시각과 예약 날짜는 이 시간대의 현지 시각 (appserver.libs.datetime.zones 참고)
+    timezone: str = Field(
+        default=DEFAULT_TIMEZONE,
+        max_length=64,
+        sa_column_kwargs={"server_default": DEFAULT_TIMEZONE},
+        description="IANA 시간대 이름",
+    )
     created_at: AwareDatetime = Field(
         default=None,
         nullable=False,
@@ -44,6 +56,19 @@ class Calendar(SQLModel, table=True):
     time_slots: list["TimeSlot"] = Relationship(back_populates="calendar")
 
 
+class CalendarTopic(SQLModel, table=True):
+    """
+    주제 → 캘린더 역색인
+    calendars.topics(JSON)는 주제로 찾을 수 없으므로, 정규화한 주제를 행으로 풀어 둠
+    기본 키가 (topic, calendar_id)이므로 주제 일치/접두어 검색이 기본 키 인덱스 범위 조회로 끝남
+    캘린더를 만들거나 주제를 고칠 때 함께 갱신 (appserver.apps.calendar.topics 참고)
+    """
+    __tablename__ = "calendar_topics"
+
+    topic: str = Field(primary_key=True, description="정규화한 주제 (소문자, 공백 하나)")
+    calendar_id: int = Field(foreign_key="calendars.id", primary_key=True, index=True)
+
+
 class TimeSlot(SQLModel, table=True):
     __tablename__ = "time_slots"
 
@@ -72,7 +97,7 @@ class TimeSlot(SQLModel, table=True):
         }
     )   
 
-    calendar_id: int = Field(foreign_key="calendars.id")
+    calendar_id: int = Field(foreign_key="calendars.id", index=True)
     calendar: Calendar = Relationship(back_populates="time_slots")
 
     bookings: list["Booking"] = Relationship(back_populates="time_slot")
@@ -80,11 +105,21 @@ class TimeSlot(SQLModel, table=True):
 
 class Booking(SQLModel, table=True):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # 호스트의 예약 목록은 시간대(→ 캘린더)와 날짜로 찾음
+        Index("ix_bookings_time_slot_id_when", "time_slot_id", "when"),
+        # SQLite는 AUTOINCREMENT가 없으면 가장 큰 id를 다시 씀
+        # → 보관 테이블로 옮긴 예약의 id를 새 예약이 받지 않도록 함
+        {"sqlite_autoincrement": True},
+    )
 
     id: int = Field(default=None, primary_key=True)
     when: date
     topic: str
     description: str = Field(sa_type=Text, description="예약 설명")
+    # 반복 예약: when이 첫 번째 날짜 (appserver.apps.calendar.recurrence 참고)
+    recurrence: str | None = Field(default=None, max_length=200, description="반복 규칙 (RRULE 일부)")
+    recurrence_until: date | None = Field(default=None, description="마지막 반복 날짜 (없으면 끝없이 반복)")
     created_at: AwareDatetime = Field(
         default=None,
         nullable=False,
@@ -106,7 +141,93 @@ class Booking(SQLModel, table=True):
     time_slot_id: int = Field(foreign_key="time_slots.id")
     time_slot: TimeSlot = Relationship(back_populates="bookings")
 
-    guest_id: int = Field(foreign_key="users.id")
+    guest_id: int = Field(foreign_key="users.id", index=True)
     guest: "User" = Relationship(back_populates="bookings")
 
 
+# 예약 주제/설명 전문 검색 색인 (appserver.apps.calendar.search 참고)
+# - SQLite: bookings를 내용으로 쓰는 FTS5 외부 콘텐츠 테이블, 트리거로 bookings와 함께 바뀜
+# - PostgreSQL: to_tsvector 식 GIN 인덱스 (컬럼을 추가하지 않으므로 테이블을 다시 쓰지 않음)
+# 모델에 컬럼으로 둘 수 없어서 bookings 테이블을 만들 때 함께 만듦 (마이그레이션도 같은 DDL 사용)
+BOOKING_SEARCH_TABLE = "bookings_fts"
+BOOKING_SEARCH_DOCUMENT = "topic || ' ' || description"
+BOOKING_SEARCH_SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS bookings_fts "
+    "USING fts5(topic, description, content='bookings', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS bookings_fts_ai AFTER INSERT ON bookings BEGIN "
+    "INSERT INTO bookings_fts(rowid, topic, description) VALUES (new.id, new.topic, new.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS bookings_fts_ad AFTER DELETE ON bookings BEGIN "
+    "INSERT INTO bookings_fts(bookings_fts, rowid, topic, description) "
+    "VALUES ('delete', old.id, old.topic, old.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS bookings_fts_au AFTER UPDATE OF topic, description ON bookings BEGIN "
+    "INSERT INTO bookings_fts(bookings_fts, rowid, topic, description) "
+    "VALUES ('delete', old.id, old.topic, old.description); "
+    "INSERT INTO bookings_fts(rowid, topic, description) VALUES (new.id, new.topic, new.description); "
+    "END",
+)
+BOOKING_SEARCH_POSTGRESQL_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_bookings_search ON bookings "
+    f"USING gin (to_tsvector('simple', {BOOKING_SEARCH_DOCUMENT}))",
+)
+
+for statement in BOOKING_SEARCH_SQLITE_DDL:
+    event.listen(Booking.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in BOOKING_SEARCH_POSTGRESQL_DDL:
+    event.listen(Booking.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+event.listen(
+    Booking.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {BOOKING_SEARCH_TABLE}").execute_if(dialect="sqlite"),
+)
+
+
+class BookingArchive(SQLModel, table=True):
+    """
+    오래된 예약을 옮겨 두는 테이블 (bookings와 같은 컬럼)
+
+    PostgreSQL에서는 when 기준 월 단위 범위 파티션 테이블로 만들어서,
+    날짜 범위 조건으로 조회하면 해당 달의 파티션만 읽습니다.
+    파티션 키가 기본 키에 포함되어야 하므로 기본 키는 (id, when)입니다.
+    """
+    __tablename__ = "bookings_archive"
+    __table_args__ = (
+        Index("ix_bookings_archive_time_slot_id_when", "time_slot_id", "when"),
+        {"postgresql_partition_by": 'RANGE ("when")'},
+    )
+
+    # bookings에서 옮겨 올 때 id를 그대로 유지
+    id: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    when: date = Field(primary_key=True)
+    topic: str
+    description: str = Field(sa_type=Text, description="예약 설명")
+    recurrence: str | None = Field(default=None, max_length=200, description="반복 규칙 (RRULE 일부)")
+    recurrence_until: date | None = Field(default=None, description="마지막 반복 날짜 (없으면 끝없이 반복)")
+    created_at: AwareDatetime = Field(nullable=False, sa_type=UtcDateTime)
+    updated_at: AwareDatetime = Field(nullable=False, sa_type=UtcDateTime)
+    archived_at: AwareDatetime = Field(
+        default=None,
+        nullable=False,
+        sa_type=UtcDateTime,
+        sa_column_kwargs={
+            "server_default": func.now(),
+        }
+    )
+
+    time_slot_id: int = Field(foreign_key="time_slots.id")
+    time_slot: TimeSlot = Relationship()
+
+    guest_id: int = Field(foreign_key="users.id", index=True)
+
+
+class BookingDayCount(SQLModel, table=True):
+    """
+    캘린더의 날짜별 예약 수
+    예약을 만들 때 함께 늘려서, 달력 화면에서 예약을 모두 읽지 않고 날짜 수만큼만 읽음
+    """
+    __tablename__ = "booking_day_counts"
+
+    calendar_id: int = Field(foreign_key="calendars.id", primary_key=True)
+    day: date = Field(primary_key=True)
+    count: int = Field(default=0)
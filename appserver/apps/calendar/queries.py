@@ -0,0 +1,130 @@
+"""
+자주 실행하는 캘린더/예약 조회문 (appserver.apps.account.queries 참고)
+
+예약 조회문은 bookings와 bookings_archive에 같은 모양으로 만들어 모델별로 둡니다.
+"""
+from functools import lru_cache
+
+from sqlalchemy import and_, bindparam, or_, Integer
+from sqlalchemy.orm import selectinload
+from sqlmodel import SQLModel, select, func
+
+from appserver.libs.http.fields import label
+from .models import Booking, BookingArchive, BookingDayCount, Calendar, TimeSlot
+
+TIME_SLOTS_BY_CALENDAR = select(TimeSlot).where(TimeSlot.calendar_id == bindparam("calendar_id"))
+
+# 여러 캘린더의 시간대를 IN (...) 조회 한 번으로: calendar_ids
+TIME_SLOTS_BY_CALENDARS = select(TimeSlot).where(TimeSlot.calendar_id.in_(bindparam("calendar_ids", expanding=True)))
+
+
+def _dates_in_range(model: type[SQLModel]):
+    # start, end 기간의 예약
+    # 반복 예약은 기간 안에 반복 날짜가 있을 수 있는 행을 함께 읽음 (날짜는 recurrence.iter_booking_dates로 펼침)
+    return and_(
+        model.when < bindparam("end"),
+        or_(
+            model.when >= bindparam("start"),
+            and_(
+                model.recurrence.is_not(None),
+                or_(model.recurrence_until.is_(None), model.recurrence_until >= bindparam("start")),
+            ),
+        ),
+    )
+
+
+def _in_range(model: type[SQLModel]):
+    # calendar_id, start, end 기간의 예약
+    return and_(
+        model.time_slot.has(TimeSlot.calendar_id == bindparam("calendar_id")),
+        _dates_in_range(model),
+    )
+
+
+def _bookings_in_range(model: type[SQLModel]):
+    # 기간 예약 내역: calendar_id, start, end
+    return select(model).options(selectinload(model.time_slot)).where(_in_range(model))
+
+
+def _booking_dates_in_range(model: type[SQLModel]):
+    # 기간 예약의 (시간대, 날짜, 반복 규칙)만: calendar_id, start, end
+    return select(model.time_slot_id, model.when, model.recurrence).where(_in_range(model))
+
+
+def _bookings_page(model: type[SQLModel]):
+    # 호스트의 예약 목록 한 쪽: calendar_id, offset, limit
+    return (
+        select(model)
+        .options(selectinload(model.time_slot))
+        .where(model.time_slot.has(TimeSlot.calendar_id == bindparam("calendar_id")))
+        .order_by(model.when.desc())
+        .offset(bindparam("offset", type_=Integer))
+        .limit(bindparam("limit", type_=Integer))
+    )
+
+
+@lru_cache(maxsize=128)
+def bookings_page_projection(model: type[SQLModel], paths: tuple[tuple[str, ...], ...]):
+    """
+    _bookings_page에서 고른 열만 (fields=로 고른 응답 필드, appserver.libs.http.fields 참고)
+
+    paths는 BookingOut의 필드 경로 (time_slot.*은 time_slots의 열), 열 이름은 경로를 "__"로 이은 것
+    같은 필드 조합은 조회문을 다시 만들지 않음
+    """
+    columns = [
+        getattr(TimeSlot if path[0] == "time_slot" else model, path[-1]).label(label(path))
+        for path in paths
+    ]
+    return (
+        select(*columns)
+        .select_from(model)
+        .join(TimeSlot, TimeSlot.id == model.time_slot_id)
+        .where(TimeSlot.calendar_id == bindparam("calendar_id"))
+        .order_by(model.when.desc())
+        .offset(bindparam("offset", type_=Integer))
+        .limit(bindparam("limit", type_=Integer))
+    )
+
+
+BOOKINGS_IN_RANGE = {model: _bookings_in_range(model) for model in (Booking, BookingArchive)}
+
+BOOKING_DATES_IN_RANGE = {model: _booking_dates_in_range(model) for model in (Booking, BookingArchive)}
+
+# 시간대 하나의 기간 예약 (날짜, 반복 규칙): time_slot_id, start, end (예약 겹침 확인용)
+SLOT_BOOKING_DATES_IN_RANGE = {
+    model: select(model.when, model.recurrence)
+    .where(model.time_slot_id == bindparam("time_slot_id"))
+    .where(_dates_in_range(model))
+    for model in (Booking, BookingArchive)
+}
+
+# 날짜별 예약 수(booking_day_counts)에 들어 있지 않은 반복 예약만
+RECURRING_BOOKING_DATES_IN_RANGE = {
+    model: stmt.where(model.recurrence.is_not(None)) for model, stmt in BOOKING_DATES_IN_RANGE.items()
+}
+
+BOOKINGS_PAGE = {model: _bookings_page(model) for model in (Booking, BookingArchive)}
+
+RECENT_BOOKINGS_COUNT = (
+    select(func.count())
+    .select_from(Booking)
+    .where(Booking.time_slot.has(TimeSlot.calendar_id == bindparam("calendar_id")))
+)
+
+BOOKING_DAY_COUNTS_IN_RANGE = (
+    select(BookingDayCount.day, BookingDayCount.count)
+    .where(BookingDayCount.calendar_id == bindparam("calendar_id"))
+    .where(BookingDayCount.day >= bindparam("start"))
+    .where(BookingDayCount.day < bindparam("end"))
+)
+
+# 기간에 예약이 많은 캘린더부터 (캘린더 ID, 시간대): start, end, limit
+BUSIEST_CALENDARS_IN_RANGE = (
+    select(BookingDayCount.calendar_id, Calendar.timezone)
+    .join(Calendar, Calendar.id == BookingDayCount.calendar_id)
+    .where(BookingDayCount.day >= bindparam("start"))
+    .where(BookingDayCount.day < bindparam("end"))
+    .group_by(BookingDayCount.calendar_id, Calendar.timezone)
+    .order_by(func.sum(BookingDayCount.count).desc())
+    .limit(bindparam("limit", type_=Integer))
+)
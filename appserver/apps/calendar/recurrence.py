@@ -0,0 +1,232 @@
+"""
+반복 예약
+
+- 예약 한 행에 반복 규칙(RFC 5545 RRULE의 일부)을 문자열로 저장하고, when을 첫 번째 날짜로 사용
+  → 매주 회의도 한 행만 쓰고, 조회할 때 필요한 기간의 날짜만 생성기로 만들어 씀
+- 지원하는 규칙: FREQ=DAILY|WEEKLY, INTERVAL, BYDAY(MO~SU), COUNT 또는 UNTIL(YYYYMMDD)
+- 반복 날짜의 요일은 7번(DAILY) 또는 BYDAY 개수(WEEKLY)마다 되풀이되므로,
+  처음 7번만 시간대 요일과 맞는지 확인하면 모든 반복 날짜를 확인한 것과 같음
+- 두 예약의 날짜가 겹치는지는 둘 다 시작한 뒤 두 규칙의 주기(일)의 최소공배수만큼만 보면 됨
+  (그 뒤로는 같은 모양이 되풀이됨, find_common_date)
+"""
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from math import lcm
+from typing import Iterator
+
+FREQUENCIES = ("DAILY", "WEEKLY")
+WEEKDAY_CODES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+MAX_COUNT = 520
+MAX_INTERVAL = 365
+
+
+class RecurrenceRule:
+    """
+    >>> rule = RecurrenceRule.parse("freq=weekly;byday=we,mo;interval=2;count=3")
+    >>> str(rule)
+    'FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;COUNT=3'
+    >>> list(rule.iter_dates(date(2024, 12, 4)))  # 수요일부터
+    [datetime.date(2024, 12, 4), datetime.date(2024, 12, 16), datetime.date(2024, 12, 18)]
+    >>> rule = RecurrenceRule.parse("FREQ=DAILY;INTERVAL=3")
+    >>> list(rule.iter_dates(date(2024, 12, 1), date(2025, 1, 1), date(2025, 1, 8)))
+    [datetime.date(2025, 1, 3), datetime.date(2025, 1, 6)]
+    """
+    __slots__ = ("freq", "interval", "byday", "count", "until")
+
+    def __init__(
+        self,
+        freq: str,
+        interval: int = 1,
+        byday: frozenset[int] = frozenset(),
+        count: int | None = None,
+        until: date | None = None,
+    ):
+        self.freq = freq
+        self.interval = interval
+        self.byday = byday
+        self.count = count
+        self.until = until
+
+    @classmethod
+    def parse(cls, text: str) -> "RecurrenceRule":
+        """규칙 문자열을 읽음 (지원하지 않거나 잘못된 규칙이면 ValueError)"""
+        parts = {}
+        for item in text.strip().upper().removeprefix("RRULE:").split(";"):
+            if not item:
+                continue
+            key, sep, value = item.partition("=")
+            if not sep or key in parts:
+                raise ValueError(f"잘못된 반복 규칙 항목입니다: {item}")
+            parts[key] = value
+
+        freq = parts.pop("FREQ", None)
+        if freq not in FREQUENCIES:
+            raise ValueError(f"FREQ는 {', '.join(FREQUENCIES)} 중 하나여야 합니다.")
+
+        try:
+            interval = int(parts.pop("INTERVAL", "1"))
+            count = int(parts["COUNT"]) if "COUNT" in parts else None
+            until = datetime.strptime(parts["UNTIL"][:8], "%Y%m%d").date() if "UNTIL" in parts else None
+            byday = frozenset(WEEKDAY_CODES.index(code) for code in parts["BYDAY"].split(",")) if "BYDAY" in parts else frozenset()
+        except ValueError as e:
+            raise ValueError("반복 규칙의 값이 잘못되었습니다.") from e
+        for key in ("COUNT", "UNTIL", "BYDAY"):
+            parts.pop(key, None)
+
+        if parts:
+            raise ValueError(f"지원하지 않는 반복 규칙 항목입니다: {', '.join(sorted(parts))}")
+        if not 1 <= interval <= MAX_INTERVAL:
+            raise ValueError(f"INTERVAL은 1부터 {MAX_INTERVAL}까지입니다.")
+        if count is not None and not 1 <= count <= MAX_COUNT:
+            raise ValueError(f"COUNT는 1부터 {MAX_COUNT}까지입니다.")
+        if count is not None and until is not None:
+            raise ValueError("COUNT와 UNTIL은 함께 쓸 수 없습니다.")
+        return cls(freq, interval, byday, count, until)
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}", f"INTERVAL={self.interval}"]
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAY_CODES[weekday] for weekday in sorted(self.byday)))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until:%Y%m%d}")
+        return ";".join(parts)
+
+    def _iter_candidates(self, start: date, skip_to: date | None) -> Iterator[date]:
+        # 규칙의 간격대로 날짜를 만듦 (BYDAY, COUNT, UNTIL은 iter_dates에서 적용)
+        if self.freq == "DAILY":
+            index = 0
+            if skip_to is not None and skip_to > start:
+                index = -(-(skip_to - start).days // self.interval)
+            day = start + timedelta(days=index * self.interval)
+            step = timedelta(days=self.interval)
+            while True:
+                yield day
+                day += step
+
+        weekdays = sorted(self.byday or {start.weekday()})
+        week = start - timedelta(days=start.weekday())
+        if skip_to is not None and skip_to > week:
+            week += timedelta(weeks=(skip_to - week).days // 7 // self.interval * self.interval)
+        step = timedelta(weeks=self.interval)
+        while True:
+            for weekday in weekdays:
+                day = week + timedelta(days=weekday)
+                if day >= start:
+                    yield day
+            week += step
+
+    def iter_dates(
+        self,
+        start: date,
+        window_start: date | None = None,
+        window_end: date | None = None,
+    ) -> Iterator[date]:
+        """
+        start부터 반복하는 날짜 중 [window_start, window_end)에 드는 날짜 (생성기)
+        COUNT가 없으면 window_start 앞의 날짜는 만들지 않고 건너뜀
+        """
+        skip_to = window_start if self.count is None else None
+        filter_byday = self.freq == "DAILY" and self.byday
+        emitted = 0
+        for day in self._iter_candidates(start, skip_to):
+            if self.until is not None and day > self.until:
+                return
+            if window_end is not None and day >= window_end:
+                return
+            if filter_byday and day.weekday() not in self.byday:
+                continue
+            emitted += 1
+            if window_start is None or day >= window_start:
+                yield day
+            if self.count is not None and emitted >= self.count:
+                return
+
+    def last_date(self, start: date) -> date | None:
+        """
+        마지막 반복 날짜 (끝없이 반복하면 None)
+
+        >>> RecurrenceRule.parse("FREQ=WEEKLY;COUNT=3").last_date(date(2024, 12, 3))
+        datetime.date(2024, 12, 17)
+        """
+        if self.count is not None:
+            *_, last = self.iter_dates(start)
+            return last
+        return self.until
+
+    def period_days(self) -> int:
+        """
+        반복 날짜가 같은 모양으로 되풀이되는 주기 (일)
+
+        >>> RecurrenceRule.parse("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE").period_days()
+        14
+        >>> RecurrenceRule.parse("FREQ=DAILY;INTERVAL=3;BYDAY=MO").period_days()
+        21
+        """
+        if self.freq == "WEEKLY":
+            return 7 * self.interval
+        return lcm(self.interval, 7) if self.byday else self.interval
+
+    def first_dates(self, start: date, n: int = 7) -> list[date]:
+        """시간대 요일 확인에 쓰는 처음 n개의 날짜 (모듈 설명 참고)"""
+        return list(islice(self.iter_dates(start), n))
+
+
+@lru_cache(maxsize=1024)
+def parse_recurrence(text: str) -> RecurrenceRule:
+    """저장된 규칙 문자열 → RecurrenceRule (조회할 때마다 다시 읽지 않도록 보관)"""
+    return RecurrenceRule.parse(text)
+
+
+def normalize_recurrence(text: str | None) -> str | None:
+    """
+    입력 검증용: 규칙을 읽어서 정해진 순서의 문자열로 바꿈
+
+    >>> normalize_recurrence("FREQ=WEEKLY;BYDAY=TU")
+    'FREQ=WEEKLY;INTERVAL=1;BYDAY=TU'
+    """
+    if text is None:
+        return None
+    return str(RecurrenceRule.parse(text))
+
+
+def iter_booking_dates(when: date, recurrence: str | None, start: date, end: date) -> Iterator[date]:
+    """
+    예약(반복 예약 포함)의 날짜 중 [start, end)에 드는 날짜
+
+    >>> list(iter_booking_dates(date(2024, 12, 3), None, date(2024, 12, 1), date(2025, 1, 1)))
+    [datetime.date(2024, 12, 3)]
+    >>> len(list(iter_booking_dates(date(2024, 1, 2), "FREQ=WEEKLY", date(2024, 12, 1), date(2025, 1, 1))))
+    5
+    """
+    if recurrence is None:
+        if start <= when < end:
+            yield when
+        return
+    yield from parse_recurrence(recurrence).iter_dates(when, start, end)
+
+
+def find_common_date(
+    when: date,
+    recurrence: str | None,
+    other_when: date,
+    other_recurrence: str | None,
+) -> date | None:
+    """
+    두 예약(반복 예약 포함)이 함께 갖는 첫 날짜 (겹치지 않으면 None)
+
+    >>> find_common_date(date(2024, 12, 3), "FREQ=WEEKLY", date(2025, 1, 7), None)
+    datetime.date(2025, 1, 7)
+    >>> find_common_date(date(2024, 12, 2), "FREQ=DAILY;INTERVAL=2", date(2024, 12, 3), "FREQ=DAILY;INTERVAL=2") is None
+    True
+    >>> find_common_date(date(2024, 12, 3), "FREQ=WEEKLY;COUNT=2", date(2024, 12, 17), "FREQ=WEEKLY") is None
+    True
+    """
+    start = max(when, other_when)
+    periods = [parse_recurrence(text).period_days() for text in (recurrence, other_recurrence) if text is not None]
+    # 반복하지 않는 예약이 있으면 그 날짜 하루만 보면 됨
+    end = start + timedelta(days=lcm(*periods) if len(periods) == 2 else 1)
+    days = set(iter_booking_dates(when, recurrence, start, end))
+    return next((day for day in iter_booking_dates(other_when, other_recurrence, start, end) if day in days), None)
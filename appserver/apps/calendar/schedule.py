@@ -0,0 +1,236 @@
+"""
+캘린더의 시간대(TimeSlot)를 검사하기 쉬운 형태로 미리 바꿔 둔 일정표
+
+- 요일 목록(JSON 리스트)은 비트마스크로, 시각은 하루 중 초(second-of-day) 정수로 바꿈
+  → 예약 요일 확인과 시간대 겹침 확인이 정수 연산으로 끝남
+- 캘린더마다 한 번 만들어 프로세스 안에 보관하고, 시간대가 바뀌면 다시 만듦
+- 시각은 캘린더 시간대(Calendar.timezone)의 현지 시각이며, UTC로 바꿀 때는 미리 만든 변환표를 씀
+"""
+import bisect
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Iterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from appserver.libs.datetime.zones import ZoneOffsetTable, get_zone_table
+from .models import TimeSlot
+from .queries import BUSIEST_CALENDARS_IN_RANGE, TIME_SLOTS_BY_CALENDAR, TIME_SLOTS_BY_CALENDARS
+
+
+def weekdays_to_mask(weekdays: Iterable[int]) -> int:
+    """
+    요일 목록(월=0~일=6)을 비트마스크로 바꿈
+
+    >>> weekdays_to_mask([0, 2])
+    5
+    >>> weekdays_to_mask([])
+    0
+    """
+    mask = 0
+    for weekday in weekdays:
+        mask |= 1 << weekday
+    return mask
+
+
+def time_to_seconds(value: time) -> int:
+    """
+    >>> time_to_seconds(time(9, 30))
+    34200
+    """
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def seconds_to_time(seconds: int) -> time:
+    """
+    >>> seconds_to_time(34200)
+    datetime.time(9, 30)
+    """
+    return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+class CompiledSlot:
+    __slots__ = ("id", "start", "end", "weekday_mask")
+
+    def __init__(self, id: int, start: int, end: int, weekday_mask: int):
+        self.id = id
+        self.start = start
+        self.end = end
+        self.weekday_mask = weekday_mask
+
+    @property
+    def start_time(self) -> time:
+        return seconds_to_time(self.start)
+
+    @property
+    def end_time(self) -> time:
+        return seconds_to_time(self.end)
+
+    def is_open_on(self, day: date) -> bool:
+        return bool(self.weekday_mask >> day.weekday() & 1)
+
+
+class CompiledSchedule:
+    """
+    캘린더 하나의 시간대들 (시작 시각 순으로 정렬)
+
+    >>> schedule = CompiledSchedule(1, [
+    ...     CompiledSlot(1, time_to_seconds(time(9)), time_to_seconds(time(10)), weekdays_to_mask([1])),
+    ...     CompiledSlot(2, time_to_seconds(time(13)), time_to_seconds(time(14)), weekdays_to_mask([1, 3])),
+    ... ])
+    >>> schedule.allows(1, date(2024, 12, 3))  # 화요일
+    True
+    >>> schedule.allows(1, date(2024, 12, 4))  # 수요일
+    False
+    >>> schedule.overlaps(time(9, 30), time(11), [1])
+    True
+    >>> schedule.overlaps(time(9, 30), time(11), [2])
+    False
+    >>> schedule.overlaps(time(10), time(13), [1])
+    False
+    >>> [slot.id for slot in schedule.open_slots(date(2024, 12, 5))]
+    [2]
+    """
+    __slots__ = ("calendar_id", "slots", "_starts", "_by_id")
+
+    def __init__(self, calendar_id: int, slots: Iterable[CompiledSlot]):
+        self.calendar_id = calendar_id
+        self.slots = tuple(sorted(slots, key=lambda slot: (slot.start, slot.end)))
+        self._starts = [slot.start for slot in self.slots]
+        self._by_id = {slot.id: slot for slot in self.slots}
+
+    @classmethod
+    def from_time_slots(cls, calendar_id: int, time_slots: Iterable[TimeSlot]) -> "CompiledSchedule":
+        return cls(calendar_id, (
+            CompiledSlot(
+                time_slot.id,
+                time_to_seconds(time_slot.start_time),
+                time_to_seconds(time_slot.end_time),
+                weekdays_to_mask(time_slot.weekdays),
+            )
+            for time_slot in time_slots
+        ))
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def get(self, time_slot_id: int) -> CompiledSlot | None:
+        return self._by_id.get(time_slot_id)
+
+    def allows(self, time_slot_id: int, day: date) -> bool:
+        """time_slot_id 시간대를 day에 예약할 수 있는지"""
+        slot = self._by_id.get(time_slot_id)
+        return slot is not None and slot.is_open_on(day)
+
+    def overlaps(self, start_time: time, end_time: time, weekdays: Iterable[int]) -> bool:
+        """새 시간대가 같은 요일의 기존 시간대와 겹치는지"""
+        start, end = time_to_seconds(start_time), time_to_seconds(end_time)
+        mask = weekdays_to_mask(weekdays)
+        # end 이후에 시작하는 시간대는 겹칠 수 없으므로 그 앞까지만 확인
+        for slot in self.slots[:bisect.bisect_left(self._starts, end)]:
+            if slot.end > start and slot.weekday_mask & mask:
+                return True
+        return False
+
+    def open_slots(self, day: date) -> list[CompiledSlot]:
+        """day에 예약할 수 있는 시간대 (시작 시각 순)"""
+        bit = 1 << day.weekday()
+        return [slot for slot in self.slots if slot.weekday_mask & bit]
+
+    def iter_open_instants(
+        self,
+        start: date,
+        end: date,
+        zone: ZoneOffsetTable,
+    ) -> Iterator[tuple[CompiledSlot, date, datetime, datetime]]:
+        """
+        [start, end) 날짜마다 열린 시간대와 UTC 시작/끝 시각 (날짜 순, 같은 날은 시작 시각 순)
+
+        >>> from appserver.libs.datetime.zones import get_zone_table
+        >>> schedule = CompiledSchedule(1, [CompiledSlot(1, 9 * 3600, 10 * 3600, weekdays_to_mask([1]))])
+        >>> [(day.day, start_at.hour) for _, day, start_at, _ in schedule.iter_open_instants(
+        ...     date(2024, 12, 1), date(2024, 12, 15), get_zone_table("Asia/Seoul"))]
+        [(3, 0), (10, 0)]
+        """
+        day = start
+        while day < end:
+            for slot in self.open_slots(day):
+                yield slot, day, zone.to_utc(day, slot.start), zone.to_utc(day, slot.end)
+            day += timedelta(days=1)
+
+
+class ScheduleCache:
+    """
+    캘린더 ID → CompiledSchedule (프로세스 안, LRU)
+
+    시간대를 만든 워커는 invalidate()로 바로 지우고,
+    다른 워커에서 만든 시간대는 get()에서 모르는 시간대 ID를 만나면 다시 읽어서 반영합니다.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._schedules: OrderedDict[int, CompiledSchedule] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._schedules)
+
+    async def load(self, session: AsyncSession, calendar_id: int) -> CompiledSchedule:
+        """DB에서 시간대를 읽어 새로 만들고 보관"""
+        result = await session.execute(TIME_SLOTS_BY_CALENDAR, {"calendar_id": calendar_id})
+        schedule = CompiledSchedule.from_time_slots(calendar_id, result.scalars().all())
+        self._put(schedule)
+        return schedule
+
+    async def load_many(self, session: AsyncSession, calendar_ids: list[int]) -> None:
+        """
+        여러 캘린더의 시간대를 IN (...) 조회 한 번으로 읽어 새로 만들고 보관
+        calendar_ids의 뒤쪽 캘린더가 LRU의 가장 최근 쪽에 남음
+        """
+        if not calendar_ids:
+            return
+        result = await session.execute(TIME_SLOTS_BY_CALENDARS, {"calendar_ids": calendar_ids})
+        time_slots: dict[int, list[TimeSlot]] = {calendar_id: [] for calendar_id in calendar_ids}
+        for time_slot in result.scalars():
+            time_slots[time_slot.calendar_id].append(time_slot)
+        for calendar_id, slots in time_slots.items():
+            self._put(CompiledSchedule.from_time_slots(calendar_id, slots))
+
+    def _put(self, schedule: CompiledSchedule) -> None:
+        self._schedules[schedule.calendar_id] = schedule
+        self._schedules.move_to_end(schedule.calendar_id)
+        while len(self._schedules) > self.max_entries:
+            self._schedules.popitem(last=False)
+
+    async def get(
+        self,
+        session: AsyncSession,
+        calendar_id: int,
+        time_slot_id: int | None = None,
+    ) -> CompiledSchedule:
+        """
+        보관한 일정표를 반환하고, 없으면 DB에서 읽어 만듦
+        time_slot_id를 주면 그 시간대가 일정표에 없을 때도 다시 읽음
+        """
+        schedule = self._schedules.get(calendar_id)
+        if schedule is None or (time_slot_id is not None and schedule.get(time_slot_id) is None):
+            return await self.load(session, calendar_id)
+        self._schedules.move_to_end(calendar_id)
+        return schedule
+
+    def invalidate(self, calendar_id: int) -> None:
+        self._schedules.pop(calendar_id, None)
+
+
+async def warm_schedule_cache(session: AsyncSession, cache: ScheduleCache, start: date, end: date) -> int:
+    """
+    [start, end)에 예약이 많은 캘린더부터 일정표와 시간대 변환표를 새로 만들어 둠 (cache.max_entries개까지)
+    시간대는 캘린더 수와 관계없이 조회 한 번으로 읽음
+    → 예약 가능 시간 조회가 DB에서 시간대를 읽지 않고, 다른 워커에서 바뀐 시간대도 반영됨
+    반환 값은 새로 만든 일정표 수
+    """
+    params = {"start": start, "end": end, "limit": cache.max_entries}
+    calendars = (await session.execute(BUSIEST_CALENDARS_IN_RANGE, params)).all()
+    # 덜 바쁜 캘린더부터 넣어서 가장 바쁜 캘린더가 LRU의 가장 최근 쪽에 남게 함
+    await cache.load_many(session, [calendar_id for calendar_id, _ in reversed(calendars)])
+    for timezone in {timezone for _, timezone in calendars}:
+        get_zone_table(timezone)
+    return len(calendars)
@@ -5,11 +5,26 @@ from pydantic import AwareDatetime, EmailStr, AfterValidator, model_validator
 from sqlmodel import SQLModel, Field
 
 from appserver.libs.collections.sort import deduplicate_and_sort
+from appserver.libs.datetime.zones import is_valid_timezone
+from appserver.libs.http.fields import partial_model
+from .models import DEFAULT_TIMEZONE
+from .recurrence import normalize_recurrence
 
 
 class CalendarOut(SQLModel):
     topics: list[str]
     description: str
+    timezone: str
+
+
+class CalendarSearchResultOut(CalendarOut):
+    host_username: str
+    host_display_name: str
+    score: int = Field(description="일치한 주제 점수 (정확히 일치 2점, 접두어 일치 1점)")
+
+
+# ?fields=로 고른 필드만 담은 응답 (appserver.libs.http.fields 참고)
+PartialCalendarSearchResultOut = partial_model(CalendarSearchResultOut)
 
 
 class CalendarDetailOut(CalendarOut):
@@ -21,10 +36,20 @@ class CalendarDetailOut(CalendarOut):
 
 Topics = Annotated[list[str], AfterValidator(deduplicate_and_sort)]
 
+
+def validate_timezone(name: str) -> str:
+    if not is_valid_timezone(name):
+        raise ValueError(f"IANA 시간대 이름이 아닙니다: {name}")
+    return name
+
+
+TimeZoneName = Annotated[str, AfterValidator(validate_timezone)]
+
 class CalendarCreateIn(SQLModel):
     topics: Topics = Field(min_length=1, description="게스트와 나눌 주제들")
     description: str = Field(min_length=1, description="게스트에게 보여 줄 설명")
     google_calendar_id: EmailStr = Field(description="Google Calendar ID")
+    timezone: TimeZoneName = Field(default=DEFAULT_TIMEZONE, description="IANA 시간대 이름 (예: Asia/Seoul)")
 
 
 class CalendarUpdateIn(SQLModel):
@@ -43,6 +68,7 @@ class CalendarUpdateIn(SQLModel):
         min_length=10,
         description="Google Calendar ID"
     )
+    timezone: TimeZoneName | None = Field(default=None, description="IANA 시간대 이름")
 
 
 def validate_weekdays(weekdays: list[int]) -> list[int]:
@@ -88,11 +114,30 @@ class TimeSlotOut(SQLModel):
     updated_at: AwareDatetime
 
 
+class AvailableTimeSlotOut(SQLModel):
+    id: int
+    start_time: time
+    end_time: time
+    start_at: AwareDatetime = Field(description="시작 시각 (UTC)")
+    end_at: AwareDatetime = Field(description="끝 시각 (UTC)")
+
+
+class AvailableSlotOut(SQLModel):
+    time_slot_id: int
+    when: date = Field(description="캘린더 시간대의 날짜")
+    start_at: AwareDatetime = Field(description="시작 시각 (UTC)")
+    end_at: AwareDatetime = Field(description="끝 시각 (UTC)")
+
+
 class BookingCreateIn(SQLModel):
     when: date
     topic: str
     description: str
     time_slot_id: int
+    recurrence: Annotated[str | None, AfterValidator(normalize_recurrence)] = Field(
+        default=None,
+        description="반복 규칙 (예: FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10), when이 첫 번째 날짜",
+    )
 
 
 class BookingOut(SQLModel):
@@ -100,11 +145,42 @@ class BookingOut(SQLModel):
     when: date
     topic: str
     description: str
+    recurrence: str | None = None
+    recurrence_until: date | None = None
     time_slot: TimeSlotOut
     created_at: AwareDatetime
     updated_at: AwareDatetime
 
 
+class BookingSearchHitOut(BookingOut):
+    snippet: str = Field(description="일치한 부분을 <mark>로 감싼 요약 (HTML 이스케이프됨)")
+
+
+class BookingSearchOut(SQLModel):
+    items: list[BookingSearchHitOut]
+    next_cursor: str | None = Field(description="다음 쪽을 읽을 때 cursor로 넘길 값 (마지막 쪽이면 null)")
+
+
+PartialBookingOut = partial_model(BookingOut)
+PartialBookingSearchHitOut = partial_model(BookingSearchHitOut)
+
+
+class PartialBookingSearchOut(SQLModel):
+    items: list[PartialBookingSearchHitOut]
+    next_cursor: str | None = Field(description="다음 쪽을 읽을 때 cursor로 넘길 값 (마지막 쪽이면 null)")
+
+
 class SimpleBookingOut(SQLModel):
     when: date
-    time_slot: TimeSlotOut
\ No newline at end of file
+    time_slot: TimeSlotOut
+
+
+class BookingDayCountOut(SQLModel):
+    day: int = Field(description="날짜 (달력 앞쪽 빈칸은 0)")
+    count: int
+
+
+class MonthBookingCountsOut(SQLModel):
+    year: int
+    month: int
+    days: list[BookingDayCountOut]
@@ -0,0 +1,193 @@
+"""
+호스트 예약 전문 검색
+
+- 예약의 주제(topic)와 설명(description)을 단어 앞부분으로 찾음 (모든 단어가 들어 있어야 함)
+  SQLite는 FTS5(bookings_fts), PostgreSQL은 to_tsvector 식 GIN 인덱스 사용 (models.py 참고)
+- 일치한 부분은 <mark>로 감싼 요약(snippet)으로 돌려줌 (나머지 글자는 HTML 이스케이프)
+- 결과는 날짜 최신순이며, 마지막 항목의 (날짜, ID)를 커서로 넘겨 다음 쪽을 읽음(keyset)
+  → OFFSET처럼 앞쪽 결과를 다시 읽지 않고, 중간에 예약이 생겨도 겹치거나 빠지지 않음
+- 보관된 예약(bookings_archive)은 검색하지 않음
+- search_booking_fields는 응답에서 고른 필드의 열만 읽음 (appserver.libs.http.fields 참고)
+"""
+import base64
+import html
+import json
+import re
+from datetime import date
+
+from sqlalchemy import Select, func, literal_column, select, table, column, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from appserver.libs.http.fields import label
+from .models import BOOKING_SEARCH_DOCUMENT, BOOKING_SEARCH_TABLE, Booking, TimeSlot
+
+# DB가 돌려주는 요약에서 일치한 부분의 앞뒤 표시 (이스케이프한 뒤 <mark>로 바꿈)
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+Cursor = tuple[date, int]
+
+
+def split_terms(q: str) -> list[str]:
+    """
+    검색어 → 단어 목록 (FTS 문법으로 쓰일 수 있는 기호는 버림)
+
+    >>> split_terms('회의 "자료" OR 회의*')
+    ['회의', '자료', 'or']
+    """
+    return list(dict.fromkeys(re.findall(r"\w+", q.lower())))
+
+
+def to_fts5_query(terms: list[str]) -> str:
+    """
+    >>> to_fts5_query(["회의", "자료"])
+    '"회의"* "자료"*'
+    """
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def to_tsquery(terms: list[str]) -> str:
+    """
+    >>> to_tsquery(["회의", "자료"])
+    '회의:* & 자료:*'
+    """
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def highlight(snippet: str) -> str:
+    """
+    >>> highlight("<b>" + HIGHLIGHT_START + "회의" + HIGHLIGHT_END + " 자료")
+    '&lt;b&gt;<mark>회의</mark> 자료'
+    """
+    escaped = html.escape(snippet, quote=False)
+    return escaped.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+
+
+def encode_cursor(when: date, booking_id: int) -> str:
+    """
+    >>> decode_cursor(encode_cursor(date(2024, 12, 3), 15))
+    (datetime.date(2024, 12, 3), 15)
+    """
+    raw = json.dumps([when.isoformat(), booking_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """잘못된 커서이면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        when, booking_id = json.loads(raw)
+        return date.fromisoformat(when), int(booking_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def _sqlite_search(stmt: Select, terms: list[str]) -> Select:
+    fts = table(BOOKING_SEARCH_TABLE, column("rowid"))
+    fts_column = literal_column(BOOKING_SEARCH_TABLE)
+    # 열 -1: 더 잘 일치하는 열(주제/설명)에서 최대 16단어
+    snippet = func.snippet(fts_column, -1, HIGHLIGHT_START, HIGHLIGHT_END, "…", 16)
+    return (
+        stmt.add_columns(snippet.label("snippet"))
+        .join(fts, fts.c.rowid == Booking.id)
+        .where(fts_column.op("MATCH")(to_fts5_query(terms)))
+    )
+
+
+def _postgresql_search(stmt: Select, terms: list[str]) -> Select:
+    # 인덱스 식과 같은 식으로 비교해야 GIN 인덱스를 씀
+    document = literal_column(BOOKING_SEARCH_DOCUMENT)
+    query = func.to_tsquery("simple", to_tsquery(terms))
+    snippet = func.ts_headline(
+        "simple",
+        document,
+        query,
+        f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=16, MinWords=4",
+    )
+    return (
+        stmt.add_columns(snippet.label("snippet"))
+        .where(func.to_tsvector("simple", document).op("@@")(query))
+    )
+
+
+async def _search_page(
+    session: AsyncSession,
+    stmt: Select,
+    calendar_id: int,
+    terms: list[str],
+    limit: int,
+    after: Cursor | None,
+) -> list:
+    """stmt(bookings에서 읽는 조회문)에 검색 조건과 요약(snippet 열)을 붙여 한 쪽(+1행)을 읽음"""
+    dialect = (await session.connection()).dialect.name
+    stmt = _postgresql_search(stmt, terms) if dialect == "postgresql" else _sqlite_search(stmt, terms)
+    stmt = (
+        stmt.join(TimeSlot, TimeSlot.id == Booking.time_slot_id)
+        .where(TimeSlot.calendar_id == calendar_id)
+        .order_by(Booking.when.desc(), Booking.id.desc())
+        .limit(limit + 1)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Booking.when, Booking.id) < tuple_(*after))
+    return (await session.execute(stmt)).all()
+
+
+async def search_bookings(
+    session: AsyncSession,
+    calendar_id: int,
+    q: str,
+    limit: int,
+    after: Cursor | None = None,
+) -> tuple[list[tuple[Booking, str]], Cursor | None]:
+    """
+    ([(예약, 강조한 요약)], 다음 쪽 커서) (다음 쪽이 없으면 커서는 None)
+    """
+    terms = split_terms(q)
+    if not terms:
+        return [], None
+
+    stmt = select(Booking).options(selectinload(Booking.time_slot))
+    rows = await _search_page(session, stmt, calendar_id, terms, limit, after)
+    hits = [(booking, highlight(snippet)) for booking, snippet in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = hits[-1][0]
+        next_cursor = (last.when, last.id)
+    return hits, next_cursor
+
+
+async def search_booking_fields(
+    session: AsyncSession,
+    calendar_id: int,
+    q: str,
+    limit: int,
+    after: Cursor | None,
+    paths: list[tuple[str, ...]],
+) -> tuple[list[dict], Cursor | None]:
+    """
+    search_bookings와 같은 순서로 BookingSearchHitOut의 paths 필드만 읽음
+    ([label(path) → 값], 다음 쪽 커서), 요약(snippet)은 고른 경우에만 담음
+    """
+    terms = split_terms(q)
+    if not terms:
+        return [], None
+
+    columns = [
+        getattr(TimeSlot if path[0] == "time_slot" else Booking, path[-1]).label(label(path))
+        for path in paths
+        if path != ("snippet",)
+    ]
+    # 커서를 만들 (날짜, ID)는 고르지 않았어도 읽음
+    stmt = select(*columns, Booking.when.label("cursor_when"), Booking.id.label("cursor_id")).select_from(Booking)
+    rows = await _search_page(session, stmt, calendar_id, terms, limit, after)
+    hits = []
+    for row in rows[:limit]:
+        hit = dict(row._mapping)
+        hit["snippet"] = highlight(hit["snippet"])
+        hits.append(hit)
+    next_cursor = None
+    if len(rows) > limit:
+        last = hits[-1]
+        next_cursor = (last["cursor_when"], last["cursor_id"])
+    return hits, next_cursor
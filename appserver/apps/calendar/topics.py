@@ -0,0 +1,127 @@
+"""
+주제로 캘린더 찾기
+
+- calendar_topics에 캘린더의 주제를 정규화해서 한 행씩 저장 (역색인)
+- 검색은 주제 일치(topic)와 검색어(q)의 단어별 주제 접두어 일치로 찾고,
+  일치한 주제가 많을수록(정확히 일치하면 2점, 접두어 일치는 1점) 앞에 보여 줌
+- JSON 컬럼을 캘린더마다 읽지 않으므로 호스트 수가 늘어도 일치한 주제 행만 읽음
+"""
+import re
+
+from sqlalchemy import RowMapping, and_, case, delete, insert, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import func, select
+
+from appserver.apps.account.models import User
+from .models import Calendar, CalendarTopic
+
+# 검색어를 단어로 나누는 구분자
+QUERY_SEPARATOR = re.compile(r"[\s,]+")
+
+
+def normalize_topic(topic: str) -> str:
+    """
+    >>> normalize_topic("  Python   Backend ")
+    'python backend'
+    """
+    return " ".join(topic.lower().split())
+
+
+def split_query(q: str) -> list[str]:
+    """
+    >>> split_query("FastAPI,  파이썬 fastapi")
+    ['fastapi', '파이썬']
+    """
+    return list(dict.fromkeys(word for word in QUERY_SEPARATOR.split(q.lower()) if word))
+
+
+async def sync_calendar_topics(session: AsyncSession, calendar_id: int, topics: list[str]) -> None:
+    """캘린더의 주제 색인을 topics로 바꿈 (커밋은 캘린더를 저장하는 쪽에서 함께 함)"""
+    await session.execute(delete(CalendarTopic).where(CalendarTopic.calendar_id == calendar_id))
+    normalized = {normalize_topic(topic) for topic in topics} - {""}
+    if normalized:
+        await session.execute(
+            insert(CalendarTopic),
+            [{"topic": topic, "calendar_id": calendar_id} for topic in sorted(normalized)],
+        )
+
+
+def _prefix(column, prefix: str):
+    # LIKE 'prefix%'는 SQLite(대소문자 무시)와 PostgreSQL(로캘 정렬)에서 인덱스를 못 쓰므로 범위로 비교
+    return and_(column >= prefix, column < prefix + "\uffff")
+
+
+def _ranked_calendars(topic: str | None, q: str | None):
+    # 일치한 캘린더와 점수 (calendar_id, score)
+    required = normalize_topic(topic) if topic else None
+    terms = split_query(q) if q else []
+    exact = ([required] if required else []) + terms
+
+    conditions = [CalendarTopic.topic.in_(exact)]
+    conditions.extend(_prefix(CalendarTopic.topic, term) for term in terms)
+    score = func.sum(case((CalendarTopic.topic.in_(exact), 2), else_=1))
+
+    ranked = (
+        select(CalendarTopic.calendar_id, score.label("score"))
+        .where(or_(*conditions))
+        .group_by(CalendarTopic.calendar_id)
+    )
+    if required:
+        ranked = ranked.having(func.max(case((CalendarTopic.topic == required, 1), else_=0)) == 1)
+    return ranked.subquery()
+
+
+def _search_page(ranked, *columns, offset: int, limit: int):
+    return (
+        select(*columns)
+        .select_from(Calendar)
+        .join(ranked, ranked.c.calendar_id == Calendar.id)
+        .join(User, User.id == Calendar.host_id)
+        .order_by(ranked.c.score.desc(), Calendar.id)
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+async def search_calendars(
+    session: AsyncSession,
+    topic: str | None,
+    q: str | None,
+    offset: int,
+    limit: int,
+) -> list[tuple[Calendar, str, str, int]]:
+    """
+    (캘린더, 호스트 username, 호스트 표시 이름, 점수) 목록 (점수 높은 순, 같으면 먼저 만든 캘린더 순)
+    topic을 주면 그 주제가 있는 캘린더만 찾음
+    """
+    ranked = _ranked_calendars(topic, q)
+    stmt = _search_page(
+        ranked, Calendar, User.username, User.display_name, ranked.c.score, offset=offset, limit=limit,
+    )
+    result = await session.execute(stmt)
+    return [tuple(row) for row in result]
+
+
+async def search_calendar_fields(
+    session: AsyncSession,
+    topic: str | None,
+    q: str | None,
+    offset: int,
+    limit: int,
+    fields: list[str],
+) -> list[RowMapping]:
+    """search_calendars와 같은 순서로 CalendarSearchResultOut의 fields 열만 읽음 (필드 이름 → 값)"""
+    ranked = _ranked_calendars(topic, q)
+    columns = {
+        "host_username": User.username,
+        "host_display_name": User.display_name,
+        "score": ranked.c.score,
+    }
+    stmt = _search_page(
+        ranked,
+        *((columns[name] if name in columns else getattr(Calendar, name)).label(name) for name in fields),
+        offset=offset,
+        limit=limit,
+    )
+    result = await session.execute(stmt)
+    return list(result.mappings())
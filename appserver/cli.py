@@ -0,0 +1,107 @@
+import argparse
+from datetime import date
+from pathlib import Path
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m appserver")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="운영 서버 실행")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--workers", type=int, default=None, help="워커 수 (기본값: CPU 수)")
+    serve_parser.add_argument(
+        "--db-connection-budget",
+        type=int,
+        default=None,
+        help="모든 워커가 나눠 쓸 전체 DB 연결 수",
+    )
+    serve_parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=30,
+        help="종료 신호를 받은 뒤 처리 중인 요청을 기다리는 시간(초)",
+    )
+    serve_parser.add_argument(
+        "--no-prewarm",
+        dest="prewarm",
+        action="store_false",
+        help="커넥션 풀과 해셔를 미리 준비하지 않음",
+    )
+    serve_parser.add_argument(
+        "--no-scheduler",
+        dest="scheduler",
+        action="store_false",
+        help="백그라운드 유지 보수 작업(만료 데이터 정리, 캐시 채우기, ANALYZE)을 실행하지 않음",
+    )
+
+    archive_parser = subparsers.add_parser("archive-bookings", help="오래된 예약을 보관 테이블로 옮김")
+    archive_parser.add_argument(
+        "--before",
+        type=date.fromisoformat,
+        default=None,
+        help="이 날짜(YYYY-MM-DD) 이전 예약을 옮김 (기본값: 설정의 보관 기준일)",
+    )
+    archive_parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 옮길 예약 수")
+
+    import_parser = subparsers.add_parser("import-users", help="CSV/NDJSON 파일의 사용자를 일괄 추가")
+    import_parser.add_argument("path", type=Path, help="username, email, password, display_name, is_host 항목")
+    import_parser.add_argument(
+        "--format",
+        choices=["csv", "ndjson"],
+        default=None,
+        help="파일 형식 (기본값: 확장자가 .csv이면 csv, 아니면 ndjson)",
+    )
+    import_parser.add_argument("--batch-size", type=int, default=500, help="한 번에 해싱하고 추가할 사용자 수")
+    import_parser.add_argument("--workers", type=int, default=None, help="해싱 프로세스 수 (기본값: CPU 수)")
+    import_parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=4,
+        help="추가를 기다리는 해싱 묶음의 최대 수 (넘으면 파일 읽기를 멈추고 기다림)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "serve":
+        # 서버 실행에 필요한 모듈은 해당 명령을 쓸 때만 불러옴
+        from .server import serve
+
+        serve(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            connection_budget=args.db_connection_budget,
+            graceful_timeout=args.graceful_timeout,
+            prewarm=args.prewarm,
+            scheduler=args.scheduler,
+        )
+    elif args.command == "archive-bookings":
+        import asyncio
+        from .settings import get_settings
+        from .apps.calendar.archive import run_archive_job
+
+        moved = asyncio.run(run_archive_job(get_settings(), args.before, args.batch_size))
+        print(f"{moved}개 예약을 보관했습니다.")
+    elif args.command == "import-users":
+        import asyncio
+        import logging
+        from .settings import get_settings
+        from .apps.account.bulk_import import run_import
+
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+        report = asyncio.run(run_import(
+            get_settings(),
+            args.path,
+            format=args.format,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            max_pending=args.max_pending,
+        ))
+        for line_no, message in report.invalid:
+            print(f"{line_no}번 줄: {message}")
+        print(report.summary())
@@ -1,18 +1,158 @@
+import asyncio
+import functools
+import time
+from sqlalchemy import event, exc, make_url, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
-from typing import Annotated
+from typing import Annotated, Any, Awaitable, Callable, TypeVar, TYPE_CHECKING
 from fastapi import Depends
+from fastapi.requests import HTTPConnection
+if TYPE_CHECKING:
+    from .settings import Settings
 
 
-def create_engine(dsn: str):
-    return create_async_engine(
-        dsn,
-        echo=True,
-    )
+def create_engine(dsn: str, **kwargs) -> AsyncEngine:
+    return create_async_engine(dsn, **kwargs)
+
+
+def is_memory_database(dsn: str) -> bool:
+    """
+    SQLite 메모리 DB 여부 (메모리 DB는 StaticPool을 쓰므로 풀 크기 옵션을 받지 않음)
+
+    >>> is_memory_database("sqlite+aiosqlite:///:memory:")
+    True
+    >>> is_memory_database("sqlite+aiosqlite:///./local.db")
+    False
+    """
+    url = make_url(dsn)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+class PoolMetrics:
+    """
+    커넥션 풀에서 연결을 꺼낼 때(checkout) 걸린 시간 통계 (새 연결을 만드는 시간 포함)
+
+    waits: 빈 연결도, 더 만들 여유도 없어서 다른 요청이 연결을 돌려줄 때까지 기다린 횟수
+    → waits가 늘거나 max_wait가 길면 풀 크기(또는 워커당 연결 예산)가 부족하다는 뜻
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, elapsed: float, waited: bool = False) -> None:
+        self.checkouts += 1
+        self.total_wait += elapsed
+        if elapsed > self.max_wait:
+            self.max_wait = elapsed
+        if waited:
+            self.waits += 1
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        >>> metrics = PoolMetrics()
+        >>> metrics.record(0.0)
+        >>> metrics.record(0.5, waited=True)
+        >>> metrics.snapshot()
+        {'checkouts': 2, 'waits': 1, 'timeouts': 0, 'avg_wait': 0.25, 'max_wait': 0.5}
+        """
+        return {
+            "checkouts": self.checkouts,
+            "waits": self.waits,
+            "timeouts": self.timeouts,
+            "avg_wait": self.total_wait / self.checkouts if self.checkouts else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class MeteredAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """연결을 꺼내는 데 걸린 시간을 metrics에 기록하는 풀"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        # 꺼낸 연결 수가 풀 크기 + 초과 허용 수에 닿았으면 연결이 돌아올 때까지 기다려야 함
+        waited = 0 <= self._max_overflow and self.checkedout() >= self.size() + self._max_overflow
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.record(time.perf_counter() - started_at, waited)
+
+    def recreate(self):
+        # engine.dispose()로 풀을 다시 만들어도 같은 통계를 이어서 씀
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def create_engine_from_settings(settings: "Settings") -> AsyncEngine:
+    options = {"echo": settings.database_echo, "query_cache_size": settings.database_query_cache_size}
+    if not is_memory_database(settings.database_dsn):
+        options.update(
+            poolclass=MeteredAsyncAdaptedQueuePool,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_pre_ping=True,
+        )
+    return create_engine(settings.database_dsn, **options)
+
+
+# SQLite ANALYZE가 색인마다 읽는 대략의 행 수 (큰 테이블도 짧게 끝남)
+SQLITE_ANALYSIS_LIMIT = 1000
 
 
-def create_session(async_engine: AsyncEngine|None = None, **kwargs):
-    if async_engine is None:
-        async_engine = create_engine()
+async def prewarm_pool(async_engine: AsyncEngine, size: int) -> None:
+    """
+    풀에 연결을 `size`개 미리 만들어 둠 → 첫 요청들이 연결 생성 비용을 치르지 않음
+    """
+    async def _connect():
+        conn = await async_engine.connect()
+        await conn.execute(text("SELECT 1"))
+        return conn
+
+    # 동시에 연결을 잡고 있어야 서로 다른 연결이 size개 만들어짐
+    conns = await asyncio.gather(*[_connect() for _ in range(size)])
+    for conn in conns:
+        await conn.close() # 닫으면 연결은 풀로 돌아감
+
+
+async def optimize_database(async_engine: AsyncEngine, vacuum_free_ratio: float = 0.2) -> bool:
+    """
+    플래너 통계 갱신(ANALYZE)과 빈 페이지 정리(VACUUM), VACUUM을 했으면 True
+
+    - SQLite: 표본 행 수를 제한한 ANALYZE, 빈 페이지가 vacuum_free_ratio 이상일 때만 VACUUM
+      (VACUUM은 DB 파일 전체를 다시 쓰므로 매번 하지 않음)
+    - 그 밖의 DB: ANALYZE만 (PostgreSQL의 VACUUM은 autovacuum에 맡김)
+    VACUUM은 트랜잭션 안에서 실행할 수 없으므로 AUTOCOMMIT 연결을 씀
+    """
+    async with async_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        if conn.dialect.name != "sqlite":
+            await conn.exec_driver_sql("ANALYZE")
+            return False
+
+        await conn.exec_driver_sql(f"PRAGMA analysis_limit={SQLITE_ANALYSIS_LIMIT}")
+        await conn.exec_driver_sql("ANALYZE")
+        page_count = (await conn.exec_driver_sql("PRAGMA page_count")).scalar_one()
+        free_pages = (await conn.exec_driver_sql("PRAGMA freelist_count")).scalar_one()
+        if page_count and free_pages / page_count >= vacuum_free_ratio:
+            await conn.exec_driver_sql("VACUUM")
+            return True
+        return False
+
+
+def create_session(async_engine: AsyncEngine, **kwargs):
     return async_sessionmaker(
         async_engine,
         expire_on_commit=False, # 커밋 이후에도 ORM 객체의 모든 속성 값 유지
@@ -22,17 +162,74 @@ def create_session(async_engine: AsyncEngine|None = None, **kwargs):
     )
 
 
-DSN = "sqlite+aiosqlite:///./local.db"          # db.py 파일이 있는 경로에 local.db 파일을 생성
-engine = create_engine(DSN)                     # 비동기 엔진
-async_session_factory = create_session(engine)  # 비동기 세션
-
+# 엔진과 세션 팩토리는 모듈을 import할 때가 아니라 앱의 lifespan에서 만듭니다.
+# (appserver.app.lifespan 참고) → 모듈 import만으로는 DB 연결 준비 비용이 들지 않음
 # FastAPI에서 사용할 비동기 생성기(async generator)
-async def use_session(): 
-    async with async_session_factory() as session: # 세션 팩토리에서 세션 반환
+#
+# 세션을 만드는 것만으로는 풀에서 연결을 꺼내지 않습니다.
+# - 처음 쿼리를 실행할 때 연결을 꺼내고, commit()/rollback() 하면 바로 풀에 돌려줌
+# - 캐시(세션 저장소, 일정표 등)로 처리한 요청은 연결을 전혀 쓰지 않음
+# 그러므로 이 의존성 안에서 쿼리를 미리 실행하지 마세요.
+# WebSocket 엔드포인트에서도 쓰도록 Request 대신 HTTPConnection을 받음
+async def use_session(connection: HTTPConnection):
+    session_factory = connection.app.state.session_factory
+    async with session_factory() as session: # 세션 팩토리에서 세션 반환
         yield session # 세션 반환 (함수에 주입)
 
 
 DbSessionDep = Annotated[AsyncSession, Depends(use_session)]
 
 
+T = TypeVar("T")
+
+# 트랜잭션 안에서 쓰기(flush, INSERT/UPDATE/DELETE 실행)를 했는지 session.info에 표시
+# → transactional()이 실패한 핸들러의 쓰기만 골라서 롤백
+HAS_WRITES = "has_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info[HAS_WRITES] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[HAS_WRITES] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_writes(session: Session, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(HAS_WRITES, None)
+
+
+def transactional(handler: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    핸들러를 하나의 작업 단위(unit of work)로 실행
+
+    - 핸들러가 끝나면 한 번만 커밋하고, 예외가 나면 롤백
+      (쓰기를 하지 않았으면 롤백하지 않음 → 읽기만 한 요청의 오류 응답에 롤백 왕복을 쓰지 않음)
+    - 핸들러 안에서는 commit() 대신 flush()를 써서 제약 조건 오류(IntegrityError)를 확인
+    - INSERT는 RETURNING으로 서버 기본값(created_at 등)을 함께 받아오므로 refresh()가 필요 없음
+
+    라우터 데코레이터 아래에 붙입니다.
+        @router.post(...)
+        @transactional
+        async def handler(..., session: DbSessionDep): ...
+    """
+    @functools.wraps(handler)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        session = next(
+            value for value in (*args, *kwargs.values()) if isinstance(value, AsyncSession)
+        )
+        try:
+            result = await handler(*args, **kwargs)
+        except BaseException:
+            if session.info.get(HAS_WRITES) or session.new or session.dirty or session.deleted:
+                await session.rollback()
+            raise
+        await session.commit()
+        return result
 
+    return wrapper
@@ -0,0 +1,90 @@
+"""
+요청 하나 안에서 쓰는 DataLoader
+
+- 같은 이벤트 루프 차례(tick)에 요청한 키를 모아 batch_load를 한 번만 부름 → IN (...) 조회 한 번
+- 한 번 읽은 키는 loader 안에 보관 → 여러 의존성/핸들러에서 같은 키를 찾아도 다시 읽지 않음
+- 요청마다 새로 만들어 씀 (요청이 끝나면 보관한 값도 버려짐, 다른 요청의 변경을 놓치지 않음)
+
+batch_load는 키 목록을 받아 {키: 값}을 반환하고, 없는 키는 None이 됨
+max_batch_size로 나눈 조회는 차례로 실행 (AsyncSession은 동시에 조회할 수 없음)
+"""
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, Mapping, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    >>> async def main():
+    ...     calls = []
+    ...     async def batch_load(keys):
+    ...         calls.append(keys)
+    ...         return {key: key.upper() for key in keys if key != "ghost"}
+    ...     loader = DataLoader(batch_load, normalize=str.lower)
+    ...     print(await loader.load_many(["a", "B", "a", "ghost"]))
+    ...     print(await loader.load("b"), calls)
+    >>> asyncio.run(main())
+    ['A', 'B', 'A', None]
+    B [['a', 'b', 'ghost']]
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: int | None = None,
+        normalize: Callable[[K], K] | None = None,
+    ):
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.normalize = normalize
+        self._futures: dict[K, asyncio.Future] = {}
+        self._pending: list[K] = []
+        # 이벤트 루프는 작업을 약하게 참조하므로, 읽는 중인 작업이 GC되지 않도록 끝날 때까지 보관
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, key: K) -> "asyncio.Future[V | None]":
+        if self.normalize is not None:
+            key = self.normalize(key)
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            self._pending.append(key)
+            if len(self._pending) == 1:
+                # 지금 차례에 요청하는 키를 더 모은 뒤에 읽음
+                loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def prime(self, key: K, value: V) -> None:
+        """이미 읽은 값을 넣어 둠 (이미 있는 키는 그대로)"""
+        if self.normalize is not None:
+            key = self.normalize(key)
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def _dispatch(self) -> None:
+        keys, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._load(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, keys: list[K]) -> None:
+        size = self.max_batch_size or len(keys)
+        for start in range(0, len(keys), size):
+            batch = keys[start:start + size]
+            try:
+                values = await self.batch_load(batch)
+            except Exception as e:
+                for key in batch:
+                    # 실패한 키는 다음 요청에서 다시 읽을 수 있게 지움
+                    self._futures.pop(key).set_exception(e)
+                continue
+            for key in batch:
+                self._futures[key].set_result(values.get(key))
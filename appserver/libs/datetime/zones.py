@@ -0,0 +1,117 @@
+"""
+IANA 시간대 변환표
+
+- 시간대마다 UTC 오프셋이 바뀌는 순간(서머타임 시작/끝, 표준시 변경)을 한 번 찾아 정렬된 목록으로 보관
+  → 긴 기간의 현지 시각을 UTC로 바꿀 때 날짜마다 zoneinfo를 부르지 않고 bisect로 오프셋을 찾음
+- 표는 FROM_YEAR부터 TO_YEAR 전까지 만들고, 범위 밖의 시각은 zoneinfo로 직접 계산
+- 현지 시각이 없거나(서머타임 시작) 두 번 있으면(서머타임 끝) datetime의 fold=0과 같게 앞의 오프셋을 씀
+"""
+import bisect
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+FROM_YEAR = 2000
+TO_YEAR = 2050
+
+DAY_SECONDS = 86400
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+EPOCH_ORDINAL = EPOCH.date().toordinal()
+
+
+def is_valid_timezone(name: str) -> bool:
+    """
+    >>> is_valid_timezone("Asia/Seoul")
+    True
+    >>> is_valid_timezone("Mars/Olympus_Mons")
+    False
+    """
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return False
+    return True
+
+
+def _epoch_seconds(year: int) -> int:
+    return (date(year, 1, 1).toordinal() - EPOCH_ORDINAL) * DAY_SECONDS
+
+
+class ZoneOffsetTable:
+    """
+    시간대 하나의 오프셋 변경 표
+
+    >>> table = ZoneOffsetTable("America/New_York", 2024, 2025)
+    >>> len(table.transitions)
+    2
+    >>> table.to_utc(date(2024, 3, 9), 9 * 3600)  # 표준시 (UTC-5)
+    datetime.datetime(2024, 3, 9, 14, 0, tzinfo=datetime.timezone.utc)
+    >>> table.to_utc(date(2024, 3, 11), 9 * 3600)  # 서머타임 (UTC-4)
+    datetime.datetime(2024, 3, 11, 13, 0, tzinfo=datetime.timezone.utc)
+    >>> table.to_utc(date(2024, 3, 10), 2 * 3600 + 1800)  # 없는 시각: fold=0처럼 표준시로 계산
+    datetime.datetime(2024, 3, 10, 7, 30, tzinfo=datetime.timezone.utc)
+    """
+    __slots__ = ("name", "zone", "start", "end", "transitions", "offsets", "local_boundaries")
+
+    def __init__(self, name: str, from_year: int = FROM_YEAR, to_year: int = TO_YEAR):
+        self.name = name
+        self.zone = ZoneInfo(name)
+        self.start = _epoch_seconds(from_year)
+        self.end = _epoch_seconds(to_year)
+
+        # 하루 간격으로 오프셋을 비교하고, 바뀐 날은 이분 탐색으로 바뀐 초를 찾음
+        offsets = [self._zone_offset(self.start)]
+        transitions = []
+        moment = self.start
+        while moment < self.end:
+            following = min(moment + DAY_SECONDS, self.end)
+            if self._zone_offset(following) == offsets[-1]:
+                moment = following
+                continue
+            low, high = moment, following
+            while high - low > 1:
+                middle = (low + high) // 2
+                if self._zone_offset(middle) == offsets[-1]:
+                    low = middle
+                else:
+                    high = middle
+            transitions.append(high)
+            offsets.append(self._zone_offset(high))
+            moment = high
+
+        self.transitions = transitions
+        self.offsets = offsets
+        # 현지 시각이 이 경계 이상이면 바뀐 뒤의 오프셋 (없는/겹치는 시각은 앞의 오프셋)
+        self.local_boundaries = [
+            moment + max(offsets[index], offsets[index + 1])
+            for index, moment in enumerate(transitions)
+        ]
+
+    def _zone_offset(self, utc_seconds: int) -> int:
+        moment = EPOCH + timedelta(seconds=utc_seconds)
+        return int(moment.astimezone(self.zone).utcoffset().total_seconds())
+
+    def offset_at(self, utc_seconds: int) -> int:
+        """UTC 시각(epoch 초)의 오프셋(초)"""
+        if not self.start <= utc_seconds < self.end:
+            return self._zone_offset(utc_seconds)
+        return self.offsets[bisect.bisect_right(self.transitions, utc_seconds)]
+
+    def local_offset(self, local_seconds: int) -> int:
+        """현지 벽시계 시각(UTC처럼 센 epoch 초)의 오프셋(초)"""
+        # 오프셋은 하루보다 작으므로 표 끝에서 하루 안쪽만 표로 찾음
+        if not self.start + DAY_SECONDS <= local_seconds < self.end - DAY_SECONDS:
+            local = (EPOCH + timedelta(seconds=local_seconds)).replace(tzinfo=self.zone)
+            return int(local.utcoffset().total_seconds())
+        return self.offsets[bisect.bisect_right(self.local_boundaries, local_seconds)]
+
+    def to_utc(self, day: date, seconds: int) -> datetime:
+        """현지 날짜 day의 seconds(하루 중 초) 시각 → UTC datetime"""
+        local_seconds = (day.toordinal() - EPOCH_ORDINAL) * DAY_SECONDS + seconds
+        return EPOCH + timedelta(seconds=local_seconds - self.local_offset(local_seconds))
+
+
+@lru_cache(maxsize=128)
+def get_zone_table(name: str) -> ZoneOffsetTable:
+    """시간대 이름 → 변환표 (시간대마다 한 번만 만듦)"""
+    return ZoneOffsetTable(name)
@@ -0,0 +1,278 @@
+"""
+동시 처리 제한(admission control)과 부하 차단(load shedding)
+
+- 요청을 경로 종류(auth: 비밀번호 해시, write: 쓰기, read: 읽기)로 나누고, 종류마다 동시에 처리하는 수를 제한
+  → 로그인/가입의 해시 계산이 몰려도 캘린더 조회는 자기 몫의 자리에서 계속 처리됨
+- 자리가 없으면 정해진 길이의 대기열에서 기다리고, 대기열이 가득 찼거나 기다릴 수 있는 시간을 넘기면
+  바로 503 + Retry-After로 돌려보냄 (클라이언트가 이미 포기했을 요청을 늦게 처리하지 않음)
+- 기다릴 수 있는 시간은 설정한 최대 대기 시간과 요청 헤더의 제한 시간(초) 중 짧은 쪽
+  제한 시간은 request.state.deadline(time.monotonic() 기준)으로 핸들러에도 넘김
+- SSE처럼 오래 열어 두는 경로(exempt_paths)는 제한하지 않음
+  요청 헤더(Accept 등)로 정하지 않음 → 클라이언트가 헤더만 바꿔서 제한을 건너뛸 수 없음
+"""
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Callable, Iterable
+
+from starlette.datastructures import Headers
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# 본문으로 조회 조건을 받느라 POST를 쓰는 조회 경로 (예: POST /calendars:batchGet)
+READ_PATH_SUFFIXES = (":batchGet",)
+
+
+class AdmissionRejected(Exception):
+    """대기열이 가득 찼거나 기다릴 수 있는 시간을 넘겼을 때"""
+
+
+class ConcurrencyLimiter:
+    """
+    동시에 max_concurrency개까지 처리하고, max_queue개까지 먼저 온 순서대로 기다리게 함
+
+    >>> async def main():
+    ...     limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=1)
+    ...     await limiter.acquire(1.0)
+    ...     waiting = asyncio.create_task(limiter.acquire(1.0))
+    ...     await asyncio.sleep(0)
+    ...     try:
+    ...         await limiter.acquire(1.0)
+    ...     except AdmissionRejected:
+    ...         print("shed", limiter.active, limiter.waiting)
+    ...     limiter.release()
+    ...     await waiting
+    ...     print("admitted", limiter.active, limiter.waiting)
+    >>> asyncio.run(main())
+    shed 1 1
+    admitted 1 0
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float) -> float:
+        """자리를 얻고 기다린 시간(초)을 반환 (못 얻으면 AdmissionRejected)"""
+        if self.active < self.max_concurrency and not self._waiters:
+            self.active += 1
+            return 0.0
+        if len(self._waiters) >= self.max_queue or timeout <= 0:
+            raise AdmissionRejected()
+
+        started_at = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # 자리를 넘겨받은 직후에 시간이 다 되었거나 연결이 끊김 → 자리를 돌려줌
+                self.release()
+            elif waiter in self._waiters:
+                # 취소된 뒤 release()가 먼저 꺼내 갔을 수도 있음
+                self._waiters.remove(waiter)
+            if isinstance(e, TimeoutError):
+                raise AdmissionRejected() from e
+            raise
+        return time.monotonic() - started_at
+
+    def release(self) -> None:
+        # 기다리는 요청이 있으면 자리를 그대로 넘김 (active는 그대로)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class AdmissionMetrics:
+    """
+    라우터의 경로 종류 하나에 대한 통계
+
+    queued: 자리가 없어서 기다렸다가 처리한 요청 수 / shed: 503으로 돌려보낸 요청 수
+    """
+
+    def __init__(self):
+        self.admitted = 0
+        self.queued = 0
+        self.shed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_admitted(self, waited: float) -> None:
+        self.admitted += 1
+        if waited > 0:
+            self.queued += 1
+            self.total_wait += waited
+            if waited > self.max_wait:
+                self.max_wait = waited
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        >>> metrics = AdmissionMetrics()
+        >>> metrics.record_admitted(0.0)
+        >>> metrics.record_admitted(0.5)
+        >>> metrics.shed += 1
+        >>> metrics.snapshot()
+        {'admitted': 2, 'queued': 1, 'shed': 1, 'avg_wait': 0.5, 'max_wait': 0.5}
+        """
+        return {
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+            "avg_wait": self.total_wait / self.queued if self.queued else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class AdmissionRegistry:
+    """(라우터, 경로 종류) → AdmissionMetrics"""
+
+    def __init__(self):
+        self._metrics: dict[tuple[str, str], AdmissionMetrics] = {}
+
+    def get(self, router: str, route_class: str) -> AdmissionMetrics:
+        key = (router, route_class)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._metrics[key] = AdmissionMetrics()
+        return metrics
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float]]]:
+        result: dict[str, dict[str, dict[str, float]]] = {}
+        for (router, route_class), metrics in sorted(self._metrics.items()):
+            result.setdefault(router, {})[route_class] = metrics.snapshot()
+        return result
+
+
+class RouteClassifier:
+    """
+    (메서드, 경로) → (라우터 이름, 경로 종류)
+    라우터에 속하지 않은 경로와 exempt_paths(라우터의 경로 형식)는 None → 제한하지 않음
+
+    >>> classify = RouteClassifier(
+    ...     {"account": "account_router", "bookings": "calendar_router", "calendar": "calendar_router"},
+    ...     ["/account/login"],
+    ...     ["/calendar/{host_username}/events"],
+    ... )
+    >>> classify("POST", "/account/login")
+    ('account_router', 'auth')
+    >>> classify("POST", "/bookings/puddingcamp")
+    ('calendar_router', 'write')
+    >>> classify("GET", "/bookings")
+    ('calendar_router', 'read')
+    >>> classify("POST", "/account/users:batchGet")
+    ('account_router', 'read')
+    >>> classify("GET", "/docs") is None
+    True
+    >>> classify("GET", "/calendar/puddingcamp/events") is None
+    True
+    >>> classify("GET", "/calendar/puddingcamp")
+    ('calendar_router', 'read')
+    """
+
+    def __init__(self, routers: dict[str, str], auth_paths: Iterable[str], exempt_paths: Iterable[str] = ()):
+        # 경로의 첫 마디 → 라우터 이름
+        self.routers = routers
+        self.auth_paths = frozenset(auth_paths)
+        self.exempt_paths = [compile_path(path)[0] for path in exempt_paths]
+
+    def __call__(self, method: str, path: str) -> tuple[str, str] | None:
+        router = self.routers.get(path.split("/", 2)[1] if path.startswith("/") else path)
+        if router is None or any(pattern.match(path) for pattern in self.exempt_paths):
+            return None
+        if path in self.auth_paths:
+            return router, "auth"
+        is_read = method in READ_METHODS or path.endswith(READ_PATH_SUFFIXES)
+        return router, "read" if is_read else "write"
+
+
+def parse_timeout(value: str | None) -> float | None:
+    """
+    >>> parse_timeout("1.5")
+    1.5
+    >>> parse_timeout("soon") is None
+    True
+    """
+    if value is None:
+        return None
+    try:
+        timeout = float(value)
+    except ValueError:
+        return None
+    return timeout if timeout >= 0 else None
+
+
+class AdmissionControlMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiters: dict[str, ConcurrencyLimiter],
+        classify: Callable[[str, str], tuple[str, str] | None],
+        registry: AdmissionRegistry,
+        max_queue_wait: float = 2.0,
+        retry_after: int = 1,
+        timeout_header: str = "x-request-timeout",
+    ):
+        self.app = app
+        self.limiters = limiters
+        self.classify = classify
+        self.registry = registry
+        self.max_queue_wait = max_queue_wait
+        self.retry_after = retry_after
+        self.timeout_header = timeout_header.lower()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        classified = self.classify(scope["method"], scope["path"])
+        if classified is None:
+            await self.app(scope, receive, send)
+            return
+
+        router, route_class = classified
+        limiter = self.limiters[route_class]
+        metrics = self.registry.get(router, route_class)
+
+        budget = self.max_queue_wait
+        timeout = parse_timeout(Headers(scope=scope).get(self.timeout_header))
+        if timeout is not None:
+            scope.setdefault("state", {})["deadline"] = time.monotonic() + timeout
+            budget = min(budget, timeout)
+
+        try:
+            waited = await limiter.acquire(budget)
+        except AdmissionRejected:
+            metrics.shed += 1
+            await self.reject(send)
+            return
+
+        metrics.record_admitted(waited)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def reject(self, send: Send) -> None:
+        body = json.dumps({"detail": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요."}, ensure_ascii=False).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(self.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
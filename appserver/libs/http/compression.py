@@ -0,0 +1,244 @@
+"""
+응답 압축 ASGI 미들웨어
+
+- 클라이언트의 Accept-Encoding과 서버가 쓸 수 있는 방식 중에서 고름
+  zstd(zstandard 패키지), br(brotli 패키지)는 설치되어 있을 때만 사용하고 gzip은 항상 사용
+- 본문이 minimum_size보다 작으면 압축하지 않음 (압축 이득보다 CPU와 헤더 비용이 큼)
+- 한 번에 보내는 응답은 통째로 압축해서 Content-Length를 다시 계산하고,
+  나눠 보내는 응답(StreamingResponse, SSE 등)은 조각마다 압축하고 flush해서 바로 내보냄
+- 이미 압축된 응답이나 JSON/텍스트가 아닌 응답은 그대로 보냄
+"""
+import zlib
+from typing import Callable, Iterable, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes:
+        """지금까지 넣은 데이터를 클라이언트가 풀 수 있도록 내보냄 (스트림은 계속됨)"""
+
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int = 6):
+        # wbits 16 + MAX_WBITS: gzip 헤더와 트레일러를 붙임
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int = 4):
+        # quality 11(기본값)은 응답마다 쓰기에는 너무 느림
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int = 3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+# Content-Encoding 이름 → 압축기
+COMPRESSORS: dict[str, Callable[[], Compressor]] = {"gzip": GzipCompressor}
+if brotli is not None:
+    COMPRESSORS["br"] = BrotliCompressor
+if zstandard is not None:
+    COMPRESSORS["zstd"] = ZstdCompressor
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/problem+json",
+    "image/svg+xml",
+)
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """
+    Accept-Encoding 헤더 → {방식: q 값}
+
+    >>> parse_accept_encoding("gzip, br;q=0.8, zstd;q=0")
+    {'gzip': 1.0, 'br': 0.8, 'zstd': 0.0}
+    >>> parse_accept_encoding("")
+    {}
+    """
+    result = {}
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        result[name] = q
+    return result
+
+
+def choose_encoding(header: str, available: Iterable[str]) -> str | None:
+    """
+    클라이언트가 받을 수 있는 방식 중 q 값이 가장 큰 것 (같으면 available 순서)
+
+    >>> choose_encoding("gzip, br", ["zstd", "br", "gzip"])
+    'br'
+    >>> choose_encoding("gzip;q=1, br;q=0.5", ["br", "gzip"])
+    'gzip'
+    >>> choose_encoding("*", ["br", "gzip"])
+    'br'
+    >>> choose_encoding("identity", ["br", "gzip"]) is None
+    True
+    """
+    accepted = parse_accept_encoding(header)
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """
+    >>> is_compressible("application/json")
+    True
+    >>> is_compressible("image/png")
+    False
+    """
+    return content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        encodings: Iterable[str] = ("zstd", "br", "gzip"),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        # 설치되지 않은 방식은 빼고, 나열한 순서를 우선순위로 사용
+        self.encodings = [encoding for encoding in encodings if encoding in COMPRESSORS]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """응답 하나를 압축해서 보냄 (http.response.start는 첫 본문 조각을 볼 때까지 미룸)"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self._start: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self._passthrough = (
+                message["status"] < 200
+                or message["status"] in (204, 304)
+                or "content-encoding" in headers
+                or not is_compressible(headers.get("content-type", ""))
+            )
+            if self._passthrough:
+                await self._send(message)
+            else:
+                self._start = message
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body and len(body) < self.minimum_size:
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self._compressor = COMPRESSORS[self.encoding]()
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                # 전체 길이를 모르므로 chunked 전송
+                del headers["Content-Length"]
+            else:
+                body = self._compressor.compress(body) + self._compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+            await self._send(start)
+
+        if more_body:
+            body = self._compressor.compress(body) + self._compressor.flush()
+        else:
+            body = self._compressor.compress(body) + self._compressor.finish()
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
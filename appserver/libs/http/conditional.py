@@ -0,0 +1,106 @@
+"""
+Last-Modified / If-Modified-Since 조건부 요청
+
+- 엔드포인트는 set_last_modified()로 응답에 Last-Modified만 붙임 (보통 updated_at 중 가장 최근 값)
+- ConditionalRequestMiddleware가 If-Modified-Since와 비교해서
+  바뀌지 않았으면 본문 없이 304 Not Modified로 바꿈
+  → 클라이언트가 이미 가진 응답은 다시 내려받지 않음
+"""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 304 응답에 남기는 헤더 (본문을 설명하는 헤더는 뺌)
+NOT_MODIFIED_HEADERS = ("cache-control", "content-location", "date", "etag", "expires", "last-modified", "vary")
+
+
+def format_http_date(value: datetime) -> str:
+    """
+    >>> format_http_date(datetime(2024, 12, 3, 9, 30, 15, 123456, tzinfo=timezone.utc))
+    'Tue, 03 Dec 2024 09:30:15 GMT'
+    """
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def parse_http_date(value: str) -> datetime | None:
+    """
+    >>> parse_http_date("Tue, 03 Dec 2024 09:30:15 GMT")
+    datetime.datetime(2024, 12, 3, 9, 30, 15, tzinfo=datetime.timezone.utc)
+    >>> parse_http_date("yesterday") is None
+    True
+    """
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def set_last_modified(response: Response, *timestamps: datetime | None) -> None:
+    """timestamps 중 가장 최근 값을 Last-Modified로 (값이 없으면 붙이지 않음)"""
+    values = [value for value in timestamps if value is not None]
+    if values:
+        response.headers["Last-Modified"] = format_http_date(max(values))
+
+
+def is_not_modified(last_modified: str, if_modified_since: str) -> bool:
+    """
+    HTTP 날짜는 초 단위이므로 초 단위로 비교
+
+    >>> is_not_modified("Tue, 03 Dec 2024 09:30:15 GMT", "Tue, 03 Dec 2024 09:30:15 GMT")
+    True
+    >>> is_not_modified("Tue, 03 Dec 2024 09:30:16 GMT", "Tue, 03 Dec 2024 09:30:15 GMT")
+    False
+    """
+    modified = parse_http_date(last_modified)
+    since = parse_http_date(if_modified_since)
+    return modified is not None and since is not None and modified <= since
+
+
+class ConditionalRequestMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        if_modified_since = request_headers.get("if-modified-since")
+        # If-None-Match가 있으면 If-Modified-Since는 무시 (RFC 9110 13.1.3)
+        if if_modified_since is None or "if-none-match" in request_headers:
+            await self.app(scope, receive, send)
+            return
+
+        not_modified = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal not_modified
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                last_modified = headers.get("last-modified")
+                if (
+                    message["status"] == 200
+                    and last_modified is not None
+                    and is_not_modified(last_modified, if_modified_since)
+                ):
+                    not_modified = True
+                    kept = MutableHeaders()
+                    for key, value in headers.items():
+                        if key in NOT_MODIFIED_HEADERS:
+                            kept.append(key, value)
+                    await send({"type": "http.response.start", "status": 304, "headers": kept.raw})
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+            elif not_modified:
+                # 본문은 버림
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,146 @@
+"""
+응답 필드 고르기 (sparse fieldsets, `?fields=when,topic,time_slot.start_time`)
+
+- 필드 이름은 응답 스키마(pydantic 모델)에서 확인하고, 중첩 모델은 점(.)으로 고름
+  중첩 모델 이름만 쓰면 그 모델의 필드 전체
+- 고른 필드만 DB에서 읽도록 paths()로 (필드 경로 → 열) 목록을 만들고,
+  조회 결과 행은 dump_row()로 응답 JSON 모양에 맞춰 바꿈
+  → 큰 필드(설명 등)를 읽지도 보내지도 않음
+- 열 이름(label)은 경로를 "__"로 이은 것 (예: time_slot__start_time)
+- 고른 필드만 담은 응답은 partial_model()로 만든 모델(모든 필드가 선택 사항)로 검증하고,
+  엔드포인트의 response_model에도 함께 적어서 OpenAPI 문서에 나타나게 함
+"""
+from functools import lru_cache
+from typing import Any, Iterator, Mapping
+
+from pydantic import BaseModel, Field, create_model
+
+LABEL_SEPARATOR = "__"
+
+
+def _nested_model(schema: type[BaseModel], name: str) -> type[BaseModel] | None:
+    annotation = schema.model_fields[name].annotation
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+@lru_cache(maxsize=None)
+def partial_model(schema: type[BaseModel]) -> type[BaseModel]:
+    """
+    schema의 필드를 모두 선택 사항으로 바꾼 모델 (중첩 모델도, 타입은 그대로)
+
+    >>> class SlotOut(BaseModel):
+    ...     start_time: str
+    >>> class ItemOut(BaseModel):
+    ...     when: str
+    ...     slot: SlotOut
+    >>> PartialItemOut = partial_model(ItemOut)
+    >>> PartialItemOut.__name__
+    'PartialItemOut'
+    >>> PartialItemOut.model_validate({"slot": {}}).model_dump(exclude_unset=True)
+    {'slot': {}}
+    """
+    fields = {}
+    for name, field in schema.model_fields.items():
+        nested = _nested_model(schema, name)
+        annotation = partial_model(nested) if nested is not None else field.annotation
+        fields[name] = (annotation, Field(default=None, description=field.description))
+    return create_model(f"Partial{schema.__name__}", __module__=schema.__module__, **fields)
+
+
+class FieldSelection:
+    """
+    >>> from pydantic import BaseModel
+    >>> class SlotOut(BaseModel):
+    ...     start_time: str
+    ...     end_time: str
+    >>> class ItemOut(BaseModel):
+    ...     when: str
+    ...     description: str
+    ...     slot: SlotOut
+    >>> selection = FieldSelection.parse("slot.start_time, when", ItemOut)
+    >>> [label(path) for path in selection.paths()]
+    ['when', 'slot__start_time']
+    >>> selection.dump_row({"when": "2024-12-03", "slot__start_time": "09:00", "description": "..."})
+    {'when': '2024-12-03', 'slot': {'start_time': '09:00'}}
+    >>> [label(path) for path in FieldSelection.parse("slot", ItemOut).paths()]
+    ['slot__start_time', 'slot__end_time']
+    >>> FieldSelection.parse("when,secret", ItemOut)
+    Traceback (most recent call last):
+    ...
+    ValueError: 알 수 없는 필드입니다: secret
+    """
+    __slots__ = ("schema", "fields")
+
+    def __init__(self, schema: type[BaseModel], fields: dict[str, "FieldSelection | None"]):
+        self.schema = schema
+        # 필드 이름 → 중첩 모델에서 고른 필드 (스칼라 필드는 None), 스키마의 필드 순서
+        self.fields = {name: fields[name] for name in schema.model_fields if name in fields}
+
+    @classmethod
+    def all(cls, schema: type[BaseModel]) -> "FieldSelection":
+        return cls(schema, {
+            name: cls.all(nested) if (nested := _nested_model(schema, name)) else None
+            for name in schema.model_fields
+        })
+
+    @classmethod
+    def parse(cls, value: str, schema: type[BaseModel]) -> "FieldSelection":
+        """쉼표로 나눈 필드 경로 (틀린 이름이 있으면 ValueError)"""
+        tree: dict[str, Any] = {}
+        for item in value.split(","):
+            path = item.strip()
+            if not path:
+                continue
+            node = tree
+            for name in path.split("."):
+                node = node.setdefault(name, {})
+        if not tree:
+            raise ValueError("필드를 하나 이상 고르세요.")
+        return cls._from_tree(tree, schema, "")
+
+    @classmethod
+    def _from_tree(cls, tree: dict[str, Any], schema: type[BaseModel], prefix: str) -> "FieldSelection":
+        fields: dict[str, FieldSelection | None] = {}
+        for name, children in tree.items():
+            if name not in schema.model_fields:
+                raise ValueError(f"알 수 없는 필드입니다: {prefix}{name}")
+            nested = _nested_model(schema, name)
+            if nested is None:
+                if children:
+                    raise ValueError(f"하위 필드가 없는 필드입니다: {prefix}{name}")
+                fields[name] = None
+            elif children:
+                fields[name] = cls._from_tree(children, nested, f"{prefix}{name}.")
+            else:
+                fields[name] = cls.all(nested)
+        return cls(schema, fields)
+
+    def paths(self) -> Iterator[tuple[str, ...]]:
+        """고른 스칼라 필드의 경로 (스키마의 필드 순서)"""
+        for name, nested in self.fields.items():
+            if nested is None:
+                yield (name,)
+            else:
+                for path in nested.paths():
+                    yield (name, *path)
+
+    def nest_row(self, row: Mapping[str, Any], prefix: str = "") -> dict[str, Any]:
+        """label(path)로 이름 붙인 열 값 → 응답 모양의 dict (고른 필드만)"""
+        result = {}
+        for name, nested in self.fields.items():
+            if nested is None:
+                result[name] = row[prefix + name]
+            else:
+                result[name] = nested.nest_row(row, f"{prefix}{name}{LABEL_SEPARATOR}")
+        return result
+
+    def dump_row(self, row: Mapping[str, Any]) -> dict[str, Any]:
+        """label(path)로 이름 붙인 열 값 → partial_model(schema)로 검증한 응답 JSON 값"""
+        item = partial_model(self.schema).model_validate(self.nest_row(row))
+        return item.model_dump(mode="json", exclude_unset=True)
+
+
+def label(path: tuple[str, ...]) -> str:
+    return LABEL_SEPARATOR.join(path)
@@ -0,0 +1,229 @@
+"""
+Idempotency-Key 미들웨어
+
+- 클라이언트가 시간 초과 등으로 같은 요청을 다시 보낼 때 Idempotency-Key 헤더에 같은 값을 붙이면
+  핸들러를 다시 실행하지 않고 처음 응답을 그대로 돌려줌 (Idempotent-Replayed: true 헤더를 붙임)
+- 키는 메서드, 경로, 인증 정보(쿠키/Authorization)와 함께 해시해서 저장 → 다른 사용자의 응답을 돌려주지 않음
+- 같은 키에 다른 본문을 보내면 422
+- 같은 키의 요청이 동시에 오면
+  - 같은 워커: 키마다 잠금을 두고 먼저 온 요청이 끝날 때까지 기다렸다가 그 응답을 돌려줌
+  - 다른 워커: 저장소의 예약을 보고 409 + Retry-After
+- 5xx 응답이나 예외는 저장하지 않음 → 같은 키로 다시 시도하면 다시 실행함
+"""
+import asyncio
+import hashlib
+import json
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import Headers
+from starlette.requests import cookie_parser
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .store import IdempotencyStore, StoredResponse
+
+MAX_KEY_LENGTH = 255
+REPLAYED_HEADER = (b"idempotent-replayed", b"true")
+
+
+class KeyLocks:
+    """
+    키마다 asyncio.Lock (기다리는 요청이 없으면 지움)
+
+    >>> async def main():
+    ...     locks = KeyLocks()
+    ...     async with locks.hold("a"):
+    ...         print(len(locks))
+    ...     print(len(locks))
+    >>> asyncio.run(main())
+    1
+    0
+    """
+
+    def __init__(self):
+        # key → (잠금, 잠금을 쓰는 요청 수)
+        self._locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        lock, users = self._locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[key]
+            if users == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, users - 1)
+
+
+def compile_routes(routes: Iterable[str]) -> list[tuple[str, re.Pattern]]:
+    """
+    "메서드 경로" 목록 → (메서드, 경로 정규식)
+
+    >>> [(method, bool(pattern.match("/bookings/puddingcamp"))) for method, pattern in compile_routes(["POST /bookings/{host_username}"])]
+    [('POST', True)]
+    """
+    compiled = []
+    for route in routes:
+        method, path = route.split(maxsplit=1)
+        path_regex, _, _ = compile_path(path)
+        compiled.append((method.upper(), path_regex))
+    return compiled
+
+
+def hash_parts(*parts: bytes) -> str:
+    """
+    >>> hash_parts(b"POST", b"/account/signup") == hash_parts(b"POST", b"/account/signup")
+    True
+    >>> hash_parts(b"a", b"bc") == hash_parts(b"ab", b"c")
+    False
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(4, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+async def read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+class IdempotencyMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: IdempotencyStore,
+        routes: Iterable[str],
+        header: str = "Idempotency-Key",
+        auth_cookie: str = "auth_token",
+        retry_after: int = 1,
+    ):
+        self.app = app
+        self.store = store
+        self.routes = compile_routes(routes)
+        self.header = header.lower()
+        self.auth_cookie = auth_cookie
+        self.retry_after = retry_after
+        self.locks = KeyLocks()
+
+    def matches(self, method: str, path: str) -> bool:
+        return any(method == route_method and pattern.match(path) for route_method, pattern in self.routes)
+
+    def scoped_key(self, scope: Scope, headers: Headers, idempotency_key: str) -> str:
+        cookies = cookie_parser(headers.get("cookie", ""))
+        return hash_parts(
+            scope["method"].encode(),
+            scope["path"].encode(),
+            cookies.get(self.auth_cookie, "").encode(),
+            headers.get("authorization", "").encode(),
+            idempotency_key.encode(),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.matches(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get(self.header)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await self.error(send, 400, f"{self.header} 헤더는 1~{MAX_KEY_LENGTH}자여야 합니다.")
+            return
+
+        body = await read_body(receive)
+        key = self.scoped_key(scope, headers, idempotency_key)
+        fingerprint = hash_parts(body)
+        session_factory = scope["app"].state.session_factory
+
+        async with self.locks.hold(key), session_factory() as db_session:
+            stored = await self.store.get(key, db_session)
+            if stored is None and not await self.store.reserve(key, fingerprint, db_session):
+                # 다른 워커가 방금 예약함
+                stored = await self.store.get(key, db_session)
+            if stored is not None:
+                if stored.fingerprint != fingerprint:
+                    await self.error(send, 422, f"{self.header}가 다른 요청에 이미 쓰였습니다.")
+                elif stored.response is None:
+                    await self.error(send, 409, "같은 요청을 처리하고 있습니다. 잠시 후 다시 시도하세요.")
+                else:
+                    await self.replay(send, stored.response)
+                return
+
+            response = await self.run(scope, body, receive, send, key, db_session)
+            if response is not None and response.status_code < 500:
+                await self.store.complete(key, fingerprint, response, db_session)
+            else:
+                await self.store.release(key, db_session)
+
+    async def run(
+        self, scope: Scope, body: bytes, receive: Receive, send: Send, key: str, db_session: AsyncSession
+    ) -> StoredResponse | None:
+        """핸들러를 실행하며 응답을 모아 둠 (예외가 나면 예약을 풀고 다시 던짐)"""
+        body_sent = False
+        response: StoredResponse | None = None
+        chunks: list[bytes] = []
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response
+            if message["type"] == "http.response.start":
+                response = StoredResponse(message["status"], list(message.get("headers", ())), b"")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except BaseException:
+            await self.store.release(key, db_session)
+            raise
+        if response is not None:
+            response.body = b"".join(chunks)
+        return response
+
+    async def replay(self, send: Send, response: StoredResponse) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [*response.headers, REPLAYED_HEADER],
+        })
+        await send({"type": "http.response.body", "body": response.body})
+
+    async def error(self, send: Send, status_code: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}, ensure_ascii=False).encode()
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        if status_code == 409:
+            headers.append((b"retry-after", str(self.retry_after).encode()))
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
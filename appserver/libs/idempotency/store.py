@@ -0,0 +1,247 @@
+"""
+Idempotency-Key로 처리한 요청의 응답 저장소
+
+- 키마다 요청 본문의 지문(fingerprint)과 응답(상태 코드, 헤더, 본문)을 ttl 동안 보관
+- 처리 중인 키는 응답 없이 먼저 예약(reserve)해 둠 → 다른 워커가 같은 키를 받으면 처리 중임을 알 수 있음
+  (워커가 죽어서 남은 예약은 in_flight_ttl이 지나면 없는 것으로 봄)
+- database 저장소도 자주 쓰는 응답은 프로세스 안 LRU에 두고, 없을 때만 테이블을 읽음
+
+db_session은 요청과 별개인 DB 세션으로, DB에 저장하는 구현에서만 사용 (쓰기 메서드는 직접 커밋)
+"""
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable
+
+from pydantic import AwareDatetime
+from sqlalchemy import LargeBinary
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy_utc import UtcDateTime
+from sqlmodel import JSON, Field, SQLModel, delete, select, update
+if TYPE_CHECKING:
+    from appserver.settings import Settings
+
+
+class IdempotencyRecord(SQLModel, table=True):
+    """Idempotency-Key로 처리한 요청 (status_code가 없으면 처리 중)"""
+    __tablename__ = "idempotency_keys"
+
+    key: str = Field(primary_key=True, max_length=64, description="메서드, 경로, 인증 정보, 키의 해시")
+    fingerprint: str = Field(max_length=64, description="요청 본문의 해시")
+    status_code: int | None = Field(default=None)
+    headers: list | None = Field(default=None, sa_type=JSON)
+    body: bytes | None = Field(default=None, sa_type=LargeBinary)
+    expires_at: AwareDatetime = Field(sa_type=UtcDateTime, nullable=False, index=True)
+
+
+class StoredResponse:
+    __slots__ = ("status_code", "headers", "body")
+
+    def __init__(self, status_code: int, headers: list[tuple[bytes, bytes]], body: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+    def headers_to_json(self) -> list[list[str]]:
+        return [[key.decode("latin-1"), value.decode("latin-1")] for key, value in self.headers]
+
+    @classmethod
+    def from_record(cls, record: IdempotencyRecord) -> "StoredResponse":
+        headers = [(key.encode("latin-1"), value.encode("latin-1")) for key, value in record.headers or ()]
+        return cls(record.status_code, headers, record.body or b"")
+
+
+class StoredRequest:
+    """저장한 요청의 지문과 응답 (response가 None이면 다른 곳에서 처리 중)"""
+    __slots__ = ("fingerprint", "response")
+
+    def __init__(self, fingerprint: str, response: StoredResponse | None = None):
+        self.fingerprint = fingerprint
+        self.response = response
+
+
+class IdempotencyStore(ABC):
+    def __init__(self, ttl: timedelta, in_flight_ttl: timedelta):
+        self.ttl = ttl
+        self.in_flight_ttl = in_flight_ttl
+
+    @abstractmethod
+    async def get(self, key: str, db_session: AsyncSession) -> StoredRequest | None:
+        """저장한 요청 (없거나 만료되었으면 None)"""
+
+    @abstractmethod
+    async def reserve(self, key: str, fingerprint: str, db_session: AsyncSession) -> bool:
+        """처리 중으로 예약 (다른 곳에서 먼저 예약했으면 False)"""
+
+    @abstractmethod
+    async def complete(
+        self, key: str, fingerprint: str, response: StoredResponse, db_session: AsyncSession
+    ) -> None:
+        """응답을 저장하고 ttl 동안 보관"""
+
+    @abstractmethod
+    async def release(self, key: str, db_session: AsyncSession) -> None:
+        """응답을 저장하지 않고 예약을 풂 (같은 키로 다시 처리할 수 있음)"""
+
+    @abstractmethod
+    async def purge_expired(self, db_session: AsyncSession) -> int:
+        """만료된 키를 지우고 지운 개수를 반환"""
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """
+    프로세스 안 저장소 (max_entries를 넘으면 가장 오래 쓰지 않은 키부터 버림)
+
+    같은 키의 요청은 미들웨어가 프로세스 안에서 하나씩 처리하므로 따로 예약하지 않음
+
+    >>> import asyncio
+    >>> store = MemoryIdempotencyStore(timedelta(hours=1), timedelta(minutes=1), max_entries=1)
+    >>> asyncio.run(store.complete("a", "f", StoredResponse(201, [], b"{}"), None))
+    >>> asyncio.run(store.get("a", None)).response.status_code
+    201
+    >>> asyncio.run(store.complete("b", "f", StoredResponse(201, [], b"{}"), None))
+    >>> asyncio.run(store.get("a", None)) is None
+    True
+    """
+
+    def __init__(
+        self,
+        ttl: timedelta,
+        in_flight_ttl: timedelta,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(ttl, in_flight_ttl)
+        self.max_entries = max_entries
+        self._clock = clock
+        # key → (요청, 만료 시각)
+        self._entries: OrderedDict[str, tuple[StoredRequest, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str) -> StoredRequest | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        stored, expires_at = item
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return stored
+
+    def _set(self, key: str, stored: StoredRequest, expires_at: float) -> None:
+        self._entries[key] = (stored, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str, db_session: AsyncSession) -> StoredRequest | None:
+        return self._get(key)
+
+    async def reserve(self, key: str, fingerprint: str, db_session: AsyncSession) -> bool:
+        return True
+
+    async def complete(
+        self, key: str, fingerprint: str, response: StoredResponse, db_session: AsyncSession
+    ) -> None:
+        self._set(key, StoredRequest(fingerprint, response), self._clock() + self.ttl.total_seconds())
+
+    async def release(self, key: str, db_session: AsyncSession) -> None:
+        self._entries.pop(key, None)
+
+    async def purge_expired(self, db_session: AsyncSession) -> int:
+        now = self._clock()
+        expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+
+class DatabaseIdempotencyStore(MemoryIdempotencyStore):
+    """
+    idempotency_keys 테이블에 저장하는 저장소 (워커끼리 공유, 재시작해도 남음)
+
+    - 처리를 마친 응답은 프로세스 안 LRU에도 두고 먼저 찾음 (바뀌지 않으므로 워커마다 캐시해도 됨)
+    - 예약은 기본 키 INSERT로 하므로 같은 키를 동시에 받은 워커 중 하나만 성공함
+    """
+
+    async def get(self, key: str, db_session: AsyncSession) -> StoredRequest | None:
+        stored = self._get(key)
+        if stored is not None:
+            return stored
+
+        stmt = (
+            select(IdempotencyRecord)
+            .where(IdempotencyRecord.key == key)
+            .where(IdempotencyRecord.expires_at > datetime.now(timezone.utc))
+        )
+        record = (await db_session.execute(stmt)).scalar_one_or_none()
+        if record is None:
+            return None
+        if record.status_code is None:
+            return StoredRequest(record.fingerprint)
+        stored = StoredRequest(record.fingerprint, StoredResponse.from_record(record))
+        self._set(key, stored, record.expires_at.timestamp())
+        return stored
+
+    async def reserve(self, key: str, fingerprint: str, db_session: AsyncSession) -> bool:
+        now = datetime.now(timezone.utc)
+        # 만료된 예약/응답이 남아 있으면 지우고 새로 예약
+        await db_session.execute(
+            delete(IdempotencyRecord)
+            .where(IdempotencyRecord.key == key)
+            .where(IdempotencyRecord.expires_at <= now)
+        )
+        db_session.add(IdempotencyRecord(key=key, fingerprint=fingerprint, expires_at=now + self.in_flight_ttl))
+        try:
+            await db_session.commit()
+        except IntegrityError:
+            await db_session.rollback()
+            return False
+        return True
+
+    async def complete(
+        self, key: str, fingerprint: str, response: StoredResponse, db_session: AsyncSession
+    ) -> None:
+        expires_at = datetime.now(timezone.utc) + self.ttl
+        stmt = (
+            update(IdempotencyRecord)
+            .where(IdempotencyRecord.key == key)
+            .values(
+                status_code=response.status_code,
+                headers=response.headers_to_json(),
+                body=response.body,
+                expires_at=expires_at,
+            )
+        )
+        await db_session.execute(stmt)
+        await db_session.commit()
+        self._set(key, StoredRequest(fingerprint, response), expires_at.timestamp())
+
+    async def release(self, key: str, db_session: AsyncSession) -> None:
+        stmt = (
+            delete(IdempotencyRecord)
+            .where(IdempotencyRecord.key == key)
+            .where(IdempotencyRecord.status_code.is_(None))
+        )
+        await db_session.execute(stmt)
+        await db_session.commit()
+
+    async def purge_expired(self, db_session: AsyncSession) -> int:
+        await super().purge_expired(db_session)
+        stmt = delete(IdempotencyRecord).where(IdempotencyRecord.expires_at <= datetime.now(timezone.utc))
+        result = await db_session.execute(stmt)
+        await db_session.commit()
+        return result.rowcount
+
+
+def create_idempotency_store(settings: "Settings") -> IdempotencyStore:
+    ttl = timedelta(hours=settings.idempotency_ttl_hours)
+    in_flight_ttl = timedelta(seconds=settings.idempotency_in_flight_seconds)
+    if settings.idempotency_store == "database":
+        return DatabaseIdempotencyStore(ttl, in_flight_ttl, max_entries=settings.idempotency_cache_max_entries)
+    return MemoryIdempotencyStore(ttl, in_flight_ttl, max_entries=settings.idempotency_cache_max_entries)
@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Protocol
+
+
+class KeyValueStore(Protocol):
+    """
+    여러 워커가 함께 쓰는 키-값 저장소(예: Redis)가 갖춰야 할 인터페이스
+
+    compare_and_set()은 값이 expected 그대로일 때만 value로 바꾸고 True를 반환해야 합니다.
+    (Redis라면 WATCH/MULTI 또는 Lua 스크립트로 구현)
+    """
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def compare_and_set(
+        self, key: str, expected: Any | None, value: Any, ttl: float | None = None
+    ) -> bool: ...
+
+
+class LocalKeyValueStore:
+    """
+    프로세스 안에서만 쓰는 KeyValueStore 구현 (테스트와 단일 워커용)
+
+    - 키마다 만료 시간(ttl)을 둘 수 있음
+    - max_entries를 넘으면 가장 오래 쓰지 않은 키부터 버림(LRU)
+
+    >>> import asyncio
+    >>> store = LocalKeyValueStore(max_entries=2)
+    >>> asyncio.run(store.set("a", 1))
+    >>> asyncio.run(store.set("b", 2))
+    >>> asyncio.run(store.set("c", 3))
+    >>> asyncio.run(store.get("a")) is None
+    True
+    >>> asyncio.run(store.compare_and_set("b", 2, 20))
+    True
+    >>> asyncio.run(store.compare_and_set("b", 2, 200))
+    False
+    """
+
+    def __init__(self, max_entries: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        # key → (value, expires_at)
+        self._data: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+
+    def _get(self, key: str) -> Any | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: Any, ttl: float | None) -> None:
+        expires_at = None if ttl is None else self._clock() + ttl
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def get(self, key: str) -> Any | None:
+        return self._get(key)
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self._set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def compare_and_set(
+        self, key: str, expected: Any | None, value: Any, ttl: float | None = None
+    ) -> bool:
+        # 이벤트 루프 하나 안에서는 await 없이 실행되므로 원자적으로 동작함
+        if self._get(key) != expected:
+            return False
+        self._set(key, value, ttl)
+        return True
@@ -0,0 +1,178 @@
+"""
+큰 테이블을 오래 잠그지 않고 스키마를 바꾸기 위한 Alembic 마이그레이션 도우미
+
+- create_index_online(): PostgreSQL은 CREATE INDEX CONCURRENTLY, 그 외는 일반 인덱스 생성
+- batch_alter_table(): SQLite처럼 ALTER를 제대로 지원하지 않는 DB에서 테이블을 다시 만들어 변경
+- run_backfill(): 기본 키 구간 단위로 나눠 UPDATE하고 구간마다 커밋
+  → 중간에 멈춰도 체크포인트(migration_checkpoints 테이블)부터 이어서 실행
+"""
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+CHECKPOINT_TABLE = "migration_checkpoints"
+
+checkpoint_metadata = sa.MetaData()
+migration_checkpoints = sa.Table(
+    CHECKPOINT_TABLE,
+    checkpoint_metadata,
+    sa.Column("name", sa.String(128), primary_key=True),
+    sa.Column("last_key", sa.BigInteger(), nullable=False),
+)
+
+# progress(처리한 행 수, 마지막 키, 최대 키, 경과 시간(초))
+ProgressCallback = Callable[[int, int, int, float], None]
+
+
+def log_progress(done: int, last_key: int, max_key: int, elapsed: float) -> None:
+    percent = 100 * last_key / max_key if max_key else 100
+    logger.info("backfill: %d rows, key %d/%d (%.1f%%), %.1fs", done, last_key, max_key, percent, elapsed)
+
+
+def _op():
+    # alembic.op은 마이그레이션 실행 중에만 쓸 수 있으므로 사용할 때 가져옴
+    from alembic import op
+    return op
+
+
+def create_index_online(
+    index_name: str,
+    table_name: str,
+    columns: list[str],
+    **kwargs: Any,
+) -> None:
+    """
+    테이블 쓰기를 막지 않고 인덱스를 만듦
+
+    PostgreSQL의 CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로
+    autocommit 구간에서 실행합니다.
+    SQLite에는 동시 인덱스 생성이 없어서 일반 CREATE INDEX로 만들지만,
+    SQLite의 인덱스 생성은 전체 테이블을 다시 쓰지 않으므로 충분히 빠릅니다.
+    """
+    op = _op()
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                index_name, table_name, columns,
+                postgresql_concurrently=True, if_not_exists=True, **kwargs,
+            )
+    else:
+        op.create_index(index_name, table_name, columns, if_not_exists=True, **kwargs)
+
+
+def drop_index_online(index_name: str, table_name: str) -> None:
+    op = _op()
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+    else:
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
+
+
+@contextmanager
+def batch_alter_table(table_name: str, **kwargs: Any) -> Iterator[Any]:
+    """
+    SQLite에서는 새 테이블을 만들어 복사한 뒤 바꿔 끼우고(batch mode),
+    ALTER를 지원하는 DB에서는 그대로 ALTER 문을 실행
+    """
+    with _op().batch_alter_table(table_name, recreate="auto", **kwargs) as batch_op:
+        yield batch_op
+
+
+def _load_checkpoint(connection: Connection, name: str) -> int | None:
+    checkpoint_metadata.create_all(connection, checkfirst=True)
+    stmt = sa.select(migration_checkpoints.c.last_key).where(migration_checkpoints.c.name == name)
+    return connection.execute(stmt).scalar_one_or_none()
+
+
+def _save_checkpoint(connection: Connection, name: str, last_key: int, exists: bool) -> None:
+    if exists:
+        stmt = (
+            migration_checkpoints.update()
+            .where(migration_checkpoints.c.name == name)
+            .values(last_key=last_key)
+        )
+    else:
+        stmt = migration_checkpoints.insert().values(name=name, last_key=last_key)
+    connection.execute(stmt)
+
+
+def _clear_checkpoint(connection: Connection, name: str) -> None:
+    connection.execute(migration_checkpoints.delete().where(migration_checkpoints.c.name == name))
+
+
+def backfill_in_chunks(
+    connection: Connection,
+    table_name: str,
+    values: dict[str, Any],
+    *,
+    where: sa.ColumnElement[bool] | None = None,
+    key: str = "id",
+    chunk_size: int = 10_000,
+    checkpoint: str | None = None,
+    progress: ProgressCallback | None = log_progress,
+) -> int:
+    """
+    기본 키(key) 구간을 chunk_size씩 나눠 UPDATE
+
+    connection은 autocommit 모드여야 구간마다 바로 커밋됩니다. (run_backfill() 참고)
+    checkpoint 이름을 주면 구간을 마칠 때마다 마지막 키를 기록하고,
+    다시 실행하면 기록한 키 다음부터 이어서 처리합니다.
+    values의 값에는 SQL 식(예: sa.func.lower(sa.column("username")))을 쓸 수 있습니다.
+    반환값: 변경한 행 수
+    """
+    table = sa.table(table_name, sa.column(key), *[sa.column(name) for name in values])
+    key_column = table.c[key]
+
+    max_key = connection.execute(sa.select(sa.func.max(key_column))).scalar()
+    if max_key is None:
+        return 0
+
+    last_key = 0
+    has_checkpoint = False
+    if checkpoint is not None:
+        saved = _load_checkpoint(connection, checkpoint)
+        if saved is not None:
+            last_key, has_checkpoint = saved, True
+
+    done = 0
+    started_at = time.perf_counter()
+    while last_key < max_key:
+        upper = min(last_key + chunk_size, max_key)
+        stmt = (
+            sa.update(table)
+            .where(key_column > last_key)
+            .where(key_column <= upper)
+            .values(values)
+        )
+        if where is not None:
+            stmt = stmt.where(where)
+        done += connection.execute(stmt).rowcount
+        last_key = upper
+
+        if checkpoint is not None:
+            _save_checkpoint(connection, checkpoint, last_key, has_checkpoint)
+            has_checkpoint = True
+        if progress is not None:
+            progress(done, last_key, max_key, time.perf_counter() - started_at)
+
+    if checkpoint is not None:
+        _clear_checkpoint(connection, checkpoint)
+    return done
+
+
+def run_backfill(table_name: str, values: dict[str, Any], **kwargs: Any) -> int:
+    """
+    마이그레이션 안에서 backfill_in_chunks()를 autocommit 모드로 실행
+    checkpoint 이름을 주지 않으면 "테이블명:컬럼명들"을 체크포인트 이름으로 사용
+    """
+    op = _op()
+    kwargs.setdefault("checkpoint", f"{table_name}:{','.join(sorted(values))}")
+    with op.get_context().autocommit_block():
+        return backfill_in_chunks(op.get_bind(), table_name, values, **kwargs)
@@ -0,0 +1,45 @@
+from typing import Any, Callable, Protocol
+
+Deliver = Callable[[str, dict[str, Any]], Any]
+
+
+class Broker(Protocol):
+    """
+    여러 워커가 이벤트를 함께 받는 메시지 브로커(예: Redis Pub/Sub, PostgreSQL LISTEN/NOTIFY)가 갖춰야 할 인터페이스
+
+    start()로 받은 deliver를 이 워커에 온 메시지(자신이 보낸 것 포함)마다 한 번씩 불러야 합니다.
+    메시지는 JSON으로 바꿀 수 있는 dict입니다.
+    """
+
+    async def start(self, deliver: Deliver) -> None: ...
+
+    async def publish(self, topic: str, message: dict[str, Any]) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class LocalBroker:
+    """
+    프로세스 안에서만 전달하는 Broker 구현 (테스트와 단일 워커용)
+
+    >>> import asyncio
+    >>> received = []
+    >>> broker = LocalBroker()
+    >>> asyncio.run(broker.start(lambda topic, message: received.append((topic, message))))
+    >>> asyncio.run(broker.publish("calendar:1", {"type": "ping"}))
+    >>> received
+    [('calendar:1', {'type': 'ping'})]
+    """
+
+    def __init__(self):
+        self._deliver: Deliver | None = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def publish(self, topic: str, message: dict[str, Any]) -> None:
+        if self._deliver is not None:
+            self._deliver(topic, message)
+
+    async def close(self) -> None:
+        self._deliver = None
@@ -0,0 +1,113 @@
+"""
+DB 테이블(event_messages)로 워커끼리 이벤트를 나누는 Broker
+
+- 발행하면 행을 하나 INSERT하고, 워커마다 poll_interval초 간격으로 마지막으로 읽은 id 다음 행을 읽어 전달
+  → 다른 워커에 연결된 구독자도 이벤트를 받음 (발행한 워커도 같은 방법으로 받음)
+- 시작할 때는 가장 최근 id부터 읽음 → 재시작한 워커가 지난 이벤트를 다시 보내지 않음
+- 다 읽은 행은 purge_expired()로 지움 (appserver.maintenance의 리더 전용 작업)
+- PostgreSQL에서 동시에 INSERT한 행은 id 순서와 다르게 커밋될 수 있어서, 드물게 이벤트를 놓칠 수 있음
+  (SQLite는 쓰기가 한 번에 하나씩이라 id 순서대로 커밋됨)
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from pydantic import AwareDatetime
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy_utc import UtcDateTime
+from sqlmodel import JSON, Field, SQLModel, delete, select
+
+from .broker import Deliver
+
+logger = logging.getLogger(__name__)
+
+
+class EventMessage(SQLModel, table=True):
+    __tablename__ = "event_messages"
+    # 지운 행의 id를 다시 쓰면 워커가 새 이벤트를 읽지 못하므로 SQLite에서도 id가 늘기만 하게 함
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: int = Field(default=None, primary_key=True)
+    topic: str = Field(max_length=128)
+    message: dict = Field(sa_type=JSON)
+    created_at: AwareDatetime = Field(
+        default=None,
+        nullable=False,
+        sa_type=UtcDateTime,
+        index=True,
+        sa_column_kwargs={"server_default": func.now()},
+    )
+
+
+class DatabaseBroker:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        poll_interval: float = 0.5,
+        retention: timedelta = timedelta(minutes=5),
+        batch_size: int = 500,
+    ):
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.batch_size = batch_size
+        self._deliver: Deliver | None = None
+        self._last_id = 0
+        self._task: asyncio.Task | None = None
+
+    async def start(self, deliver: Deliver) -> None:
+        async with self.session_factory() as session:
+            last_id = (await session.execute(select(func.max(EventMessage.id)))).scalar_one_or_none()
+        self._last_id = last_id or 0
+        self._deliver = deliver
+        self._task = asyncio.create_task(self._loop())
+
+    async def publish(self, topic: str, message: dict[str, Any]) -> None:
+        async with self.session_factory() as session:
+            session.add(EventMessage(topic=topic, message=message))
+            await session.commit()
+
+    async def poll(self) -> int:
+        """마지막으로 읽은 id 다음 행을 읽어 전달하고 읽은 행 수를 반환"""
+        stmt = (
+            select(EventMessage.id, EventMessage.topic, EventMessage.message)
+            .where(EventMessage.id > self._last_id)
+            .order_by(EventMessage.id)
+            .limit(self.batch_size)
+        )
+        async with self.session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+        for message_id, topic, message in rows:
+            self._last_id = message_id
+            if self._deliver is not None:
+                self._deliver(topic, message)
+        return len(rows)
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                # 한 번에 다 읽지 못했으면 기다리지 않고 이어서 읽음
+                while await self.poll() >= self.batch_size:
+                    pass
+            except Exception:
+                logger.exception("event poll failed")
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._deliver = None
+
+    async def purge_expired(self, db_session: AsyncSession) -> int:
+        """retention보다 오래된 행을 지우고 지운 개수를 반환"""
+        stmt = delete(EventMessage).where(EventMessage.created_at < datetime.now(timezone.utc) - self.retention)
+        result = await db_session.execute(stmt)
+        await db_session.commit()
+        return result.rowcount
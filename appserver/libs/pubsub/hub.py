@@ -0,0 +1,178 @@
+"""
+프로세스 안의 발행/구독(pub/sub) 허브
+
+- 구독자마다 크기가 정해진 큐를 두고, 발행은 큐에 넣기만 하므로 느린 구독자를 기다리지 않음
+- 큐가 가득 찬(느린) 구독자는 구독을 끊고 마지막으로 overflow 이벤트를 받게 함
+  → 구독자는 다시 연결해서 최신 상태를 새로 읽음 (놓친 이벤트를 쌓아 두지 않으므로 메모리가 늘지 않음)
+- 이벤트는 워커마다 한 번만 SSE/JSON으로 바꾸고 모든 구독자가 같은 바이트를 씀
+- 워커끼리는 Broker로 전달 (발행은 Broker로 보내고, Broker가 각 워커의 deliver()를 부름)
+"""
+import asyncio
+import json
+from functools import cached_property
+from typing import Any
+
+from .broker import Broker
+
+OVERFLOW = "overflow"
+
+
+class SubscriberLimitError(Exception):
+    """워커의 구독자 수가 최대에 이르렀을 때"""
+
+
+class Event:
+    """
+    >>> event = Event("booking.created", {"when": "2024-12-03"})
+    >>> event.sse
+    b'event: booking.created\\ndata: {"when":"2024-12-03"}\\n\\n'
+    >>> event.json
+    '{"type":"booking.created","data":{"when":"2024-12-03"}}'
+    """
+
+    def __init__(self, type: str, data: dict[str, Any] | None = None):
+        self.type = type
+        self.data = data or {}
+
+    @classmethod
+    def from_message(cls, message: dict[str, Any]) -> "Event":
+        return cls(message["type"], message.get("data"))
+
+    def to_message(self) -> dict[str, Any]:
+        return {"type": self.type, "data": self.data}
+
+    @cached_property
+    def json(self) -> str:
+        return json.dumps(self.to_message(), ensure_ascii=False, separators=(",", ":"))
+
+    @cached_property
+    def sse(self) -> bytes:
+        data = json.dumps(self.data, ensure_ascii=False, separators=(",", ":"))
+        return f"event: {self.type}\ndata: {data}\n\n".encode()
+
+
+class Subscription:
+    """주제 하나의 구독 (async for로 이벤트를 받음)"""
+
+    def __init__(self, hub: "PubSubHub", topic: str, max_queue_size: int):
+        self.hub = hub
+        self.topic = topic
+        self.closed = False
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(max_queue_size + 1)
+        self._max_queue_size = max_queue_size
+
+    def offer(self, event: Event) -> bool:
+        """큐에 넣고, 가득 차서 넣지 못하면 False (마지막 한 칸은 overflow 이벤트 자리)"""
+        if self.closed or self._queue.qsize() >= self._max_queue_size:
+            return False
+        self._queue.put_nowait(event)
+        return True
+
+    def overflow(self) -> None:
+        self.closed = True
+        self._queue.put_nowait(Event(OVERFLOW))
+
+    async def get(self, timeout: float | None = None) -> Event | None:
+        """다음 이벤트 (timeout 안에 없으면 None)"""
+        # 쌓인 이벤트는 기다리는 작업(wait_for)을 만들지 않고 바로 꺼냄
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PubSubHub:
+    """
+    >>> import asyncio
+    >>> from .broker import LocalBroker
+    >>> async def main():
+    ...     hub = PubSubHub(LocalBroker(), max_queue_size=1)
+    ...     fast, slow = hub.subscribe("calendar:1"), hub.subscribe("calendar:1")
+    ...     await hub.publish("calendar:1", {"type": "booking.created"})
+    ...     print((await fast.get()).type, len(hub))
+    ...     await hub.publish("calendar:1", {"type": "booking.created"})
+    ...     print(len(hub), hub.dropped, slow.closed)
+    ...     print((await slow.get()).type, (await slow.get()).type)
+    >>> asyncio.run(main())
+    booking.created 2
+    1 1 True
+    booking.created overflow
+    """
+
+    def __init__(self, broker: Broker, max_queue_size: int = 64, max_subscribers: int = 10_000):
+        self.broker = broker
+        self.max_queue_size = max_queue_size
+        self.max_subscribers = max_subscribers
+        # 느려서 끊은 구독 수
+        self.dropped = 0
+        self._topics: dict[str, set[Subscription]] = {}
+        self._count = 0
+        self._started = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    async def start(self) -> None:
+        """Broker에서 메시지를 받기 시작 (여러 번 불러도 한 번만 시작)"""
+        if not self._started:
+            self._started = True
+            await self.broker.start(self.deliver)
+
+    async def close(self) -> None:
+        for subscriptions in self._topics.values():
+            for subscription in subscriptions:
+                subscription.closed = True
+        self._topics.clear()
+        self._count = 0
+        if self._started:
+            self._started = False
+            await self.broker.close()
+
+    def subscribe(self, topic: str) -> Subscription:
+        if self._count >= self.max_subscribers:
+            raise SubscriberLimitError()
+        subscription = Subscription(self, topic, self.max_queue_size)
+        self._topics.setdefault(topic, set()).add(subscription)
+        self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._topics.get(subscription.topic)
+        if subscriptions is None or subscription not in subscriptions:
+            return
+        subscriptions.remove(subscription)
+        self._count -= 1
+        if not subscriptions:
+            del self._topics[subscription.topic]
+
+    async def publish(self, topic: str, message: dict[str, Any]) -> None:
+        """모든 워커의 topic 구독자에게 보냄"""
+        await self.start()
+        await self.broker.publish(topic, message)
+
+    def deliver(self, topic: str, message: dict[str, Any]) -> int:
+        """이 워커의 topic 구독자에게 전달하고 전달한 수를 반환 (Broker가 부름)"""
+        subscriptions = self._topics.get(topic)
+        if not subscriptions:
+            return 0
+        event = Event.from_message(message)
+        delivered = 0
+        for subscription in tuple(subscriptions):
+            if subscription.offer(event):
+                delivered += 1
+            else:
+                subscription.overflow()
+                self.unsubscribe(subscription)
+                self.dropped += 1
+        return delivered
@@ -0,0 +1,118 @@
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from appserver.libs.kvstore.local import KeyValueStore
+
+
+# 버킷 상태: (남은 토큰 수, 마지막으로 갱신한 시각)
+BucketState = tuple[float, float]
+
+
+def take_token(
+    state: BucketState | None,
+    now: float,
+    rate: float,
+    capacity: float,
+    cost: float = 1.0,
+) -> tuple[BucketState, float]:
+    """
+    토큰을 채우고 cost만큼 꺼냄
+    반환값: (새 상태, 다시 시도할 때까지 기다려야 하는 초) → 0이면 허용
+
+    >>> state, retry_after = take_token(None, now=0.0, rate=1.0, capacity=2)
+    >>> state, retry_after
+    ((1.0, 0.0), 0.0)
+    >>> state, retry_after = take_token(state, now=0.0, rate=1.0, capacity=2)
+    >>> state, retry_after = take_token(state, now=0.0, rate=1.0, capacity=2)
+    >>> retry_after
+    1.0
+    >>> take_token(state, now=1.0, rate=1.0, capacity=2)[1]
+    0.0
+    """
+    if state is None:
+        tokens = float(capacity)
+    else:
+        tokens, updated_at = state
+        tokens = min(float(capacity), tokens + (now - updated_at) * rate)
+
+    if tokens >= cost:
+        return (tokens - cost, now), 0.0
+    return (tokens, now), (cost - tokens) / rate
+
+
+class TokenBucket:
+    """
+    프로세스 안에서 키마다 토큰 버킷을 두는 속도 제한기
+
+    키 하나당 (토큰 수, 시각) 튜플 하나만 저장하고,
+    키가 max_keys를 넘으면 가장 오래 쓰지 않은 키부터 버림(LRU)
+    → 버려진 키는 다음에 가득 찬 버킷으로 다시 시작하는데,
+      오래 쓰지 않은 키는 어차피 토큰이 다시 차 있으므로 차이가 거의 없음
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: OrderedDict[str, BucketState] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def consume(self, key: str, cost: float = 1.0) -> float:
+        state, retry_after = take_token(
+            self._buckets.get(key), self._clock(), self.rate, self.capacity, cost
+        )
+        self._buckets[key] = state
+        self._buckets.move_to_end(key)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class SharedTokenBucket:
+    """
+    여러 워커가 함께 쓰는 저장소(KeyValueStore)에 버킷 상태를 두는 속도 제한기
+
+    compare_and_set()으로 낙관적 잠금을 해서 동시에 요청이 와도 토큰을 중복으로 쓰지 않음
+    워커끼리 시각을 맞추기 위해 기본 시계는 time.time()을 사용
+    """
+
+    def __init__(
+        self,
+        store: KeyValueStore,
+        rate: float,
+        capacity: float,
+        prefix: str = "ratelimit",
+        max_retries: int = 5,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store = store
+        self.rate = rate
+        self.capacity = capacity
+        self.prefix = prefix
+        self.max_retries = max_retries
+        self._clock = clock
+        # 이 시간이 지나면 버킷이 가득 찬 상태와 같으므로 저장소에서 지워도 됨
+        self._ttl = capacity / rate
+
+    async def consume(self, key: str, cost: float = 1.0) -> float:
+        store_key = f"{self.prefix}:{key}"
+        for _ in range(self.max_retries):
+            current = await self.store.get(store_key)
+            state = tuple(current) if current is not None else None
+            new_state, retry_after = take_token(
+                state, self._clock(), self.rate, self.capacity, cost
+            )
+            if await self.store.compare_and_set(store_key, current, list(new_state), self._ttl):
+                return retry_after
+        # 경합이 계속되면 거절하는 쪽으로 처리
+        return 1.0 / self.rate
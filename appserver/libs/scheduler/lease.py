@@ -0,0 +1,84 @@
+"""
+DB의 잠금 행(scheduler_leases)으로 리더 워커를 하나 고름
+
+- 리더는 임대(lease) 만료 시각을 주기적으로 늘리고, 다른 워커는 만료된 임대만 가져갈 수 있음
+  → 리더 워커가 죽으면 ttl이 지난 뒤 다른 워커가 이어받음
+- 종료할 때 release()로 임대를 지워서 다른 워커가 바로 이어받게 함
+"""
+import os
+import secrets
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from pydantic import AwareDatetime
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy_utc import UtcDateTime
+from sqlmodel import Field, SQLModel, delete, update
+
+
+class SchedulerLease(SQLModel, table=True):
+    __tablename__ = "scheduler_leases"
+
+    name: str = Field(primary_key=True, max_length=64, description="임대 이름")
+    owner: str = Field(max_length=128, description="임대를 가진 워커")
+    expires_at: AwareDatetime = Field(sa_type=UtcDateTime, nullable=False)
+
+
+def new_owner_id() -> str:
+    """호스트 이름, 프로세스 ID와 임의 값 (재시작한 프로세스가 같은 PID를 받아도 구별)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+
+
+class LeaderLease:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        ttl: timedelta,
+        name: str = "maintenance",
+        owner: str | None = None,
+    ):
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.name = name
+        self.owner = owner or new_owner_id()
+        self.is_leader = False
+
+    async def acquire(self) -> bool:
+        """임대를 가져오거나 늘리고 리더인지 반환"""
+        now = datetime.now(timezone.utc)
+        expires_at = now + self.ttl
+        async with self.session_factory() as session:
+            stmt = (
+                update(SchedulerLease)
+                .where(SchedulerLease.name == self.name)
+                .where(or_(SchedulerLease.owner == self.owner, SchedulerLease.expires_at <= now))
+                .values(owner=self.owner, expires_at=expires_at)
+            )
+            result = await session.execute(stmt)
+            if result.rowcount == 0:
+                # 행이 없을 때만 INSERT가 성공 (다른 워커의 임대가 살아 있으면 기본 키 충돌)
+                session.add(SchedulerLease(name=self.name, owner=self.owner, expires_at=expires_at))
+            try:
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                self.is_leader = False
+                return False
+        self.is_leader = True
+        return True
+
+    async def release(self) -> None:
+        if not self.is_leader:
+            return
+        self.is_leader = False
+        async with self.session_factory() as session:
+            stmt = (
+                delete(SchedulerLease)
+                .where(SchedulerLease.name == self.name)
+                .where(SchedulerLease.owner == self.owner)
+            )
+            await session.execute(stmt)
+            await session.commit()
@@ -0,0 +1,183 @@
+"""
+프로세스 안 주기 작업 실행기
+
+- 작업은 스케줄러 태스크 하나에서 차례로 실행 → 같은 작업이 겹쳐 실행되지 않음
+- leader_only 작업(DB 정리 등)은 LeaderLease로 뽑힌 워커 하나만 실행하고,
+  워커마다 해야 하는 작업(프로세스 안 캐시 채우기 등)은 모든 워커가 실행
+- 작업마다 실행 횟수, 실패 횟수, 걸린 시간을 JobMetrics에 남김
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from .lease import LeaderLease
+
+logger = logging.getLogger(__name__)
+
+
+class JobMetrics:
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+        self.last_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, elapsed: float, failed: bool = False) -> None:
+        self.runs += 1
+        if failed:
+            self.failures += 1
+        self.total_seconds += elapsed
+        self.last_seconds = elapsed
+        if elapsed > self.max_seconds:
+            self.max_seconds = elapsed
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        >>> metrics = JobMetrics()
+        >>> metrics.record(0.5)
+        >>> metrics.record(1.5, failed=True)
+        >>> metrics.snapshot()
+        {'runs': 2, 'failures': 1, 'avg_seconds': 1.0, 'last_seconds': 1.5, 'max_seconds': 1.5}
+        """
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "avg_seconds": self.total_seconds / self.runs if self.runs else 0.0,
+            "last_seconds": self.last_seconds,
+            "max_seconds": self.max_seconds,
+        }
+
+
+class Job:
+    __slots__ = ("name", "func", "interval", "leader_only", "next_run_at", "metrics")
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval: float,
+        leader_only: bool,
+        next_run_at: float,
+    ):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.leader_only = leader_only
+        self.next_run_at = next_run_at
+        self.metrics = JobMetrics()
+
+
+class Scheduler:
+    """
+    >>> async def main():
+    ...     now = [0.0]
+    ...     scheduler = Scheduler(clock=lambda: now[0])
+    ...     async def purge():
+    ...         return 3
+    ...     scheduler.add("purge", purge, interval=60)
+    ...     print(await scheduler.run_pending())
+    ...     now[0] = 30
+    ...     print(await scheduler.run_pending())
+    ...     now[0] = 60
+    ...     print(await scheduler.run_pending(), scheduler.snapshot()["purge"]["runs"])
+    >>> asyncio.run(main())
+    ['purge']
+    []
+    ['purge'] 2
+    """
+
+    def __init__(
+        self,
+        lease: LeaderLease | None = None,
+        tick: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.lease = lease
+        self.tick = tick
+        self._clock = clock
+        self.jobs: list[Job] = []
+        self._task: asyncio.Task | None = None
+        self._renew_at = 0.0
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval: float,
+        leader_only: bool = False,
+        delay: float = 0.0,
+    ) -> None:
+        """interval(초)마다 func를 실행 (처음에는 delay초 뒤에 실행)"""
+        self.jobs.append(Job(name, func, interval, leader_only, self._clock() + delay))
+
+    @property
+    def is_leader(self) -> bool:
+        # 임대를 쓰지 않으면(워커가 하나이면) 늘 리더
+        return self.lease is None or self.lease.is_leader
+
+    async def renew_lease(self) -> None:
+        """임대 ttl의 1/3마다 가져오거나 늘림 (실패하면 리더가 아닌 것으로 봄)"""
+        if self.lease is None or self._clock() < self._renew_at:
+            return
+        self._renew_at = self._clock() + self.lease.ttl.total_seconds() / 3
+        try:
+            await self.lease.acquire()
+        except Exception:
+            self.lease.is_leader = False
+            logger.exception("scheduler lease renewal failed")
+
+    async def run_pending(self) -> list[str]:
+        """실행할 때가 된 작업을 실행하고 실행한 작업 이름을 반환"""
+        await self.renew_lease()
+        ran = []
+        for job in self.jobs:
+            if job.next_run_at > self._clock():
+                continue
+            if job.leader_only and not self.is_leader:
+                job.next_run_at = self._clock() + job.interval
+                continue
+            await self.run(job)
+            ran.append(job.name)
+        return ran
+
+    async def run(self, job: Job) -> None:
+        started_at = time.perf_counter()
+        failed = False
+        try:
+            result = await job.func()
+        except Exception:
+            failed = True
+            logger.exception("scheduled job %s failed", job.name)
+        elapsed = time.perf_counter() - started_at
+        job.metrics.record(elapsed, failed)
+        job.next_run_at = self._clock() + job.interval
+        if not failed:
+            logger.debug("scheduled job %s finished in %.3fs: %s", job.name, elapsed, result)
+
+    async def _loop(self) -> None:
+        while True:
+            await self.run_pending()
+            await asyncio.sleep(self.tick)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.lease is not None:
+            try:
+                await self.lease.release()
+            except Exception:
+                logger.exception("scheduler lease release failed")
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {job.name: job.metrics.snapshot() for job in self.jobs}
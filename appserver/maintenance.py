@@ -0,0 +1,84 @@
+"""
+백그라운드 유지 보수 작업 (appserver.libs.scheduler 참고)
+
+- 만료된 세션/Idempotency-Key 지우기: DB 저장소는 리더 워커만, 메모리 저장소는 워커마다
+- 다 읽은 이벤트(event_messages) 지우기: database Broker일 때 리더 워커만
+- 예약 가능 시간 캐시 채우기: 앞으로 며칠 동안 예약이 많은 캘린더의 일정표를 워커마다 새로 만들어 둠
+- DB 통계 갱신과 빈 페이지 정리(ANALYZE/VACUUM): 리더 워커만
+"""
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI
+
+from .apps.calendar.schedule import warm_schedule_cache
+from .db import optimize_database
+from .libs.pubsub.database import DatabaseBroker
+from .libs.scheduler.lease import LeaderLease
+from .libs.scheduler.scheduler import Scheduler
+from .settings import Settings
+
+
+def create_scheduler(_app: FastAPI) -> Scheduler:
+    """
+    세션 팩토리와 엔진은 lifespan에서 만들어지므로 작업을 실행할 때 app.state에서 꺼냄
+    """
+    settings: Settings = _app.state.settings
+    state = _app.state
+    lease = LeaderLease(
+        lambda: state.session_factory(),
+        ttl=timedelta(seconds=settings.scheduler_lease_seconds),
+    )
+    scheduler = Scheduler(lease, tick=settings.scheduler_tick_seconds)
+
+    if state.session_store is not None:
+        async def purge_sessions() -> int:
+            async with state.session_factory() as session:
+                return await state.session_store.purge_expired(session)
+
+        scheduler.add(
+            "purge-sessions",
+            purge_sessions,
+            settings.maintenance_purge_interval_seconds,
+            leader_only=settings.session_store == "database",
+        )
+
+    if state.idempotency_store is not None:
+        async def purge_idempotency_keys() -> int:
+            async with state.session_factory() as session:
+                return await state.idempotency_store.purge_expired(session)
+
+        scheduler.add(
+            "purge-idempotency-keys",
+            purge_idempotency_keys,
+            settings.maintenance_purge_interval_seconds,
+            leader_only=settings.idempotency_store == "database",
+        )
+
+    broker = state.event_hub.broker
+    if isinstance(broker, DatabaseBroker):
+        async def purge_event_messages() -> int:
+            async with state.session_factory() as session:
+                return await broker.purge_expired(session)
+
+        scheduler.add(
+            "purge-event-messages",
+            purge_event_messages,
+            settings.maintenance_purge_interval_seconds,
+            leader_only=True,
+        )
+
+    async def warm_schedules() -> int:
+        start = datetime.now(timezone.utc).date()
+        end = start + timedelta(days=settings.maintenance_warm_days)
+        async with state.session_factory() as session:
+            return await warm_schedule_cache(session, state.schedule_cache, start, end)
+
+    scheduler.add("warm-schedules", warm_schedules, settings.maintenance_warm_interval_seconds)
+
+    async def optimize() -> bool:
+        return await optimize_database(state.engine, settings.maintenance_vacuum_free_ratio)
+
+    # 시작할 때마다 하지 않도록 한 주기 뒤에 처음 실행
+    interval = settings.maintenance_optimize_interval_seconds
+    scheduler.add("optimize-database", optimize, interval, leader_only=True, delay=interval)
+    return scheduler
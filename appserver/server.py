@@ -0,0 +1,75 @@
+import logging
+import os
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+APP_FACTORY = "appserver.app:create_app"
+
+
+def get_pool_size_per_worker(connection_budget: int, workers: int) -> int:
+    """
+    전체 DB 연결 예산을 워커 수로 나눠 워커 하나의 풀 크기를 구함
+
+    >>> get_pool_size_per_worker(40, 4)
+    10
+    >>> get_pool_size_per_worker(10, 3)
+    3
+    >>> get_pool_size_per_worker(2, 4)
+    Traceback (most recent call last):
+    ...
+    ValueError: 연결 예산(2)이 워커 수(4)보다 작습니다.
+    """
+    if connection_budget < workers:
+        raise ValueError(f"연결 예산({connection_budget})이 워커 수({workers})보다 작습니다.")
+    return connection_budget // workers
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int | None = None,
+    connection_budget: int | None = None,
+    graceful_timeout: int = 30,
+    prewarm: bool = True,
+    scheduler: bool = True,
+) -> None:
+    """
+    운영 서버 실행
+
+    - 워커 N개를 띄우고, 워커마다 `create_app()`으로 앱을 만듦
+    - connection_budget이 주어지면 워커마다 풀 크기를 나눠서 전체 연결 수가 예산을 넘지 않게 함
+    - SIGTERM을 받으면 새 연결을 받지 않고, 처리 중인 요청을 graceful_timeout초까지 기다린 뒤 종료
+    - scheduler가 켜져 있으면 워커마다 백그라운드 유지 보수 작업을 실행 (appserver.maintenance 참고)
+    - 워커가 여럿이면 캘린더 이벤트를 DB로 나눔 (APPSERVER_EVENT_BROKER로 따로 정하지 않았을 때)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # 워커 프로세스는 환경 변수로 설정을 물려받습니다. (appserver.settings 참고)
+    if connection_budget is not None:
+        pool_size = get_pool_size_per_worker(connection_budget, workers)
+        os.environ["APPSERVER_DATABASE_POOL_SIZE"] = str(pool_size)
+        # 예산을 넘지 않도록 초과 연결은 허용하지 않음
+        os.environ["APPSERVER_DATABASE_MAX_OVERFLOW"] = "0"
+    os.environ["APPSERVER_PREWARM"] = "true" if prewarm else "false"
+    os.environ["APPSERVER_SCHEDULER_ENABLED"] = "true" if scheduler else "false"
+    if workers > 1:
+        # local Broker는 이벤트를 발행한 워커의 구독자에게만 보냄
+        event_broker = os.environ.setdefault("APPSERVER_EVENT_BROKER", "database")
+        if event_broker == "local":
+            logger.warning(
+                "APPSERVER_EVENT_BROKER=local: 워커 %d개가 캘린더 이벤트를 나누지 않습니다. "
+                "다른 워커에 연결된 구독자는 이벤트를 받지 못합니다.",
+                workers,
+            )
+
+    uvicorn.run(
+        APP_FACTORY,
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        timeout_graceful_shutdown=graceful_timeout,
+    )
@@ -0,0 +1,137 @@
+from functools import lru_cache
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """
+    애플리케이션 설정
+
+    환경 변수에서 `APPSERVER_` 접두어를 붙여 값을 덮어쓸 수 있습니다.
+    예) APPSERVER_DATABASE_DSN=sqlite+aiosqlite:///./prod.db
+    """
+    model_config = SettingsConfigDict(env_prefix="APPSERVER_")
+
+    database_dsn: str = "sqlite+aiosqlite:///./local.db"
+    database_echo: bool = False
+    # 워커(프로세스) 하나가 갖는 커넥션 풀 크기
+    # `python -m appserver serve`는 전체 연결 예산을 워커 수로 나눠 이 값을 정합니다.
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0
+    # 엔진의 SQL 컴파일 캐시 항목 수 (SQLAlchemy 기본값 500)
+    # 조회문 모양(모델, selectinload, IN 목록 길이 등)마다 항목이 하나씩 생기므로 여유 있게 둠
+    # 0이면 캐시를 끄고 매번 컴파일
+    database_query_cache_size: int = 1200
+
+    # 시작할 때 커넥션 풀과 비밀번호 해셔를 미리 준비할지 여부
+    prewarm: bool = False
+
+    # 로그인 시도 속도 제한 (분당 시도 횟수와 한 번에 몰아서 허용하는 횟수)
+    # memory: 워커마다 따로 셈 / shared: KeyValueStore를 통해 워커끼리 함께 셈
+    login_rate_limit_backend: Literal["memory", "shared"] = "memory"
+    login_attempts_per_minute: float = 10
+    login_attempts_burst: int = 5
+    login_ip_attempts_per_minute: float = 60
+    login_ip_attempts_burst: int = 30
+    rate_limit_max_keys: int = 100_000
+
+    # JWT 서명 키 {kid: 비밀 값 또는 PEM}
+    # 키를 교체할 때는 새 키를 추가하고 jwt_active_kid를 바꾼 뒤, 이전 토큰이 만료되면 이전 키를 지움
+    jwt_keys: dict[str, str] = {"default": "your-secret-key-here"}
+    jwt_active_kid: str = "default"
+    jwt_algorithm: str = "HS256"
+    # 키마다 알고리즘이 다를 때 {kid: 알고리즘} (HS256, ES256, EdDSA 등)
+    jwt_key_algorithms: dict[str, str] = {}
+    access_token_expire_minutes: int = 30
+
+    # 인증 방식
+    # jwt: 쿠키의 JWT를 검증하고 users 테이블에서 사용자를 조회
+    # session: 쿠키의 세션 ID로 세션 저장소에서 사용자 스냅샷을 꺼냄 (로그아웃/탈퇴 즉시 무효화)
+    auth_backend: Literal["jwt", "session"] = "jwt"
+    # memory: 워커마다 따로 저장(LRU) / database: user_sessions 테이블에 저장(워커끼리 공유)
+    session_store: Literal["memory", "database"] = "memory"
+    session_store_max_entries: int = 100_000
+
+    # 예약 보관: 이 일수보다 오래된 달의 예약은 bookings_archive 테이블로 옮김
+    # `python -m appserver archive-bookings`로 옮기며, 조회는 필요한 경우에만 보관 테이블을 읽음
+    booking_archive_after_days: int = 365
+
+    # 워커마다 보관하는 캘린더 일정표(시간대를 미리 변환한 것) 개수
+    schedule_cache_max_entries: int = 10_000
+
+    # username → 사용자 ID 캐시 크기 (프로세스마다)
+    user_id_cache_max_entries: int = 100_000
+
+    # 응답 압축: 나열한 순서로 우선 (zstd, br은 zstandard, brotli 패키지가 있을 때만 사용)
+    compression_enabled: bool = True
+    compression_encodings: list[str] = ["zstd", "br", "gzip"]
+    # 이보다 작은 응답은 압축하지 않음 (바이트)
+    compression_minimum_size: int = 500
+
+    # 캘린더 실시간 이벤트 (SSE/WebSocket)
+    # 구독자마다 쌓아 두는 이벤트 수 (넘으면 느린 구독자로 보고 연결을 끊음)
+    event_queue_size: int = 64
+    # 워커 하나가 받는 구독자 수 (넘으면 503 응답)
+    event_max_subscribers: int = 10_000
+    # 이벤트가 없을 때 연결 유지용 메시지를 보내는 간격 (초)
+    event_heartbeat_seconds: float = 15.0
+    # 이벤트를 워커끼리 나누는 방법
+    # local: 워커 안에서만 전달 → 이벤트를 발행한 워커에 연결된 구독자만 받으므로 워커가 하나일 때만 사용
+    # database: event_messages 테이블에 쓰고 워커마다 event_poll_seconds 간격으로 읽음
+    # `python -m appserver serve`는 워커가 여럿이고 따로 정하지 않았으면 database로 정함
+    event_broker: Literal["local", "database"] = "local"
+    event_poll_seconds: float = 0.5
+    # event_messages에 남겨 두는 시간 (초), 만료된 행은 scheduler가 지움
+    event_retention_seconds: float = 300.0
+
+    # 동시 처리 제한(admission control): 경로 종류마다 동시에 처리하는 요청 수와 기다릴 수 있는 요청 수 (워커마다)
+    # auth: 비밀번호를 해시하는 경로(admission_auth_paths) / write: 그 밖의 쓰기 / read: GET, HEAD, OPTIONS
+    admission_control_enabled: bool = True
+    admission_auth_paths: list[str] = ["/account/login", "/account/signup"]
+    # 제한하지 않는 경로 (라우터의 경로 형식): 오래 열어 두는 SSE 연결이 자리를 차지하지 않도록
+    admission_exempt_paths: list[str] = ["/calendar/{host_username}/events"]
+    admission_auth_concurrency: int = 4
+    admission_auth_queue: int = 32
+    admission_write_concurrency: int = 32
+    admission_write_queue: int = 128
+    admission_read_concurrency: int = 128
+    admission_read_queue: int = 512
+    # 대기열에서 기다리는 최대 시간 (초), 넘기면 503 + Retry-After
+    admission_max_queue_wait: float = 2.0
+    admission_retry_after: int = 1
+    # 클라이언트가 응답을 기다리는 시간(초)을 알려 주는 요청 헤더 (대기 시간을 이보다 짧게 줄임)
+    admission_timeout_header: str = "X-Request-Timeout"
+
+    # Idempotency-Key: 같은 키로 다시 보낸 요청에는 핸들러를 다시 실행하지 않고 처음 응답을 돌려줌
+    # "메서드 경로" 목록 (경로는 라우터의 경로 형식)
+    idempotency_enabled: bool = True
+    idempotency_routes: list[str] = ["POST /bookings/{host_username}", "POST /account/signup"]
+    # memory: 워커마다 따로 저장(LRU) / database: idempotency_keys 테이블에 저장하고 LRU를 앞에 둠(워커끼리 공유)
+    idempotency_store: Literal["memory", "database"] = "database"
+    idempotency_ttl_hours: int = 24
+    # 처리 중 예약을 유지하는 시간 (워커가 죽어서 남은 예약은 이 시간이 지나면 풀림)
+    idempotency_in_flight_seconds: int = 60
+    idempotency_cache_max_entries: int = 10_000
+
+    # 백그라운드 유지 보수 작업 (appserver.maintenance 참고, lifespan에서 시작)
+    # DB 작업은 scheduler_leases 테이블의 임대를 가진 워커 하나만 실행
+    # 운영 서버(serve)에서 켬 → 테스트나 스크립트에서 만든 앱은 백그라운드 작업을 돌리지 않음
+    scheduler_enabled: bool = False
+    scheduler_tick_seconds: float = 1.0
+    # 리더 임대 시간 (초), 리더 워커가 죽으면 이 시간이 지난 뒤 다른 워커가 이어받음
+    scheduler_lease_seconds: float = 30.0
+    # 만료된 세션/Idempotency-Key를 지우는 간격 (초)
+    maintenance_purge_interval_seconds: float = 300.0
+    # 앞으로 maintenance_warm_days일 동안 예약이 많은 캘린더의 일정표를 새로 만드는 간격 (초)
+    maintenance_warm_interval_seconds: float = 600.0
+    maintenance_warm_days: int = 14
+    # ANALYZE 간격 (초), SQLite는 빈 페이지 비율이 maintenance_vacuum_free_ratio 이상이면 VACUUM도 실행
+    maintenance_optimize_interval_seconds: float = 3600.0
+    maintenance_vacuum_free_ratio: float = 0.2
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
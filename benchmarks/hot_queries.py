@@ -0,0 +1,88 @@
+"""
+자주 실행하는 조회문의 실행 비용 비교 (SQL 컴파일 비용)
+
+    python -m benchmarks.hot_queries
+
+- select() per call: 요청마다 select()를 새로 만드는 기존 방식 (캐시 키 계산 + 캐시 조회)
+- prebuilt bindparam: appserver.apps.*.queries의 미리 만든 조회문에 값만 넘기는 방식
+- no compiled cache: query_cache_size=0, 실행할 때마다 SQL을 다시 컴파일
+
+DB 왕복 비용을 빼고 보기 위해 메모리 SQLite에 사용자 한 명만 넣고 조회합니다.
+"""
+import timeit
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel, select
+
+from appserver.apps.account.models import User
+from appserver.apps.account.queries import USER_BY_USERNAME
+from appserver.apps.calendar.models import TimeSlot
+from appserver.apps.calendar.queries import TIME_SLOTS_BY_CALENDAR
+
+NUMBER = 5_000
+USERNAME = "puddingcamp"
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {NUMBER / seconds:>12,.0f} ops/s")
+
+
+def create_session(query_cache_size: int = 500) -> Session:
+    engine = create_engine("sqlite://", query_cache_size=query_cache_size)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(User(
+        username=USERNAME,
+        email="puddingcamp@example.com",
+        display_name="푸딩캠프",
+        hashed_password="x",
+    ))
+    session.commit()
+    return session
+
+
+def bench_username_lookup() -> None:
+    session = create_session()
+
+    def per_call():
+        stmt = select(User).where(User.username == USERNAME)
+        return session.execute(stmt).scalar_one()
+
+    def prebuilt():
+        return session.execute(USER_BY_USERNAME, {"username": USERNAME}).scalar_one()
+
+    report("username lookup: select() per call", timeit.timeit(per_call, number=NUMBER))
+    report("username lookup: prebuilt bindparam", timeit.timeit(prebuilt, number=NUMBER))
+
+    uncached = create_session(query_cache_size=0)
+    report(
+        "username lookup: no compiled cache",
+        timeit.timeit(
+            lambda: uncached.execute(USER_BY_USERNAME, {"username": USERNAME}).scalar_one(),
+            number=NUMBER,
+        ),
+    )
+
+
+def bench_time_slot_lookup() -> None:
+    session = create_session()
+
+    def per_call():
+        stmt = select(TimeSlot).where(TimeSlot.calendar_id == 1)
+        return session.execute(stmt).scalars().all()
+
+    def prebuilt():
+        return session.execute(TIME_SLOTS_BY_CALENDAR, {"calendar_id": 1}).scalars().all()
+
+    report("time slot lookup: select() per call", timeit.timeit(per_call, number=NUMBER))
+    report("time slot lookup: prebuilt bindparam", timeit.timeit(prebuilt, number=NUMBER))
+
+
+def main() -> None:
+    bench_username_lookup()
+    bench_time_slot_lookup()
+
+
+if __name__ == "__main__":
+    main()
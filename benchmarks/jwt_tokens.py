@@ -0,0 +1,79 @@
+"""
+JWT 발급/검증 처리량 비교
+
+    python -m benchmarks.jwt_tokens
+
+- jose (raw key): 요청마다 비밀 값 문자열을 넘기는 기존 방식
+- TokenService: 키 객체를 미리 만들어 두고 kid로 고르는 방식
+"""
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jose import jwt
+
+from appserver.apps.account.tokens import TokenService
+
+SECRET_KEY = "your-secret-key-here"
+CLAIMS = {"sub": "puddingcamp", "display_name": "푸딩캠프", "is_host": True}
+NUMBER = 5_000
+
+
+def private_pem(key) -> str:
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<32} {NUMBER / seconds:>12,.0f} ops/s")
+
+
+def bench_raw_jose() -> None:
+    def encode():
+        claims = {**CLAIMS, "exp": datetime.now(timezone.utc) + timedelta(minutes=30)}
+        return jwt.encode(claims, SECRET_KEY, algorithm="HS256")
+
+    token = encode()
+    report("jose HS256 encode (raw key)", timeit.timeit(encode, number=NUMBER))
+    report(
+        "jose HS256 decode (raw key)",
+        timeit.timeit(lambda: jwt.decode(token, SECRET_KEY, algorithms=["HS256"]), number=NUMBER),
+    )
+
+
+def bench_service(name: str, service: TokenService) -> None:
+    token = service.encode(CLAIMS)
+    report(f"{name} encode", timeit.timeit(lambda: service.encode(CLAIMS), number=NUMBER))
+    report(f"{name} decode", timeit.timeit(lambda: service.decode(token), number=NUMBER))
+
+
+def main() -> None:
+    bench_raw_jose()
+    bench_service(
+        "TokenService HS256",
+        TokenService(keys={"k1": SECRET_KEY}, active_kid="k1"),
+    )
+    bench_service(
+        "TokenService ES256",
+        TokenService(
+            keys={"k1": private_pem(ec.generate_private_key(ec.SECP256R1()))},
+            active_kid="k1",
+            algorithm="ES256",
+        ),
+    )
+    bench_service(
+        "TokenService EdDSA",
+        TokenService(
+            keys={"k1": private_pem(ed25519.Ed25519PrivateKey.generate())},
+            active_kid="k1",
+            algorithm="EdDSA",
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+
+import pytest
+from sqlmodel import SQLModel, select
+
+from appserver.db import create_engine, create_session
+from appserver.apps.account.bulk_import import import_users
+from appserver.apps.account.models import User
+from appserver.apps.account.utils import verify_password
+
+
+@pytest.fixture()
+async def file_engine(tmp_path: Path):
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path}/import.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def test_CSV_파일의_사용자를_해싱해서_일괄_추가한다(tmp_path: Path, file_engine):
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "username,email,password,display_name,is_host\n"
+        "PuddingCamp,puddingcamp@example.com,testtest,푸딩캠프,true\n"
+        "puddingcafe,puddingcafe@example.com,testtest,,false\n"
+        "bad,not-an-email,short,,\n"
+        "cuteguest,cute_guest@example.com,testtest,귀여운 게스트,\n",
+        encoding="utf-8",
+    )
+
+    report = await import_users(file_engine, path, batch_size=2, workers=1, max_pending=1)
+
+    assert (report.read, report.inserted, report.skipped) == (4, 3, 0)
+    assert [line_no for line_no, _ in report.invalid] == [4]
+
+    async with create_session(file_engine)() as session:
+        users = (await session.execute(select(User).order_by(User.id))).unique().scalars().all()
+    assert [user.username for user in users] == ["PuddingCamp", "puddingcafe", "cuteguest"]
+    # 여러 행 INSERT에서는 bulk_import가 행마다 username_lower를 채움
+    assert [user.username_lower for user in users] == ["puddingcamp", "puddingcafe", "cuteguest"]
+    assert users[0].is_host is True
+    assert len(users[1].display_name) == 8
+    assert verify_password("testtest", users[0].hashed_password)
+
+
+async def test_이미_있는_사용자는_건너뛰므로_다시_실행해도_안전하다(tmp_path: Path, file_engine):
+    path = tmp_path / "users.ndjson"
+    rows = [
+        {"username": "puddingcamp", "email": "puddingcamp@example.com", "password": "testtest"},
+        {"username": "puddingcafe", "email": "puddingcafe@example.com", "password": "testtest"},
+    ]
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\nnot json\n", encoding="utf-8")
+
+    first = await import_users(file_engine, path, workers=1)
+    second = await import_users(file_engine, path, workers=1)
+
+    assert first.inserted == 2
+    assert first.invalid == [(3, "JSON 객체가 아닙니다.")]
+    assert (second.inserted, second.skipped) == (0, 2)
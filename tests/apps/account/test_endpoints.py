@@ -21,7 +21,7 @@ async def test_user_detail_successfully(db_session: AsyncSession):
     )
     db_session.add(host_user)
     await db_session.commit()
-    result = await user_detail(host_user.username, db_session)
+    result = await user_detail(host_user.username, db_session, None)
     assert result.username == host_user.username
     assert result.email == host_user.email
     assert result.display_name == host_user.display_name
@@ -30,7 +30,7 @@ async def test_user_detail_successfully(db_session: AsyncSession):
 
 async def test_user_detail_not_found(db_session: AsyncSession):
     with pytest.raises(HTTPException) as exc_info:
-        await user_detail(username="not_found", session=db_session)
+        await user_detail(username="not_found", session=db_session, user_id_cache=None)
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
 
@@ -24,3 +24,36 @@ async def test_로그인_성공(host_user: User, client: TestClient):
     assert cookie is not None
     assert cookie == data["access_token"]
 
+
+
+async def test_로그인_시도가_너무_많으면_DB와_해셔를_거치지_않고_HTTP_429_응답을_한다(
+    host_user: User,
+    client: TestClient,
+    monkeypatch,
+):
+    from appserver.apps.account import endpoints
+
+    verify_calls = []
+    original_verify_password = endpoints.verify_password
+
+    def counting_verify_password(*args):
+        verify_calls.append(args)
+        return original_verify_password(*args)
+
+    monkeypatch.setattr(endpoints, "verify_password", counting_verify_password)
+
+    settings = client.app.state.settings
+    payload = {"username": host_user.username, "password": "wrong-password"}
+    for _ in range(settings.login_attempts_burst):
+        response = client.post("/account/login", json=payload)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = client.post("/account/login", json=payload)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) >= 1
+    assert len(verify_calls) == settings.login_attempts_burst
+
+    # 대소문자만 바꾼 계정 ID도 같은 버킷을 씀
+    payload["username"] = host_user.username.upper()
+    response = client.post("/account/login", json=payload)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
@@ -0,0 +1,113 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.lookup import UserIdCache, get_user_by_username
+from appserver.apps.account.models import User
+
+
+@pytest.fixture()
+def executed_statements(db_session: AsyncSession):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def test_username은_대소문자를_구분하지_않고_찾는다(db_session: AsyncSession, host_user: User):
+    user = await get_user_by_username(db_session, "PuddingCamp")
+
+    assert user is not None
+    assert user.id == host_user.id
+    assert host_user.username_lower == "puddingcamp"
+
+
+async def test_대소문자만_다른_username으로_가입할_수_없다(db_session: AsyncSession, host_user: User):
+    db_session.add(User(
+        username="PUDDINGCAMP",
+        hashed_password="hashed-password",
+        email="another@example.com",
+        display_name="다른푸딩캠프",
+    ))
+    with pytest.raises(IntegrityError):
+        await db_session.flush()
+    await db_session.rollback()
+
+
+async def test_캐시된_username은_username으로_다시_조회하지_않는다(
+    db_session: AsyncSession,
+    host_user: User,
+    executed_statements: list[str],
+):
+    cache = UserIdCache()
+    await get_user_by_username(db_session, "puddingcamp", cache)
+    assert cache.get("puddingcamp") == host_user.id
+
+    executed_statements.clear()
+    user = await get_user_by_username(db_session, "PuddingCamp", cache)
+
+    assert user is host_user
+    assert not any("username_lower" in statement for statement in executed_statements)
+
+
+async def test_캐시된_사용자가_없으면_다시_찾는다(db_session: AsyncSession, host_user: User):
+    cache = UserIdCache()
+    # 다른 워커에서 탈퇴했다가 같은 username으로 다시 가입한 경우
+    cache.set("puddingcamp", host_user.id + 1000)
+
+    user = await get_user_by_username(db_session, "puddingcamp", cache)
+
+    assert user is host_user
+    assert cache.get("puddingcamp") == host_user.id
+
+
+async def test_캐시된_ID가_다른_사용자의_것이면_다시_찾는다(
+    db_session: AsyncSession,
+    host_user: User,
+    guest_user: User,
+):
+    cache = UserIdCache()
+    # 다른 워커에서 탈퇴한 사용자의 ID를 새로 가입한 사용자가 받은 경우
+    cache.set("puddingcamp", guest_user.id)
+    cache.set("alice", guest_user.id)
+
+    user = await get_user_by_username(db_session, "puddingcamp", cache)
+
+    assert user is host_user
+    assert cache.get("puddingcamp") == host_user.id
+    assert await get_user_by_username(db_session, "alice", cache) is None
+    assert cache.get("alice") is None
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+def test_대소문자가_다른_username으로도_캘린더를_조회한다(client: TestClient):
+    response = client.get("/calendar/PuddingCamp")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "topics" in response.json()
+
+
+def test_대소문자가_다른_username으로도_로그인한다(client: TestClient, host_user: User):
+    response = client.post("/account/login", json={"username": "PuddingCamp", "password": "testtest"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["user"]["username"] == "puddingcamp"
+
+
+def test_탈퇴하면_username_캐시에서_지운다(fastapi_app: FastAPI, client_with_auth: TestClient):
+    cache = fastapi_app.state.user_id_cache
+    assert client_with_auth.get("/account/@me").status_code == status.HTTP_200_OK
+    assert cache.get("puddingcamp") is not None
+
+    response = client_with_auth.delete("/account/unregister")
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert cache.get("puddingcamp") is None
@@ -0,0 +1,146 @@
+import pytest
+from datetime import timedelta
+
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.app import create_app
+from appserver.db import use_session
+from appserver.settings import Settings
+from appserver.apps.account.constants import AUTH_TOKEN_COOKIE_NAME
+from appserver.apps.account.models import User
+from appserver.apps.account.sessions import MemorySessionStore
+
+
+# 이 모듈의 테스트는 세션 방식 인증으로 만든 앱을 사용 (conftest의 fastapi_app을 대신함)
+@pytest.fixture(params=["memory", "database"])
+def fastapi_app(request, db_session: AsyncSession):
+    app = create_app(Settings(
+        database_dsn="sqlite+aiosqlite:///:memory:",
+        auth_backend="session",
+        session_store=request.param,
+    ))
+
+    async def override_use_session():
+        yield db_session
+
+    app.dependency_overrides[use_session] = override_use_session
+    return app
+
+
+@pytest.fixture()
+def executed_statements(db_session: AsyncSession):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_세션_방식으로_로그인하면_세션_ID를_발급하고_users를_조회하지_않고_인증한다(
+    fastapi_app: FastAPI,
+    client_with_auth: TestClient,
+    host_user: User,
+    executed_statements: list[str],
+):
+    session_id = client_with_auth.cookies.get(AUTH_TOKEN_COOKIE_NAME, domain="", path="/")
+    assert session_id.count(".") == 0  # JWT가 아님
+
+    executed_statements.clear()
+    response = client_with_auth.get("/account/@me")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["username"] == host_user.username
+    assert not any("FROM users" in statement for statement in executed_statements)
+    if isinstance(fastapi_app.state.session_store, MemorySessionStore):
+        assert executed_statements == []
+
+
+def test_로그아웃하면_세션이_바로_무효화된다(client_with_auth: TestClient):
+    session_id = client_with_auth.cookies.get(AUTH_TOKEN_COOKIE_NAME, domain="", path="/")
+
+    response = client_with_auth.delete("/account/logout")
+    assert response.status_code == status.HTTP_200_OK
+
+    # 쿠키를 지우지 않고 같은 세션 ID를 다시 보내도 인증되지 않음
+    client_with_auth.cookies.set(AUTH_TOKEN_COOKIE_NAME, session_id)
+    response = client_with_auth.get("/account/@me")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_탈퇴하면_그_사용자의_모든_세션이_무효화된다(
+    fastapi_app: FastAPI,
+    client_with_auth: TestClient,
+    host_user: User,
+):
+    with TestClient(fastapi_app) as other_client:
+        response = other_client.post(
+            "/account/login",
+            json={"username": host_user.username, "password": "testtest"},
+        )
+        other_client.cookies.set(AUTH_TOKEN_COOKIE_NAME, response.cookies.get(AUTH_TOKEN_COOKIE_NAME))
+
+        response = client_with_auth.delete("/account/unregister")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = other_client.get("/account/@me")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_사용자_정보를_바꾸면_세션의_스냅샷도_바뀐다(client_with_auth: TestClient):
+    response = client_with_auth.patch("/account/@me", json={"display_name": "새로운 이름"})
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client_with_auth.get("/account/@me")
+    assert response.json()["display_name"] == "새로운 이름"
+
+
+def test_세션으로_인증한_사용자로_캘린더를_만들고_시간대를_추가할_수_있다(
+    client_with_auth: TestClient,
+):
+    response = client_with_auth.post("/calendar", json={
+        "topics": ["푸딩캠프"],
+        "description": "푸딩캠프 캘린더입니다.",
+        "google_calendar_id": "puddingcamp@example.com",
+    })
+    assert response.status_code == status.HTTP_201_CREATED
+
+    # 스냅샷에 새 캘린더가 들어가 있어야 시간대를 만들 수 있음
+    response = client_with_auth.post("/time-slots", json={
+        "start_time": "09:00",
+        "end_time": "10:00",
+        "weekdays": [0, 1],
+    })
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+async def test_메모리_세션_저장소는_상한을_넘으면_오래된_세션부터_버린다(host_user: User, db_session: AsyncSession):
+    await db_session.refresh(host_user)
+    store = MemorySessionStore(ttl=timedelta(minutes=30), max_entries=2)
+
+    first = await store.create(host_user, db_session)
+    second = await store.create(host_user, db_session)
+    await store.get(first, db_session)  # first를 최근에 쓴 세션으로 만듦
+    third = await store.create(host_user, db_session)
+
+    assert len(store) == 2
+    assert await store.get(second, db_session) is None
+    assert await store.get(first, db_session) is not None
+    assert await store.get(third, db_session) is not None
+
+
+async def test_만료된_세션은_조회되지_않고_정리된다(host_user: User, db_session: AsyncSession):
+    await db_session.refresh(host_user)
+    now = [0.0]
+    store = MemorySessionStore(ttl=timedelta(minutes=30), clock=lambda: now[0])
+    session_id = await store.create(host_user, db_session)
+
+    now[0] += timedelta(minutes=31).total_seconds()
+    assert await store.purge_expired(db_session) == 1
+    assert await store.get(session_id, db_session) is None
@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jose import jwt
+
+from appserver.apps.account.tokens import (
+    TokenService, TokenKeyError, TokenExpiredError, TokenDecodeError,
+)
+
+
+def private_pem(key) -> str:
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def public_pem(key) -> str:
+    return key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+
+
+def test_발급한_토큰의_헤더에_kid가_들어가고_다시_검증할_수_있다():
+    service = TokenService(keys={"k1": "secret-1"}, active_kid="k1")
+
+    token = service.encode({"sub": "puddingcamp"})
+
+    assert jwt.get_unverified_header(token)["kid"] == "k1"
+    assert service.decode(token)["sub"] == "puddingcamp"
+
+
+def test_만료된_토큰이나_변조된_토큰은_검증하지_않는다():
+    service = TokenService(keys={"k1": "secret-1"}, active_kid="k1")
+
+    with pytest.raises(TokenExpiredError):
+        service.decode(service.encode({"sub": "puddingcamp"}, timedelta(minutes=-1)))
+
+    other = TokenService(keys={"k1": "secret-2"}, active_kid="k1")
+    with pytest.raises(TokenDecodeError):
+        service.decode(other.encode({"sub": "puddingcamp"}))
+
+    with pytest.raises(TokenDecodeError):
+        service.decode("invalid_token")
+
+
+def test_키를_교체해도_이전_키로_서명한_토큰을_검증할_수_있다():
+    old_service = TokenService(keys={"k1": "secret-1"}, active_kid="k1")
+    old_token = old_service.encode({"sub": "puddingcamp"})
+
+    rotated = TokenService(keys={"k1": "secret-1", "k2": "secret-2"}, active_kid="k2")
+    new_token = rotated.encode({"sub": "puddingcamp"})
+
+    assert jwt.get_unverified_header(new_token)["kid"] == "k2"
+    assert rotated.decode(old_token)["sub"] == "puddingcamp"
+    assert rotated.decode(new_token)["sub"] == "puddingcamp"
+
+    # 이전 키를 지우면 이전 토큰은 더 이상 검증되지 않음
+    retired = TokenService(keys={"k2": "secret-2"}, active_kid="k2")
+    with pytest.raises(TokenKeyError):
+        retired.decode(old_token)
+
+
+@pytest.mark.parametrize("algorithm, private_key", [
+    ("ES256", ec.generate_private_key(ec.SECP256R1())),
+    ("EdDSA", ed25519.Ed25519PrivateKey.generate()),
+])
+def test_비대칭_키로_서명하면_공개_키만으로_검증할_수_있다(algorithm, private_key):
+    issuer = TokenService(
+        keys={"edge": private_pem(private_key)},
+        active_kid="edge",
+        algorithm=algorithm,
+    )
+    token = issuer.encode({"sub": "puddingcamp"})
+
+    verifier = TokenService(
+        keys={"edge": public_pem(private_key)},
+        active_kid="edge",
+        algorithm=algorithm,
+    )
+    assert verifier.decode(token)["sub"] == "puddingcamp"
+
+    tampered = token[:-4] + ("AAAA" if not token.endswith("AAAA") else "BBBB")
+    with pytest.raises(Exception):
+        verifier.decode(tampered)
+
+
+def test_키에_정해진_알고리즘과_다른_알고리즘의_토큰은_거절한다():
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    service = TokenService(
+        keys={"k1": "secret-1", "edge": public_pem(private_key)},
+        active_kid="k1",
+        algorithms={"edge": "ES256"},
+    )
+    # 공개 키 문자열을 HMAC 비밀 값처럼 써서 위조한 토큰
+    forged = jwt.encode(
+        {"sub": "attacker"},
+        "secret-1",
+        algorithm="HS256",
+        headers={"kid": "edge"},
+    )
+    with pytest.raises(Exception):
+        service.decode(forged)
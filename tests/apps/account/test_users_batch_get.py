@@ -0,0 +1,50 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.account.schemas import MAX_BATCH_USERNAMES
+
+
+@pytest.fixture()
+def executed_statements(db_session: AsyncSession):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_여러_사용자를_조회_한_번으로_찾아_요청한_username을_키로_돌려준다(
+    client: TestClient,
+    host_user: User,
+    guest_user: User,
+    executed_statements: list[str],
+):
+    usernames = [host_user.username, guest_user.username.upper(), "nobody", host_user.username]
+    response = client.post("/account/users:batchGet", json={"usernames": usernames})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert list(data) == [host_user.username, guest_user.username.upper(), "nobody"]
+    assert data[host_user.username] == {
+        "username": host_user.username,
+        "display_name": host_user.display_name,
+        "is_host": True,
+    }
+    assert data[guest_user.username.upper()]["username"] == guest_user.username
+    assert data["nobody"] is None
+    assert len([statement for statement in executed_statements if "FROM users" in statement]) == 1
+
+
+@pytest.mark.parametrize("usernames", [[], ["user"] * (MAX_BATCH_USERNAMES + 1), [""]])
+def test_username이_없거나_너무_많으면_422_응답을_반환한다(client: TestClient, usernames: list[str]):
+    response = client.post("/account/users:batchGet", json={"usernames": usernames})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -6,6 +6,7 @@ from fastapi.testclient import TestClient
 
 from appserver.apps.account.models import User
 from appserver.apps.calendar.models import TimeSlot, Booking
+from appserver.libs.http.conditional import parse_http_date
 
 
 @pytest.mark.usefixtures("host_user_calendar")
@@ -122,4 +123,27 @@ async def test_게스트는_호스트의_캘린더의_예약_내역을_월_단
     ])
     assert not not data
     assert len(data) == len(booking_dates)
-    assert all([item["when"] in booking_dates for item in data])
\ No newline at end of file
+    assert all([item["when"] in booking_dates for item in data])
+
+async def test_월_단위_예약_내역은_가장_최근에_바뀐_예약으로_Last_Modified를_정한다(
+    client_with_guest_auth: TestClient,
+    host_bookings: list[Booking],
+    host_user: User,
+):
+    params = {"year": 2024, "month": 12}
+    response = client_with_guest_auth.get(f"/calendar/{host_user.username}/bookings", params=params)
+
+    last_modified = parse_http_date(response.headers["last-modified"])
+    latest = max(
+        max(booking.updated_at, booking.time_slot.updated_at)
+        for booking in host_bookings
+        if (booking.when.year, booking.when.month) == (2024, 12)
+    )
+    assert last_modified == latest.replace(microsecond=0)
+
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/bookings",
+        params=params,
+        headers={"If-Modified-Since": response.headers["last-modified"]},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
@@ -0,0 +1,120 @@
+from datetime import date
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.archive import archive_bookings
+from appserver.apps.calendar.deps import use_archive_cutoff
+from appserver.apps.calendar.models import Booking, BookingArchive
+
+
+@pytest.fixture()
+def executed_statements(db_session: AsyncSession):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def test_기준일_이전_예약을_보관_테이블로_옮긴다(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+):
+    booking_ids = {booking.id for booking in host_bookings if booking.when < date(2025, 1, 1)}
+
+    moved = await archive_bookings(db_session, before=date(2025, 1, 1), batch_size=2)
+
+    assert moved == len(booking_ids) == 3
+    recent = (await db_session.execute(select(Booking.when))).scalars().all()
+    assert recent == [date(2025, 1, 7)]
+    archived = (await db_session.execute(select(BookingArchive.id))).scalars().all()
+    assert set(archived) == booking_ids
+
+    # 다시 실행해도 옮길 예약이 없음
+    assert await archive_bookings(db_session, before=date(2025, 1, 1)) == 0
+
+
+async def test_보관된_예약의_id를_새_예약이_다시_쓰지_않는다(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+):
+    last_id = max(booking.id for booking in host_bookings)
+    await archive_bookings(db_session, before=date(2026, 1, 1))
+
+    booking = Booking(
+        when=date(2025, 2, 4),
+        topic="새 예약",
+        description="보관된 예약 다음에 만든 예약",
+        time_slot_id=host_bookings[0].time_slot_id,
+        guest_id=host_bookings[0].guest_id,
+    )
+    db_session.add(booking)
+    await db_session.commit()
+
+    assert booking.id > last_id
+
+
+async def test_보관된_예약도_월_단위_예약_내역에_포함된다(
+    db_session: AsyncSession,
+    client_with_guest_auth: TestClient,
+    host_bookings: list[Booking],
+    host_user: User,
+):
+    await archive_bookings(db_session, before=date(2025, 1, 1))
+
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/bookings",
+        params={"year": 2024, "month": 12},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["when"] for item in response.json()] == ["2024-12-17", "2024-12-10", "2024-12-03"]
+
+
+async def test_보관_기준일_이후_달을_조회하면_보관_테이블을_읽지_않는다(
+    fastapi_app: FastAPI,
+    db_session: AsyncSession,
+    client_with_guest_auth: TestClient,
+    host_bookings: list[Booking],
+    host_user: User,
+    executed_statements: list[str],
+):
+    await archive_bookings(db_session, before=date(2025, 1, 1))
+    fastapi_app.dependency_overrides[use_archive_cutoff] = lambda: date(2025, 1, 1)
+
+    executed_statements.clear()
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/bookings",
+        params={"year": 2025, "month": 1},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["when"] for item in response.json()] == ["2025-01-07"]
+    assert not any("bookings_archive" in statement for statement in executed_statements)
+
+
+@pytest.mark.usefixtures("charming_host_bookings")
+async def test_호스트의_예약_목록은_최근_예약_다음에_보관된_예약을_이어서_보여준다(
+    db_session: AsyncSession,
+    client_with_auth: TestClient,
+    host_bookings: list[Booking],
+):
+    await archive_bookings(db_session, before=date(2024, 12, 15))
+
+    whens = []
+    for page in (1, 2, 3):
+        response = client_with_auth.get("/bookings", params={"page": page, "page_size": 3})
+        assert response.status_code == status.HTTP_200_OK
+        whens.extend(item["when"] for item in response.json())
+
+    assert whens == ["2025-01-07", "2024-12-17", "2024-12-10", "2024-12-03"]
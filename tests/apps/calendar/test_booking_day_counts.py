@@ -0,0 +1,67 @@
+import calendar
+from datetime import date, time
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import TimeSlot
+from appserver.libs.datetime.calendar import get_range_days_of_month
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_예약을_만들면_달력_칸마다_날짜별_예약_수를_돌려준다(
+    db_session: AsyncSession,
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+):
+    # 같은 날짜의 같은 시간대는 한 번만 예약할 수 있으므로 12월 3일은 다른 시간대로
+    afternoon = TimeSlot(
+        start_time=time(14, 0),
+        end_time=time(15, 0),
+        weekdays=[calendar.TUESDAY],
+        calendar_id=time_slot_tuesday.calendar_id,
+    )
+    db_session.add(afternoon)
+    await db_session.commit()
+
+    bookings = [
+        (date(2024, 12, 3), time_slot_tuesday),
+        (date(2024, 12, 3), afternoon),
+        (date(2024, 12, 10), time_slot_tuesday),
+        (date(2025, 1, 7), time_slot_tuesday),
+    ]
+    for when, time_slot in bookings:
+        payload = {
+            "when": when.isoformat(),
+            "topic": "test",
+            "description": "test",
+            "time_slot_id": time_slot.id,
+        }
+        response = client_with_guest_auth.post(f"/bookings/{host_user.username}", json=payload)
+        assert response.status_code == status.HTTP_201_CREATED
+
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/booking-counts",
+        params={"year": 2024, "month": 12},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["day"] for item in data["days"]] == get_range_days_of_month(2024, 12)
+    counts = {item["day"]: item["count"] for item in data["days"] if item["count"]}
+    assert counts == {3: 2, 10: 1}
+
+
+async def test_호스트가_없으면_날짜별_예약_수_요청에_HTTP_404_응답한다(
+    client_with_guest_auth: TestClient,
+):
+    response = client_with_guest_auth.get(
+        "/calendar/not_exist/booking-counts",
+        params={"year": 2024, "month": 12},
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,128 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.calendar.models import Booking
+
+
+@pytest.fixture()
+def executed_statements(db_session: AsyncSession):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture()
+async def searchable_bookings(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+    charming_host_bookings: list[Booking],
+) -> list[Booking]:
+    # 주제/설명을 고치면 트리거가 검색 색인도 고침
+    host_bookings[0].topic = "주간 회의"
+    host_bookings[0].description = "회의 <자료> 준비"
+    host_bookings[1].description = "회의록 정리"
+    host_bookings[3].topic = "회의 회고"
+    for booking in charming_host_bookings:
+        booking.description = "다른 호스트의 회의"
+    await db_session.commit()
+    return host_bookings
+
+
+def search(client: TestClient, **params):
+    response = client.get("/bookings/search", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+def test_호스트_캘린더의_예약을_단어_앞부분으로_찾아_최신순으로_보여_준다(
+    client_with_auth: TestClient,
+    searchable_bookings: list[Booking],
+):
+    data = search(client_with_auth, q="회의")
+
+    expected = [searchable_bookings[3], searchable_bookings[1], searchable_bookings[0]]
+    assert [item["id"] for item in data["items"]] == [booking.id for booking in expected]
+    assert data["next_cursor"] is None
+
+
+def test_일치한_부분을_강조하고_나머지는_이스케이프한다(
+    client_with_auth: TestClient,
+    searchable_bookings: list[Booking],
+):
+    data = search(client_with_auth, q="자료")
+
+    assert [item["id"] for item in data["items"]] == [searchable_bookings[0].id]
+    assert data["items"][0]["snippet"] == "회의 &lt;<mark>자료</mark>&gt; 준비"
+
+
+def test_커서로_다음_쪽을_읽는다(client_with_auth: TestClient, searchable_bookings: list[Booking]):
+    first = search(client_with_auth, q="회의", limit=2)
+    second = search(client_with_auth, q="회의", limit=2, cursor=first["next_cursor"])
+
+    assert [item["id"] for item in first["items"]] == [searchable_bookings[3].id, searchable_bookings[1].id]
+    assert [item["id"] for item in second["items"]] == [searchable_bookings[0].id]
+    assert second["next_cursor"] is None
+
+
+async def test_지운_예약은_찾지_않는다(
+    db_session: AsyncSession,
+    client_with_auth: TestClient,
+    searchable_bookings: list[Booking],
+):
+    await db_session.delete(searchable_bookings[3])
+    await db_session.commit()
+
+    data = search(client_with_auth, q="회고")
+
+    assert data["items"] == []
+
+
+@pytest.mark.usefixtures("searchable_bookings")
+def test_잘못된_커서이면_422_응답을_반환한다(client_with_auth: TestClient):
+    response = client_with_auth.get("/bookings/search", params={"q": "회의", "cursor": "not-a-cursor"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.usefixtures("searchable_bookings")
+def test_게스트는_예약을_검색할_수_없다(client_with_guest_auth: TestClient):
+    response = client_with_guest_auth.get("/bookings/search", params={"q": "회의"})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_고른_필드만_읽고_커서로_다음_쪽을_읽는다(
+    client_with_auth: TestClient,
+    searchable_bookings: list[Booking],
+    executed_statements: list[str],
+):
+    first = search(client_with_auth, q="회의", limit=2, fields="topic,snippet")
+    second = search(client_with_auth, q="회의", limit=2, fields="topic,snippet", cursor=first["next_cursor"])
+
+    assert first["items"] == [
+        {"topic": "회의 회고", "snippet": "<mark>회의</mark> 회고"},
+        {"topic": "test", "snippet": "<mark>회의록</mark> 정리"},
+    ]
+    assert [item["topic"] for item in second["items"]] == ["주간 회의"]
+    assert second["next_cursor"] is None
+    statements = [statement for statement in executed_statements if "FROM bookings" in statement]
+    assert statements
+    assert all("bookings.description" not in statement for statement in statements)
+
+
+def test_검색_결과에_없는_필드를_고르면_HTTP_422_응답을_한다(
+    client_with_auth: TestClient,
+    searchable_bookings: list[Booking],
+):
+    response = client_with_auth.get("/bookings/search", params={"q": "회의", "fields": "guest_id"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
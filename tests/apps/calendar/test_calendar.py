@@ -1,4 +1,5 @@
 import pytest
+from fastapi import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from appserver.apps.account.models import User
 from appserver.apps.calendar.models import Calendar
@@ -27,7 +28,7 @@ async def test_호스트인_사용자의_username_으로_캘린더_정보를_가
     }
     user = users[user_key]
 
-    result = await host_calendar_detail(host_user.username, user, db_session)
+    result = await host_calendar_detail(host_user.username, user, db_session, None, Response())
 
     assert isinstance(result, expected_type)
     result_keys = frozenset(result.model_dump().keys())
@@ -44,7 +45,9 @@ async def test_존재하지_않는_사용자의_username_으로_캘린더_정보
     db_session: AsyncSession,
 ):
     with pytest.raises(HostNotFoundError):
-        await host_calendar_detail(host_username="not_exist_user", user=None, session=db_session)
+        await host_calendar_detail(
+            host_username="not_exist_user", user=None, session=db_session, user_id_cache=None, response=Response(),
+        )
 
 
 async def test_호스트_유저가_아닌_유저가_캘린더_정보를_가져오려_하면_404_응답을_반환한다(
@@ -52,6 +55,6 @@ async def test_호스트_유저가_아닌_유저가_캘린더_정보를_가져
     db_session: AsyncSession,
 ):
     with pytest.raises(CalendarNotFoundError):
-        await host_calendar_detail(guest_user.username, guest_user, db_session)
+        await host_calendar_detail(guest_user.username, guest_user, db_session, None, Response())
 
         
\ No newline at end of file
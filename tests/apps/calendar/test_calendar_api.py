@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
@@ -7,6 +9,7 @@ from appserver.apps.calendar.models import Calendar
 from appserver.apps.calendar.schemas import CalendarOut, CalendarDetailOut
 from appserver.apps.calendar.endpoints import host_calendar_detail
 from appserver.libs.collections.sort import deduplicate_and_sort
+from appserver.libs.http.conditional import format_http_date
 
 
 @pytest.mark.parametrize("user_key, expected_type", [
@@ -142,4 +145,53 @@ async def test_사용자가_변경하는_항목만_변경되고_나머지는_기
 
     # 변경되지 않은 항목은 기존 값을 유지한다.
     for key in UPDATABLE_FIELDS - frozenset(payload.keys()):
-        assert data[key] == before_data[key]
\ No newline at end of file
+        assert data[key] == before_data[key]
+
+async def test_캘린더_정보에는_Last_Modified를_붙이고_바뀌지_않았으면_304_응답을_반환한다(
+    host_user: User,
+    host_user_calendar: Calendar,
+    client: TestClient,
+):
+    response = client.get(f"/calendar/{host_user.username}")
+    last_modified = response.headers["last-modified"]
+    assert last_modified == format_http_date(host_user_calendar.updated_at)
+
+    response = client.get(f"/calendar/{host_user.username}", headers={"If-Modified-Since": last_modified})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["last-modified"] == last_modified
+
+
+async def test_호스트_본인의_캘린더_정보는_비공개로_캐시하고_304로_바꾸지_않는다(
+    host_user: User,
+    host_user_calendar: Calendar,
+    client: TestClient,
+    client_with_auth: TestClient,
+):
+    anonymous = client.get(f"/calendar/{host_user.username}")
+    assert "cookie" in anonymous.headers["vary"].lower()
+
+    response = client_with_auth.get(
+        f"/calendar/{host_user.username}",
+        headers={"If-Modified-Since": anonymous.headers["last-modified"]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "google_calendar_id" in response.json()
+    assert response.headers["cache-control"] == "private"
+    assert "last-modified" not in response.headers
+    assert "authorization" in response.headers["vary"].lower()
+
+
+async def test_캘린더가_바뀌었으면_If_Modified_Since가_있어도_다시_보낸다(
+    host_user: User,
+    host_user_calendar: Calendar,
+    client: TestClient,
+):
+    earlier = format_http_date(host_user_calendar.updated_at - timedelta(seconds=1))
+
+    response = client.get(f"/calendar/{host_user.username}", headers={"If-Modified-Since": earlier})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["topics"] == host_user_calendar.topics
@@ -0,0 +1,26 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from appserver.apps.account.models import User
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+def test_여러_호스트의_캘린더를_한_번에_조회한다(client: TestClient, host_user: User, guest_user: User):
+    usernames = [host_user.username, guest_user.username, "nobody"]
+    response = client.post("/calendars:batchGet", json={"usernames": usernames})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data[host_user.username]["timezone"] == "Asia/Seoul"
+    assert "google_calendar_id" not in data[host_user.username]
+    assert data[guest_user.username] is None
+    assert data["nobody"] is None
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+def test_호스트_자신의_캘린더는_자세한_정보로_돌려준다(client_with_auth: TestClient, host_user: User):
+    response = client_with_auth.post("/calendars:batchGet", json={"usernames": [host_user.username]})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()[host_user.username]["google_calendar_id"] == "1234567890"
@@ -0,0 +1,89 @@
+import json
+from datetime import date
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.events import stream_sse
+from appserver.apps.calendar.models import TimeSlot
+from appserver.libs.pubsub.broker import LocalBroker
+from appserver.libs.pubsub.hub import PubSubHub
+
+
+async def test_SSE_스트림은_이벤트를_보내고_이벤트가_없으면_주석으로_연결을_유지한다():
+    hub = PubSubHub(LocalBroker(), max_queue_size=1)
+    subscription = hub.subscribe("calendar:1")
+    stream = stream_sse(subscription, heartbeat=0.01)
+
+    assert await anext(stream) == b"retry: 3000\n\n"
+    assert await anext(stream) == b": ping\n\n"
+    await hub.publish("calendar:1", {"type": "booking.created", "data": {"when": "2024-12-03"}})
+    assert await anext(stream) == b'event: booking.created\ndata: {"when":"2024-12-03"}\n\n'
+
+    # 느린 구독자: overflow를 보내고 스트림을 끝냄
+    await hub.publish("calendar:1", {"type": "booking.created"})
+    await hub.publish("calendar:1", {"type": "booking.created"})
+    assert await anext(stream) == b"event: booking.created\ndata: {}\n\n"
+    assert await anext(stream) == b"event: overflow\ndata: {}\n\n"
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+    assert len(hub) == 0
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+def test_WebSocket으로_예약과_시간대_생성_이벤트를_받는다(
+    fastapi_app: FastAPI,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+    client_with_auth: TestClient,
+):
+    with client_with_auth.websocket_connect(f"/calendar/{host_user.username}/events/ws") as websocket:
+        assert len(fastapi_app.state.event_hub) == 1
+
+        payload = {"start_time": "13:00", "end_time": "14:00", "weekdays": [1]}
+        response = client_with_auth.post("/time-slots", json=payload)
+        assert response.status_code == status.HTTP_201_CREATED
+        message = json.loads(websocket.receive_text())
+        assert message["type"] == "time_slot.created"
+        assert message["data"]["start_time"] == "13:00:00"
+
+        payload = {
+            "when": date(2024, 12, 3).isoformat(),
+            "topic": "test",
+            "description": "test",
+            "time_slot_id": time_slot_tuesday.id,
+        }
+        response = client_with_auth.post(f"/bookings/{host_user.username}", json=payload)
+        assert response.status_code == status.HTTP_201_CREATED
+        message = json.loads(websocket.receive_text())
+        assert message == {
+            "type": "booking.created",
+            "data": {"when": "2024-12-03", "time_slot_id": time_slot_tuesday.id, "recurrence": None},
+        }
+
+
+def test_호스트가_없으면_WebSocket_연결을_거절한다(client: TestClient):
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/calendar/not_exist/events/ws"):
+            pass
+
+    assert exc_info.value.code == status.WS_1008_POLICY_VIOLATION
+
+
+def test_호스트가_없으면_SSE_요청에_HTTP_404_응답한다(client: TestClient):
+    response = client.get("/calendar/not_exist/events")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+def test_구독자가_가득_차면_SSE_요청에_HTTP_503_응답한다(fastapi_app: FastAPI, host_user: User, client: TestClient):
+    fastapi_app.state.event_hub.max_subscribers = 0
+
+    response = client.get(f"/calendar/{host_user.username}/events")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["retry-after"] == "5"
@@ -0,0 +1,105 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Calendar, CalendarTopic
+from appserver.apps.calendar.topics import sync_calendar_topics
+
+
+@pytest.fixture()
+async def indexed_calendars(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    charming_host_calendar: Calendar,
+) -> list[Calendar]:
+    # 픽스처는 캘린더를 DB에 바로 넣으므로 색인도 직접 채움
+    host_user_calendar.topics = ["Python", "FastAPI"]
+    charming_host_calendar.topics = ["Python Backend", "Django"]
+    for calendar in (host_user_calendar, charming_host_calendar):
+        await sync_calendar_topics(db_session, calendar.id, calendar.topics)
+    await db_session.commit()
+    return [host_user_calendar, charming_host_calendar]
+
+
+async def get_indexed_topics(db_session: AsyncSession, calendar_id: int) -> list[str]:
+    stmt = select(CalendarTopic.topic).where(CalendarTopic.calendar_id == calendar_id)
+    result = await db_session.execute(stmt)
+    return sorted(result.scalars().all())
+
+
+@pytest.mark.usefixtures("indexed_calendars")
+def test_주제가_정확히_일치하는_캘린더를_찾는다(client: TestClient, host_user: User):
+    response = client.get("/calendars/search", params={"topic": "  python "})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["host_username"] for item in data] == [host_user.username]
+    assert data[0]["topics"] == ["Python", "FastAPI"]
+    assert data[0]["score"] == 2
+
+
+@pytest.mark.usefixtures("indexed_calendars")
+def test_검색어와_많이_일치하는_캘린더부터_보여_준다(
+    client: TestClient,
+    host_user: User,
+    charming_host_user: User,
+):
+    response = client.get("/calendars/search", params={"q": "python django"})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    # charming_host: "python backend"(접두어 1점) + "django"(일치 2점) / puddingcamp: "python"(일치 2점)
+    assert [(item["host_username"], item["score"]) for item in data] == [
+        (charming_host_user.username, 3),
+        (host_user.username, 2),
+    ]
+
+
+@pytest.mark.usefixtures("indexed_calendars")
+def test_검색_결과를_나눠서_받는다(client: TestClient, charming_host_user: User):
+    response = client.get("/calendars/search", params={"q": "py", "page": 2, "page_size": 1})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["host_username"] for item in response.json()] == [charming_host_user.username]
+
+
+@pytest.mark.usefixtures("indexed_calendars")
+def test_topic과_q를_함께_주면_topic이_있는_캘린더만_찾는다(client: TestClient, charming_host_user: User):
+    response = client.get("/calendars/search", params={"topic": "django", "q": "python"})
+
+    assert [item["host_username"] for item in response.json()] == [charming_host_user.username]
+
+
+def test_topic과_q가_모두_없으면_422_응답을_반환한다(client: TestClient):
+    response = client.get("/calendars/search", params={"q": "  "})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_캘린더를_만들고_고치면_주제_색인도_바뀐다(
+    db_session: AsyncSession,
+    host_user: User,
+    client_with_auth: TestClient,
+):
+    payload = {
+        "topics": ["Python", "FastAPI"],
+        "description": "description",
+        "google_calendar_id": "valid_google_calendar_id@group.calendar.google.com",
+    }
+    response = client_with_auth.post("/calendar", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    calendar_id = (await db_session.execute(select(Calendar.id))).scalar_one()
+    assert await get_indexed_topics(db_session, calendar_id) == ["fastapi", "python"]
+
+    # 테스트는 요청끼리 DB 세션을 함께 쓰므로 host_user.calendar를 다시 읽음
+    await db_session.refresh(host_user)
+
+    response = client_with_auth.patch("/calendar", json={"topics": ["Rust"]})
+    assert response.status_code == status.HTTP_200_OK
+    assert await get_indexed_topics(db_session, calendar_id) == ["rust"]
+
+    response = client_with_auth.get("/calendars/search", params={"topic": "rust"})
+    assert len(response.json()) == 1
@@ -0,0 +1,100 @@
+from datetime import date
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+
+
+@pytest.fixture()
+async def new_york_calendar(db_session: AsyncSession, host_user_calendar: Calendar) -> Calendar:
+    host_user_calendar.timezone = "America/New_York"
+    await db_session.commit()
+    return host_user_calendar
+
+
+def test_캘린더를_만들_때_시간대를_정하지_않으면_기본_시간대를_쓴다(client_with_auth: TestClient):
+    payload = {
+        "topics": ["Python"],
+        "description": "description",
+        "google_calendar_id": "valid_google_calendar_id@group.calendar.google.com",
+    }
+    response = client_with_auth.post("/calendar", json=payload)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["timezone"] == "Asia/Seoul"
+
+
+def test_IANA_시간대가_아니면_422_응답을_반환한다(client_with_auth: TestClient):
+    payload = {
+        "topics": ["Python"],
+        "description": "description",
+        "google_calendar_id": "valid_google_calendar_id@group.calendar.google.com",
+        "timezone": "KST",
+    }
+    response = client_with_auth.post("/calendar", json=payload)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.usefixtures("time_slot_tuesday")
+def test_예약_가능한_시간대에_캘린더_시간대_기준_UTC_시각을_담는다(client: TestClient, host_user: User):
+    response = client.get(f"/calendar/{host_user.username}/availability", params={"when": "2024-12-03"})
+
+    assert response.status_code == status.HTTP_200_OK
+    item = response.json()[0]
+    assert (item["start_time"], item["start_at"], item["end_at"]) == (
+        "09:00:00", "2024-12-03T00:00:00Z", "2024-12-03T01:00:00Z",
+    )
+
+
+@pytest.mark.usefixtures("new_york_calendar")
+def test_기간_예약_가능_시각은_서머타임_전후의_오프셋으로_바꾼다(
+    client: TestClient,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    params = {"start": "2024-03-01", "end": "2024-03-20"}
+    response = client.get(f"/calendar/{host_user.username}/availability/range", params=params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [(item["time_slot_id"], item["when"], item["start_at"]) for item in response.json()] == [
+        (time_slot_tuesday.id, "2024-03-05", "2024-03-05T14:00:00Z"),
+        (time_slot_tuesday.id, "2024-03-12", "2024-03-12T13:00:00Z"),
+        (time_slot_tuesday.id, "2024-03-19", "2024-03-19T13:00:00Z"),
+    ]
+
+
+@pytest.mark.usefixtures("new_york_calendar")
+async def test_기간_예약_가능_시각에서_예약된_날짜는_뺀다(
+    db_session: AsyncSession,
+    client: TestClient,
+    host_user: User,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    db_session.add(Booking(
+        when=date(2024, 3, 12),
+        topic="test",
+        description="test",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    ))
+    await db_session.commit()
+
+    params = {"start": "2024-03-01", "end": "2024-03-20"}
+    response = client.get(f"/calendar/{host_user.username}/availability/range", params=params)
+
+    assert [item["when"] for item in response.json()] == ["2024-03-05", "2024-03-19"]
+
+
+@pytest.mark.parametrize("start, end", [("2024-03-01", "2024-03-01"), ("2024-01-01", "2024-06-01")])
+@pytest.mark.usefixtures("time_slot_tuesday")
+def test_기간이_비었거나_너무_길면_422_응답을_반환한다(client: TestClient, host_user: User, start: str, end: str):
+    params = {"start": start, "end": end}
+    response = client.get(f"/calendar/{host_user.username}/availability/range", params=params)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,165 @@
+from datetime import date
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.archive import archive_bookings
+from appserver.apps.calendar.models import Booking, TimeSlot
+
+
+def create_booking(client: TestClient, host_user: User, time_slot: TimeSlot, when: date, recurrence: str | None):
+    payload = {
+        "when": when.isoformat(),
+        "topic": "정기 상담",
+        "description": "매주 화요일",
+        "time_slot_id": time_slot.id,
+        "recurrence": recurrence,
+    }
+    return client.post(f"/bookings/{host_user.username}", json=payload)
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_반복_예약은_규칙을_정리해서_한_행으로_저장한다(
+    db_session: AsyncSession,
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+):
+    response = create_booking(
+        client_with_guest_auth, host_user, time_slot_tuesday, date(2024, 12, 3), "freq=weekly;count=4",
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert data["recurrence"] == "FREQ=WEEKLY;INTERVAL=1;COUNT=4"
+    assert data["recurrence_until"] == "2024-12-24"
+    booking = await db_session.get(Booking, data["id"])
+    assert booking.when == date(2024, 12, 3)
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_월_단위_예약_내역과_날짜별_예약_수에_그_달의_반복_날짜만_펼친다(
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+):
+    response = create_booking(
+        client_with_guest_auth, host_user, time_slot_tuesday, date(2024, 11, 19), "FREQ=WEEKLY;INTERVAL=2",
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    params = {"year": 2024, "month": 12}
+    response = client_with_guest_auth.get(f"/calendar/{host_user.username}/bookings", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["when"] for item in response.json()] == ["2024-12-31", "2024-12-17", "2024-12-03"]
+
+    response = client_with_guest_auth.get(f"/calendar/{host_user.username}/booking-counts", params=params)
+    counts = {item["day"]: item["count"] for item in response.json()["days"] if item["count"]}
+    assert counts == {3: 1, 17: 1, 31: 1}
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_반복_예약이_있는_날에는_그_시간대를_예약할_수_없다고_보여_준다(
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+):
+    response = create_booking(
+        client_with_guest_auth, host_user, time_slot_tuesday, date(2024, 12, 3), "FREQ=WEEKLY;UNTIL=20241217",
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    url = f"/calendar/{host_user.username}/availability"
+    assert client_with_guest_auth.get(url, params={"when": "2024-12-10"}).json() == []
+    after = client_with_guest_auth.get(url, params={"when": "2024-12-24"}).json()
+    assert [item["id"] for item in after] == [time_slot_tuesday.id]
+
+
+@pytest.mark.parametrize("recurrence", [
+    "FREQ=DAILY;COUNT=3",
+    "FREQ=WEEKLY;BYDAY=TU,WE",
+    "FREQ=WEEKLY;BYDAY=WE",
+    "FREQ=MONTHLY",
+    "FREQ=WEEKLY;COUNT=2;UNTIL=20250101",
+])
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_시간대의_요일과_맞지_않거나_지원하지_않는_반복_규칙이면_422_응답을_반환한다(
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+    recurrence: str,
+):
+    response = create_booking(client_with_guest_auth, host_user, time_slot_tuesday, date(2024, 12, 3), recurrence)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_끝나지_않은_반복_예약은_보관하지_않는다(
+    db_session: AsyncSession,
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+):
+    # 같은 시간대에 날짜가 겹치지 않도록 격주로 나눔
+    bookings = [
+        (date(2024, 12, 3), "FREQ=WEEKLY;INTERVAL=2"),
+        (date(2024, 12, 10), "FREQ=WEEKLY;INTERVAL=2;COUNT=2"),
+        (date(2024, 11, 26), None),
+    ]
+    for when, recurrence in bookings:
+        response = create_booking(client_with_guest_auth, host_user, time_slot_tuesday, when, recurrence)
+        assert response.status_code == status.HTTP_201_CREATED
+
+    moved = await archive_bookings(db_session, before=date(2025, 1, 1))
+
+    # 2주로 끝난 반복 예약과 한 번 예약만 옮김
+    assert moved == 2
+
+
+@pytest.mark.parametrize("existing, new, conflict", [
+    # 끝없는 반복 예약이 이미 예약된 날부터 시작
+    ((date(2024, 12, 3), None), (date(2024, 12, 3), "FREQ=WEEKLY"), "2024-12-03"),
+    # 반복 예약의 뒤쪽 날짜에 이미 예약이 있음
+    ((date(2025, 1, 7), None), (date(2024, 12, 3), "FREQ=WEEKLY"), "2025-01-07"),
+    # 이미 있는 반복 예약의 날짜에 한 번 예약
+    ((date(2024, 11, 19), "FREQ=WEEKLY;INTERVAL=2"), (date(2024, 12, 17), None), "2024-12-17"),
+    # 격주 반복 예약끼리 몇 주 뒤에 겹침
+    ((date(2024, 12, 3), "FREQ=WEEKLY;INTERVAL=2"), (date(2024, 12, 10), "FREQ=WEEKLY;INTERVAL=3"), "2024-12-31"),
+])
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_같은_시간대에_날짜가_겹치는_예약이_있으면_409_응답을_반환한다(
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+    existing: tuple[date, str | None],
+    new: tuple[date, str | None],
+    conflict: str,
+):
+    response = create_booking(client_with_guest_auth, host_user, time_slot_tuesday, *existing)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = create_booking(client_with_guest_auth, host_user, time_slot_tuesday, *new)
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert conflict in response.json()["detail"]
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_날짜가_겹치지_않는_반복_예약은_함께_예약할_수_있다(
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+):
+    for when in (date(2024, 12, 3), date(2024, 12, 10)):
+        response = create_booking(client_with_guest_auth, host_user, time_slot_tuesday, when, "FREQ=WEEKLY;INTERVAL=2")
+        assert response.status_code == status.HTTP_201_CREATED
+
+    # 첫 반복 예약이 끝난 뒤의 날짜
+    response = create_booking(
+        client_with_guest_auth, host_user, time_slot_tuesday, date(2024, 11, 26), None,
+    )
+    assert response.status_code == status.HTTP_201_CREATED
@@ -0,0 +1,110 @@
+import calendar
+from datetime import date, time
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Calendar, TimeSlot
+
+
+@pytest.fixture()
+def executed_statements(db_session: AsyncSession):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def booking_payload(time_slot_id: int, when: date) -> dict:
+    return {
+        "when": when.isoformat(),
+        "topic": "test",
+        "description": "test",
+        "time_slot_id": time_slot_id,
+    }
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_일정표를_만든_뒤에는_시간대를_조회하지_않고_예약을_검증한다(
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+    executed_statements: list[str],
+):
+    payload = booking_payload(time_slot_tuesday.id, date(2024, 12, 3))
+    response = client_with_guest_auth.post(f"/bookings/{host_user.username}", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    executed_statements.clear()
+    payload = booking_payload(time_slot_tuesday.id, date(2024, 12, 10))
+    response = client_with_guest_auth.post(f"/bookings/{host_user.username}", json=payload)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["time_slot"]["start_time"] == "09:00:00"
+    # 캘린더의 시간대 목록을 다시 읽지 않음
+    assert not any("time_slots.calendar_id" in statement for statement in executed_statements)
+
+
+async def test_다른_워커에서_만든_시간대도_예약과_겹침_확인에_반영한다(
+    db_session: AsyncSession,
+    fastapi_app: FastAPI,
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    host_user_calendar: Calendar,
+    client_with_auth: TestClient,
+):
+    # 일정표를 한 번 만들어 둠
+    response = client_with_auth.get(
+        f"/calendar/{host_user.username}/availability",
+        params={"when": "2024-12-04"},
+    )
+    assert response.json() == []
+    assert len(fastapi_app.state.schedule_cache) == 1
+
+    # 캐시를 거치지 않고 시간대를 추가 (다른 워커에서 만든 경우)
+    time_slot = TimeSlot(
+        start_time=time(13, 0),
+        end_time=time(14, 0),
+        weekdays=[calendar.WEDNESDAY],
+        calendar_id=host_user_calendar.id,
+    )
+    db_session.add(time_slot)
+    await db_session.commit()
+
+    payload = booking_payload(time_slot.id, date(2024, 12, 4))
+    response = client_with_auth.post(f"/bookings/{host_user.username}", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    payload = {"start_time": "13:30", "end_time": "14:30", "weekdays": [calendar.WEDNESDAY]}
+    response = client_with_auth.post("/time-slots", json=payload)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_시간대를_만들면_예약_가능한_시간대에_바로_반영한다(
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_auth: TestClient,
+):
+    params = {"when": "2024-12-03"}
+    response = client_with_auth.get(f"/calendar/{host_user.username}/availability", params=params)
+    assert [item["id"] for item in response.json()] == [time_slot_tuesday.id]
+
+    payload = {"start_time": "07:00", "end_time": "08:00", "weekdays": [calendar.TUESDAY]}
+    response = client_with_auth.post("/time-slots", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = client_with_auth.get(f"/calendar/{host_user.username}/availability", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert [(item["start_time"], item["end_time"]) for item in response.json()] == [
+        ("07:00:00", "08:00:00"),
+        ("09:00:00", "10:00:00"),
+    ]
@@ -0,0 +1,139 @@
+from datetime import date
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.archive import archive_bookings
+from appserver.apps.calendar.models import Booking, Calendar
+from appserver.apps.calendar.schemas import BookingOut
+from appserver.apps.calendar.topics import sync_calendar_topics
+
+
+@pytest.fixture()
+def executed_statements(db_session: AsyncSession):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def booking_statements(statements: list[str]) -> list[str]:
+    return [statement for statement in statements if "FROM bookings" in statement]
+
+
+async def test_예약_목록에서_고른_필드만_읽어서_돌려준다(
+    client_with_auth: TestClient,
+    host_bookings: list[Booking],
+    executed_statements: list[str],
+):
+    response = client_with_auth.get(
+        "/bookings",
+        params={"page": 1, "page_size": 10, "fields": "when,time_slot.start_time, topic"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data) == len(host_bookings)
+    # 스키마의 필드 순서로 담음
+    assert list(data[0]) == ["when", "topic", "time_slot"]
+    assert data[0]["time_slot"] == {"start_time": "09:00:00"}
+    assert [item["when"] for item in data] == sorted((item["when"] for item in data), reverse=True)
+
+    statements = booking_statements(executed_statements)
+    assert statements
+    assert all("description" not in statement for statement in statements)
+
+
+async def test_fields가_없으면_전체_필드를_돌려준다(
+    client_with_auth: TestClient,
+    host_bookings: list[Booking],
+):
+    response = client_with_auth.get("/bookings", params={"page": 1, "page_size": 1})
+
+    assert response.status_code == status.HTTP_200_OK
+    item = response.json()[0]
+    assert set(item) == set(BookingOut.model_fields)
+    assert item["recurrence"] is None
+
+
+async def test_중첩_모델_이름만_주면_그_모델의_필드를_모두_돌려준다(
+    client_with_auth: TestClient,
+    host_bookings: list[Booking],
+):
+    response = client_with_auth.get(
+        "/bookings", params={"page": 1, "page_size": 1, "fields": "id,time_slot"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert set(data[0]) == {"id", "time_slot"}
+    assert set(data[0]["time_slot"]) == {"start_time", "end_time", "weekdays", "created_at", "updated_at"}
+
+
+@pytest.mark.usefixtures("charming_host_bookings")
+async def test_고른_필드로도_최근_예약_다음에_보관된_예약을_이어서_보여준다(
+    db_session: AsyncSession,
+    client_with_auth: TestClient,
+    host_bookings: list[Booking],
+):
+    await archive_bookings(db_session, before=date(2024, 12, 15))
+
+    items = []
+    for page in (1, 2, 3):
+        response = client_with_auth.get("/bookings", params={"page": page, "page_size": 3, "fields": "when"})
+        assert response.status_code == status.HTTP_200_OK
+        items.extend(response.json())
+
+    assert items == [{"when": when} for when in ["2025-01-07", "2024-12-17", "2024-12-10", "2024-12-03"]]
+
+
+@pytest.mark.parametrize("fields", ["when,guest_id", "topic.name", "time_slot.calendar_id", " , "])
+@pytest.mark.usefixtures("host_bookings")
+async def test_응답_스키마에_없는_필드를_고르면_HTTP_422_응답을_한다(client_with_auth: TestClient, fields: str):
+    response = client_with_auth.get("/bookings", params={"page": 1, "page_size": 10, "fields": fields})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_캘린더_검색에서_고른_필드만_돌려준다(
+    db_session: AsyncSession,
+    client: TestClient,
+    host_user: User,
+    host_user_calendar: Calendar,
+    executed_statements: list[str],
+):
+    await sync_calendar_topics(db_session, host_user_calendar.id, ["Python"])
+    await db_session.commit()
+
+    response = client.get("/calendars/search", params={"topic": "python", "fields": "score,host_username,timezone"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"timezone": host_user_calendar.timezone, "host_username": host_user.username, "score": 2},
+    ]
+    statements = [statement for statement in executed_statements if "FROM calendars" in statement]
+    assert statements
+    assert all("description" not in statement for statement in statements)
+
+
+def test_OpenAPI_문서에_고른_필드만_담은_응답_모양을_적는다(fastapi_app: FastAPI):
+    schema = fastapi_app.openapi()
+
+    for path, model in [
+        ("/bookings", "PartialBookingOut"),
+        ("/calendars/search", "PartialCalendarSearchResultOut"),
+        ("/bookings/search", "PartialBookingSearchOut"),
+    ]:
+        operation = schema["paths"][path]["get"]
+        assert "fields" in [parameter["name"] for parameter in operation["parameters"]]
+        assert f"#/components/schemas/{model}" in str(operation["responses"]["200"])
+    assert "required" not in schema["components"]["schemas"]["PartialBookingOut"]
@@ -7,9 +7,13 @@ from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from appserver.db import create_async_engine, create_session, use_session
-from appserver.app import include_routers
+from appserver.app import create_app
+from appserver.settings import Settings
 from appserver.apps.account import models as account_models
 from appserver.apps.calendar import models as calendar_models
+from appserver.libs.idempotency import store as idempotency_store
+from appserver.libs.pubsub import database as pubsub_database
+from appserver.libs.scheduler import lease as scheduler_lease
 from appserver.apps.account.utils import hash_password
 from appserver.apps.account.schemas import LoginPayload
 from sqlmodel import SQLModel
@@ -41,8 +45,7 @@ async def db_session():
 
 @pytest.fixture()
 def fastapi_app(db_session: AsyncSession):
-    app = FastAPI()       
-    include_routers(app)  
+    app = create_app(Settings(database_dsn="sqlite+aiosqlite:///:memory:"))
 
     async def override_use_session():
         yield db_session
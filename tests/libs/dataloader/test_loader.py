@@ -0,0 +1,72 @@
+import asyncio
+import gc
+
+import pytest
+
+from appserver.libs.dataloader.loader import DataLoader
+
+
+async def test_같은_차례에_요청한_키는_나눠서_차례로_한_번씩_읽는다():
+    calls = []
+    running = 0
+
+    async def batch_load(keys: list[int]) -> dict[int, int]:
+        nonlocal running
+        running += 1
+        assert running == 1  # 같은 세션을 동시에 쓰지 않음
+        calls.append(keys)
+        await asyncio.sleep(0)
+        running -= 1
+        return {key: key * 10 for key in keys}
+
+    loader = DataLoader(batch_load, max_batch_size=2)
+    first, second = await asyncio.gather(loader.load_many([1, 2, 3]), loader.load_many([3, 2]))
+
+    assert (first, second) == ([10, 20, 30], [30, 20])
+    assert calls == [[1, 2], [3]]
+
+
+async def test_조회에_실패한_키는_다음에_다시_읽는다():
+    attempts = []
+
+    async def batch_load(keys: list[str]) -> dict[str, str]:
+        attempts.append(keys)
+        if len(attempts) == 1:
+            raise RuntimeError("db down")
+        return {key: key for key in keys}
+
+    loader = DataLoader(batch_load)
+    with pytest.raises(RuntimeError):
+        await loader.load("a")
+
+    assert await loader.load("a") == "a"
+    assert attempts == [["a"], ["a"]]
+
+
+async def test_미리_넣어_둔_값은_조회하지_않는다():
+    async def batch_load(keys: list[str]) -> dict[str, str]:
+        raise AssertionError("should not load")
+
+    loader = DataLoader(batch_load, normalize=str.lower)
+    loader.prime("PuddingCamp", "host")
+
+    assert await loader.load("puddingcamp") == "host"
+
+
+async def test_읽는_중인_작업은_끝날_때까지_보관한다():
+    release = asyncio.Event()
+
+    async def batch_load(keys):
+        await release.wait()
+        return {key: key * 10 for key in keys}
+
+    loader = DataLoader(batch_load)
+    future = loader.load(1)
+    await asyncio.sleep(0)
+
+    assert len(loader._tasks) == 1
+    # 다른 곳에서 작업을 참조하지 않아도 GC되지 않음
+    gc.collect()
+    release.set()
+    assert await asyncio.wait_for(future, 1) == 10
+    assert loader._tasks == set()
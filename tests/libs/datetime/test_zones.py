@@ -0,0 +1,34 @@
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from appserver.libs.datetime.zones import ZoneOffsetTable, get_zone_table
+
+
+def expected_utc(name: str, day: date, at: time) -> datetime:
+    return datetime.combine(day, at, tzinfo=ZoneInfo(name)).astimezone(timezone.utc)
+
+
+@pytest.mark.parametrize("name", ["America/New_York", "Europe/Berlin", "Australia/Lord_Howe", "Asia/Seoul"])
+def test_변환표로_바꾼_UTC_시각은_zoneinfo와_같다(name: str):
+    table = ZoneOffsetTable(name, 2023, 2026)
+
+    # 서머타임 시작/끝의 없는 시각, 겹치는 시각을 포함하도록 30분 간격으로 확인
+    day = date(2024, 1, 1)
+    while day < date(2025, 1, 1):
+        for minutes in range(0, 24 * 60, 30):
+            at = time(minutes // 60, minutes % 60)
+            assert table.to_utc(day, minutes * 60) == expected_utc(name, day, at), (day, at)
+        day += timedelta(days=1)
+
+
+def test_변환표_범위_밖의_시각은_zoneinfo로_직접_계산한다():
+    table = ZoneOffsetTable("Europe/Berlin", 2024, 2025)
+
+    assert table.to_utc(date(2030, 7, 1), 9 * 3600) == expected_utc("Europe/Berlin", date(2030, 7, 1), time(9))
+    assert table.to_utc(date(2024, 1, 1), 0) == expected_utc("Europe/Berlin", date(2024, 1, 1), time(0))
+
+
+def test_시간대마다_변환표를_한_번만_만든다():
+    assert get_zone_table("Asia/Tokyo") is get_zone_table("Asia/Tokyo")
@@ -0,0 +1,158 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from appserver.libs.http.admission import (
+    AdmissionControlMiddleware, AdmissionRegistry, ConcurrencyLimiter, RouteClassifier,
+)
+
+
+@pytest.fixture()
+def registry() -> AdmissionRegistry:
+    return AdmissionRegistry()
+
+
+@pytest.fixture()
+def release() -> asyncio.Event:
+    return asyncio.Event()
+
+
+@pytest.fixture()
+def app(registry: AdmissionRegistry, release: asyncio.Event) -> FastAPI:
+    app = FastAPI()
+    limiters = {
+        "auth": ConcurrencyLimiter(max_concurrency=1, max_queue=1),
+        "write": ConcurrencyLimiter(max_concurrency=1, max_queue=1),
+        "read": ConcurrencyLimiter(max_concurrency=1, max_queue=1),
+    }
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limiters=limiters,
+        classify=RouteClassifier(
+            {"account": "account_router", "calendar": "calendar_router"},
+            ["/account/login"],
+            ["/calendar/{name}/events"],
+        ),
+        registry=registry,
+        max_queue_wait=5.0,
+        retry_after=3,
+    )
+
+    @app.post("/account/login")
+    async def login():
+        await release.wait()
+        return {"ok": True}
+
+    @app.get("/calendar/{name}/events")
+    async def calendar_events(name: str):
+        return {"ok": True}
+
+    @app.get("/calendar/{name}")
+    async def calendar(name: str, request: Request):
+        if name == "slow":
+            await release.wait()
+        return {"deadline": getattr(request.state, "deadline", None) is not None}
+
+    return app
+
+
+@pytest.fixture()
+async def client(app: FastAPI):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def wait_until(condition) -> None:
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+async def test_해시_경로가_밀려도_읽기_경로는_바로_처리한다(
+    client: httpx.AsyncClient,
+    registry: AdmissionRegistry,
+    release: asyncio.Event,
+):
+    running = asyncio.create_task(client.post("/account/login"))
+    queued = asyncio.create_task(client.post("/account/login"))
+    await wait_until(lambda: registry.get("account_router", "auth").admitted == 1)
+
+    # 자리 1개, 대기열 1개가 모두 찼으므로 바로 503
+    response = await client.post("/account/login")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "3"
+
+    # 읽기는 자기 자리에서 처리
+    response = await client.get("/calendar/fast")
+    assert response.status_code == 200
+
+    release.set()
+    assert [(await task).status_code for task in (running, queued)] == [200, 200]
+    snapshot = registry.snapshot()
+    auth = snapshot["account_router"]["auth"]
+    assert (auth["admitted"], auth["queued"], auth["shed"]) == (2, 1, 1)
+    assert snapshot["calendar_router"]["read"]["admitted"] == 1
+
+
+async def test_요청_제한_시간보다_오래_기다려야_하면_503으로_돌려보낸다(
+    client: httpx.AsyncClient,
+    registry: AdmissionRegistry,
+    release: asyncio.Event,
+):
+    running = asyncio.create_task(client.get("/calendar/slow"))
+    await wait_until(lambda: registry.get("calendar_router", "read").admitted == 1)
+
+    response = await client.get("/calendar/fast", headers={"X-Request-Timeout": "0.05"})
+    assert response.status_code == 503
+    assert registry.get("calendar_router", "read").shed == 1
+
+    release.set()
+    await running
+    response = await client.get("/calendar/fast", headers={"X-Request-Timeout": "1"})
+    assert response.json() == {"deadline": True}
+
+
+async def test_라우터에_속하지_않은_경로와_제한하지_않는_경로는_통계를_남기지_않는다(
+    app: FastAPI,
+    client: httpx.AsyncClient,
+    registry: AdmissionRegistry,
+):
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    assert (await client.get("/health")).status_code == 200
+    assert (await client.get("/calendar/fast/events")).status_code == 200
+    assert registry.snapshot() == {}
+
+
+async def test_Accept_헤더로는_제한을_건너뛸_수_없다(
+    client: httpx.AsyncClient,
+    registry: AdmissionRegistry,
+    release: asyncio.Event,
+):
+    running = asyncio.create_task(client.post("/account/login"))
+    queued = asyncio.create_task(client.post("/account/login"))
+    await wait_until(lambda: registry.get("account_router", "auth").admitted == 1)
+
+    response = await client.post("/account/login", headers={"Accept": "text/event-stream"})
+    assert response.status_code == 503
+
+    release.set()
+    await asyncio.gather(running, queued)
+
+
+def test_앱은_라우터와_경로_종류별로_통계를_남긴다(fastapi_app: FastAPI):
+    from fastapi.testclient import TestClient
+
+    with TestClient(fastapi_app) as client:
+        client.post("/account/login", json={"username": "nobody", "password": "testtest"})
+        client.get("/calendar/nobody")
+
+    snapshot = fastapi_app.state.admission_registry.snapshot()
+    assert snapshot["account_router"]["auth"]["admitted"] == 1
+    assert snapshot["calendar_router"]["read"]["admitted"] == 1
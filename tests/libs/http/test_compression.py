@@ -0,0 +1,105 @@
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from appserver.libs.http.compression import CompressionMiddleware
+
+LARGE = "예약 " * 1000
+
+
+@pytest.fixture()
+def app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500, encodings=["gzip"])
+
+    @app.get("/large")
+    async def large():
+        return {"text": LARGE}
+
+    @app.get("/small")
+    async def small():
+        return {"text": "ok"}
+
+    @app.get("/image")
+    async def image():
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"data: {i} {LARGE}\n\n"
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    @app.get("/encoded")
+    async def encoded():
+        return PlainTextResponse(gzip.compress(LARGE.encode()), headers={"Content-Encoding": "gzip"})
+
+    return app
+
+
+@pytest.fixture()
+def client(app: FastAPI):
+    # TestClient(httpx)가 응답을 자동으로 풀지 않도록 원본 바이트로 확인
+    with TestClient(app) as client:
+        yield client
+
+
+def raw_get(client: TestClient, path: str, accept_encoding: str = "gzip"):
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_큰_JSON_응답은_gzip으로_압축한다(client: TestClient):
+    response, body = raw_get(client, "/large")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(body)
+    assert len(body) < len(LARGE.encode())
+    assert LARGE in gzip.decompress(body).decode()
+
+
+def test_작은_응답은_압축하지_않는다(client: TestClient):
+    response, body = raw_get(client, "/small")
+
+    assert "content-encoding" not in response.headers
+    assert body == b'{"text":"ok"}'
+
+
+def test_압축을_받지_않는_클라이언트에게는_그대로_보낸다(client: TestClient):
+    response, body = raw_get(client, "/large", accept_encoding="identity")
+
+    assert "content-encoding" not in response.headers
+    assert LARGE in body.decode()
+
+
+def test_JSON이나_텍스트가_아닌_응답은_압축하지_않는다(client: TestClient):
+    response, body = raw_get(client, "/image")
+
+    assert "content-encoding" not in response.headers
+    assert body == b"\x89PNG" * 1000
+
+
+def test_이미_압축한_응답은_다시_압축하지_않는다(client: TestClient):
+    response, body = raw_get(client, "/encoded")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body).decode() == LARGE
+
+
+def test_스트리밍_응답은_조각마다_압축해서_보낸다(client: TestClient):
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks = [decompressor.decompress(chunk) for chunk in response.iter_raw() if chunk]
+
+    # 조각마다 flush하므로 받은 조각만으로 바로 풀 수 있음
+    assert chunks[0].decode().startswith("data: 0")
+    assert b"".join(chunks).decode().count("data: ") == 3
@@ -0,0 +1,172 @@
+import asyncio
+from datetime import date, timedelta
+
+import httpx
+import pytest
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import func, select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, TimeSlot
+from appserver.app import create_app
+from appserver.db import create_session
+from appserver.libs.idempotency.middleware import IdempotencyMiddleware
+from appserver.libs.idempotency.store import IdempotencyRecord, MemoryIdempotencyStore
+from appserver.settings import Settings
+
+
+@pytest.fixture()
+def use_test_database(fastapi_app: FastAPI, db_session: AsyncSession):
+    """lifespan이 만든 세션 팩토리 대신 테스트 DB를 쓰게 함 (TestClient를 연 뒤에 사용)"""
+    def _use():
+        fastapi_app.state.session_factory = create_session(db_session.bind)
+    return _use
+
+
+async def count_bookings(db_session: AsyncSession) -> int:
+    result = await db_session.execute(select(func.count()).select_from(Booking))
+    return result.scalar_one()
+
+
+async def test_같은_키로_다시_보낸_예약은_처음_응답을_돌려주고_다시_만들지_않는다(
+    client_with_guest_auth: TestClient,
+    use_test_database,
+    db_session: AsyncSession,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    use_test_database()
+    payload = {
+        "when": date(2024, 12, 3).isoformat(),
+        "topic": "test",
+        "description": "test",
+        "time_slot_id": time_slot_tuesday.id,
+    }
+    headers = {"Idempotency-Key": "booking-1"}
+
+    first = client_with_guest_auth.post(f"/bookings/{host_user.username}", json=payload, headers=headers)
+    replayed = client_with_guest_auth.post(f"/bookings/{host_user.username}", json=payload, headers=headers)
+
+    assert first.status_code == replayed.status_code == status.HTTP_201_CREATED
+    assert replayed.json() == first.json()
+    assert "idempotent-replayed" not in first.headers
+    assert replayed.headers["idempotent-replayed"] == "true"
+    assert await count_bookings(db_session) == 1
+    record = (await db_session.execute(select(IdempotencyRecord))).scalar_one()
+    assert record.status_code == status.HTTP_201_CREATED
+
+    # 같은 키에 다른 본문 → 422, 키가 없으면 그대로 처리
+    changed = client_with_guest_auth.post(
+        f"/bookings/{host_user.username}", json={**payload, "topic": "changed"}, headers=headers,
+    )
+    assert changed.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert await count_bookings(db_session) == 1
+
+
+async def test_다른_워커가_처리_중인_키는_409_응답을_반환한다(
+    client_with_guest_auth: TestClient,
+    use_test_database,
+    db_session: AsyncSession,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    use_test_database()
+    payload = {
+        "when": date(2024, 12, 3).isoformat(),
+        "topic": "test",
+        "description": "test",
+        "time_slot_id": time_slot_tuesday.id,
+    }
+    headers = {"Idempotency-Key": "booking-1"}
+    client_with_guest_auth.post(f"/bookings/{host_user.username}", json=payload, headers=headers)
+    # 응답을 저장하기 전(처리 중)인 것처럼 되돌림
+    record = (await db_session.execute(select(IdempotencyRecord))).scalar_one()
+    record.status_code = None
+    await db_session.commit()
+
+    # 다른 워커: 프로세스 안 LRU가 비어 있어서 테이블의 예약을 봄
+    other_worker = create_app(Settings(database_dsn="sqlite+aiosqlite:///:memory:"))
+    with TestClient(other_worker, cookies=client_with_guest_auth.cookies) as client:
+        other_worker.state.session_factory = create_session(db_session.bind)
+        response = client.post(f"/bookings/{host_user.username}", json=payload, headers=headers)
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.headers["retry-after"] == "1"
+    assert await count_bookings(db_session) == 1
+
+
+def test_같은_키로_다시_보낸_가입은_중복_오류_대신_처음_응답을_돌려준다(client: TestClient, use_test_database):
+    use_test_database()
+    payload = {
+        "username": "puddingcamp",
+        "display_name": "푸딩캠프",
+        "email": "test@example.com",
+        "hashed_password": "test테스트1234",
+        "password_again": "test테스트1234",
+    }
+    headers = {"Idempotency-Key": "signup-1"}
+
+    first = client.post("/account/signup", json=payload, headers=headers)
+    replayed = client.post("/account/signup", json=payload, headers=headers)
+    duplicated = client.post("/account/signup", json=payload)
+
+    assert first.status_code == replayed.status_code == status.HTTP_201_CREATED
+    assert replayed.json() == first.json()
+    assert duplicated.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class NoSession:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+@pytest.fixture()
+def calls() -> list[bool]:
+    return []
+
+
+@pytest.fixture()
+async def items_client(calls: list[bool]):
+    app = FastAPI()
+    # 메모리 저장소는 DB 세션을 쓰지 않음
+    app.state.session_factory = NoSession
+    app.add_middleware(
+        IdempotencyMiddleware,
+        store=MemoryIdempotencyStore(timedelta(hours=1), timedelta(minutes=1)),
+        routes=["POST /items"],
+    )
+
+    @app.post("/items")
+    async def create_item(fail: bool = False):
+        calls.append(fail)
+        await asyncio.sleep(0.05)
+        if fail:
+            return JSONResponse({"detail": "failed"}, status_code=500)
+        return {"id": len(calls)}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def test_같은_키의_요청이_동시에_오면_핸들러는_한_번만_실행한다(items_client: httpx.AsyncClient, calls: list[bool]):
+    headers = {"Idempotency-Key": "item-1"}
+    responses = await asyncio.gather(*[items_client.post("/items", headers=headers) for _ in range(3)])
+
+    assert len(calls) == 1
+    assert [response.json() for response in responses] == [{"id": 1}] * 3
+    assert sorted(response.headers.get("idempotent-replayed", "") for response in responses) == ["", "true", "true"]
+
+
+async def test_5xx_응답은_저장하지_않고_다시_실행한다(items_client: httpx.AsyncClient, calls: list[bool]):
+    headers = {"Idempotency-Key": "item-1"}
+    first = await items_client.post("/items", params={"fail": True}, headers=headers)
+    retried = await items_client.post("/items", params={"fail": True}, headers=headers)
+
+    assert first.status_code == retried.status_code == 500
+    assert len(calls) == 2
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.db import create_session
+from appserver.libs.pubsub.database import DatabaseBroker, EventMessage
+from appserver.libs.pubsub.hub import PubSubHub
+
+
+@pytest.fixture()
+def session_factory(db_session: AsyncSession):
+    return create_session(db_session.bind)
+
+
+def make_hub(session_factory) -> PubSubHub:
+    # 워커 하나의 허브 (폴링은 테스트에서 직접 부름)
+    return PubSubHub(DatabaseBroker(session_factory, poll_interval=60))
+
+
+async def test_다른_워커에서_발행한_이벤트도_구독자에게_보낸다(session_factory):
+    publisher, subscriber = make_hub(session_factory), make_hub(session_factory)
+    await publisher.start()
+    await subscriber.start()
+    subscription = subscriber.subscribe("calendar:1")
+    try:
+        await publisher.publish("calendar:1", {"type": "booking.created", "data": {"when": "2024-12-03"}})
+        await publisher.publish("calendar:2", {"type": "booking.created"})
+
+        assert await subscriber.broker.poll() == 2
+        event = await subscription.get(0)
+        assert (event.type, event.data) == ("booking.created", {"when": "2024-12-03"})
+        assert await subscription.get(0.01) is None
+        # 이미 읽은 이벤트는 다시 보내지 않음
+        assert await subscriber.broker.poll() == 0
+    finally:
+        await publisher.close()
+        await subscriber.close()
+
+
+async def test_시작하기_전에_발행한_이벤트는_보내지_않는다(session_factory):
+    publisher = make_hub(session_factory)
+    await publisher.publish("calendar:1", {"type": "booking.created"})
+
+    late = make_hub(session_factory)
+    await late.start()
+    subscription = late.subscribe("calendar:1")
+    try:
+        assert await late.broker.poll() == 0
+        assert await subscription.get(0.01) is None
+    finally:
+        await publisher.close()
+        await late.close()
+
+
+async def test_보관_기간이_지난_이벤트를_지운다(session_factory, db_session: AsyncSession):
+    broker = DatabaseBroker(session_factory, retention=timedelta(minutes=5))
+    now = datetime.now(timezone.utc)
+    db_session.add_all([
+        EventMessage(topic="calendar:1", message={"type": "old"}, created_at=now - timedelta(minutes=6)),
+        EventMessage(topic="calendar:1", message={"type": "new"}, created_at=now),
+    ])
+    await db_session.commit()
+
+    assert await broker.purge_expired(db_session) == 1
+    messages = (await db_session.execute(select(EventMessage.message))).scalars().all()
+    assert messages == [{"type": "new"}]
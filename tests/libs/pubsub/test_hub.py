@@ -0,0 +1,54 @@
+import pytest
+
+from appserver.libs.pubsub.broker import LocalBroker
+from appserver.libs.pubsub.hub import OVERFLOW, PubSubHub, SubscriberLimitError
+
+
+@pytest.fixture()
+def hub() -> PubSubHub:
+    return PubSubHub(LocalBroker(), max_queue_size=2, max_subscribers=1000)
+
+
+async def test_주제의_모든_구독자에게_같은_이벤트를_한_번씩_보낸다(hub: PubSubHub):
+    subscriptions = [hub.subscribe("calendar:1") for _ in range(999)]
+    other = hub.subscribe("calendar:2")
+
+    await hub.publish("calendar:1", {"type": "booking.created", "data": {"when": "2024-12-03"}})
+
+    events = [await subscription.get(0) for subscription in subscriptions]
+    assert {event.type for event in events} == {"booking.created"}
+    # 이벤트는 워커마다 한 번만 만들고 인코딩함
+    assert len({id(event) for event in events}) == 1
+    assert await other.get(0.01) is None
+
+
+async def test_큐가_가득_찬_구독자는_overflow를_받고_구독이_끊긴다(hub: PubSubHub):
+    slow = hub.subscribe("calendar:1")
+    fast = hub.subscribe("calendar:1")
+
+    for index in range(3):
+        await hub.publish("calendar:1", {"type": "booking.created", "data": {"index": index}})
+        await fast.get(0)
+
+    assert slow.closed
+    assert hub.dropped == 1
+    assert len(hub) == 1
+    assert [(await slow.get(0)).type for _ in range(3)] == ["booking.created", "booking.created", OVERFLOW]
+    assert not fast.closed
+
+
+async def test_구독자_수가_최대이면_구독할_수_없다():
+    hub = PubSubHub(LocalBroker(), max_subscribers=1)
+    with hub.subscribe("calendar:1"):
+        with pytest.raises(SubscriberLimitError):
+            hub.subscribe("calendar:2")
+
+    # 구독을 닫으면 다시 구독할 수 있음
+    assert len(hub) == 0
+    hub.subscribe("calendar:2")
+
+
+async def test_이벤트가_없으면_기다린_뒤_None을_반환한다(hub: PubSubHub):
+    subscription = hub.subscribe("calendar:1")
+
+    assert await subscription.get(0.01) is None
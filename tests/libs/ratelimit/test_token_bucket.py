@@ -0,0 +1,51 @@
+import pytest
+
+from appserver.libs.kvstore.local import LocalKeyValueStore
+from appserver.libs.ratelimit.token_bucket import TokenBucket, SharedTokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "shared"])
+def bucket(request, clock: FakeClock):
+    if request.param == "memory":
+        return TokenBucket(rate=1.0, capacity=3, clock=clock)
+    store = LocalKeyValueStore(clock=clock)
+    return SharedTokenBucket(store, rate=1.0, capacity=3, clock=clock)
+
+
+async def test_버킷_용량만큼은_바로_허용하고_그다음부터_거절한다(bucket, clock: FakeClock):
+    assert [await bucket.consume("key") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert await bucket.consume("key") == pytest.approx(1.0)
+
+    # 다른 키는 영향을 받지 않음
+    assert await bucket.consume("other") == 0.0
+
+    # 시간이 지나면 토큰이 다시 참
+    clock.now += 1.0
+    assert await bucket.consume("key") == 0.0
+    assert await bucket.consume("key") > 0
+
+
+async def test_키_개수가_상한을_넘으면_가장_오래_쓰지_않은_키부터_버린다(clock: FakeClock):
+    bucket = TokenBucket(rate=1.0, capacity=1, max_keys=2, clock=clock)
+
+    await bucket.consume("a")
+    await bucket.consume("b")
+    await bucket.consume("a")  # a를 최근에 쓴 키로 만듦
+    await bucket.consume("c")
+
+    assert len(bucket) == 2
+    # b가 버려졌으므로 다시 가득 찬 버킷으로 시작함
+    assert await bucket.consume("b") == 0.0
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.db import create_session
+from appserver.libs.scheduler.lease import LeaderLease, SchedulerLease
+from appserver.libs.scheduler.scheduler import Scheduler
+
+
+@pytest.fixture()
+def session_factory(db_session: AsyncSession):
+    return create_session(db_session.bind)
+
+
+def make_lease(session_factory, owner: str) -> LeaderLease:
+    return LeaderLease(session_factory, ttl=timedelta(seconds=30), owner=owner)
+
+
+async def test_임대는_한_워커만_가지고_놓으면_다른_워커가_이어받는다(session_factory):
+    first, second = make_lease(session_factory, "first"), make_lease(session_factory, "second")
+
+    assert await first.acquire() is True
+    assert await second.acquire() is False
+    # 리더는 임대를 계속 늘릴 수 있음
+    assert await first.acquire() is True
+
+    await first.release()
+    assert await second.acquire() is True
+    assert await first.acquire() is False
+
+
+async def test_만료된_임대는_다른_워커가_가져간다(session_factory, db_session: AsyncSession):
+    db_session.add(SchedulerLease(
+        name="maintenance",
+        owner="crashed",
+        expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+    ))
+    await db_session.commit()
+
+    assert await make_lease(session_factory, "second").acquire() is True
+
+
+async def test_리더가_아닌_워커는_리더_전용_작업을_건너뛴다(session_factory):
+    await make_lease(session_factory, "leader").acquire()
+    calls = []
+
+    async def purge():
+        calls.append("purge")
+
+    async def warm():
+        calls.append("warm")
+
+    scheduler = Scheduler(make_lease(session_factory, "follower"))
+    scheduler.add("purge", purge, interval=60, leader_only=True)
+    scheduler.add("warm", warm, interval=60)
+
+    assert await scheduler.run_pending() == ["warm"]
+    assert calls == ["warm"]
+    assert scheduler.is_leader is False
+
+
+async def test_실패한_작업도_시간을_기록하고_다음_작업을_실행한다():
+    async def broken():
+        raise RuntimeError("boom")
+
+    async def warm():
+        return 1
+
+    scheduler = Scheduler()
+    scheduler.add("broken", broken, interval=60)
+    scheduler.add("warm", warm, interval=60)
+
+    assert await scheduler.run_pending() == ["broken", "warm"]
+    snapshot = scheduler.snapshot()
+    assert (snapshot["broken"]["runs"], snapshot["broken"]["failures"]) == (1, 1)
+    assert (snapshot["warm"]["runs"], snapshot["warm"]["failures"]) == (1, 0)
@@ -0,0 +1,109 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel
+
+from appserver.app import create_app
+from appserver.db import create_engine_from_settings
+from appserver.settings import Settings
+from appserver.apps.account.models import User
+from appserver.apps.account.utils import hash_password
+from appserver.apps.calendar import models as calendar_models  # noqa: F401 (테이블 등록)
+
+
+@pytest.fixture()
+def file_dsn(tmp_path: Path) -> str:
+    path = tmp_path / "app.db"
+    engine = sa.create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(sa.insert(User.__table__).values(
+            username="puddingcamp",
+            hashed_password=hash_password("testtest"),
+            email="puddingcamp@example.com",
+            display_name="푸딩캠프",
+            is_host=True,
+        ))
+    engine.dispose()
+    return f"sqlite+aiosqlite:///{path}"
+
+
+def test_쿼리를_실행하지_않는_요청은_풀에서_연결을_꺼내지_않는다(file_dsn: str):
+    app = create_app(Settings(database_dsn=file_dsn, auth_backend="session"))
+
+    with TestClient(app) as client:
+        metrics = app.state.pool_metrics
+        response = client.post("/account/login", json={"username": "puddingcamp", "password": "testtest"})
+        assert response.status_code == status.HTTP_200_OK
+        client.cookies.set("auth_token", response.json()["access_token"])
+        # 요청이 끝나면 연결을 풀에 돌려줌
+        assert app.state.engine.pool.checkedout() == 0
+        checkouts = metrics.checkouts
+        assert checkouts > 0
+
+        # 세션 저장소(메모리)로 인증하고 DB를 읽지 않는 요청
+        response = client.get("/account/@me")
+        assert response.status_code == status.HTTP_200_OK
+        response = client.delete("/account/logout")
+        assert response.status_code == status.HTTP_200_OK
+
+        assert metrics.checkouts == checkouts
+        assert app.state.engine.pool.checkedout() == 0
+
+
+async def test_풀에_빈_연결이_없어서_기다린_시간과_시간_초과를_기록한다(file_dsn: str):
+    settings = Settings(
+        database_dsn=file_dsn,
+        database_pool_size=1,
+        database_max_overflow=0,
+        database_pool_timeout=0.1,
+    )
+    engine = create_engine_from_settings(settings)
+    metrics = engine.pool.metrics
+    try:
+        conn = await engine.connect()
+
+        async def release_later():
+            await asyncio.sleep(0.05)
+            await conn.close()
+
+        # 첫 번째 연결이 돌아올 때까지 기다렸다가 꺼냄
+        releasing = asyncio.create_task(release_later())
+        second = await engine.connect()
+        await releasing
+
+        # 연결이 돌아오지 않으면 pool_timeout 뒤에 실패
+        with pytest.raises(sa.exc.TimeoutError):
+            await engine.connect()
+        await second.close()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["checkouts"] == 3
+        assert snapshot["waits"] == 2
+        assert snapshot["timeouts"] == 1
+        assert snapshot["max_wait"] >= 0.05
+    finally:
+        await engine.dispose()
+    # dispose()로 풀을 다시 만들어도 통계는 이어짐
+    assert engine.pool.metrics is metrics
+
+
+async def test_빈_페이지가_많으면_ANALYZE와_함께_VACUUM을_실행한다(file_dsn: str):
+    from appserver.db import optimize_database
+
+    engine = create_engine_from_settings(Settings(database_dsn=file_dsn))
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("CREATE TABLE scratch (payload TEXT)")
+        await conn.exec_driver_sql("INSERT INTO scratch VALUES (?)", [("x" * 1000,) for _ in range(500)])
+    assert await optimize_database(engine, vacuum_free_ratio=0.2) is False
+
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("DELETE FROM scratch")
+    assert await optimize_database(engine, vacuum_free_ratio=0.2) is True
+    async with engine.connect() as conn:
+        assert (await conn.exec_driver_sql("PRAGMA freelist_count")).scalar_one() == 0
+    await engine.dispose()
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.app import create_app
+from appserver.apps.calendar.models import BookingDayCount, Calendar, TimeSlot
+from appserver.apps.calendar.schedule import ScheduleCache, warm_schedule_cache
+from appserver.db import create_session
+from appserver.libs.idempotency.store import IdempotencyRecord
+from appserver.libs.pubsub.database import EventMessage
+from appserver.settings import Settings
+
+
+async def test_예약이_많은_캘린더부터_일정표를_새로_만든다(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    charming_host_calendar: Calendar,
+    time_slot_tuesday: TimeSlot,
+    time_slot_wednesday_thursday: TimeSlot,
+):
+    today = datetime.now(timezone.utc).date()
+    db_session.add_all([
+        BookingDayCount(calendar_id=host_user_calendar.id, day=today + timedelta(days=1), count=3),
+        BookingDayCount(calendar_id=charming_host_calendar.id, day=today + timedelta(days=1), count=1),
+    ])
+    await db_session.commit()
+    cache = ScheduleCache()
+
+    # 기간 밖의 예약만 있으면 만들지 않음
+    assert await warm_schedule_cache(db_session, cache, today + timedelta(days=2), today + timedelta(days=14)) == 0
+
+    statements = []
+    engine = db_session.bind.sync_engine
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        assert await warm_schedule_cache(db_session, cache, today, today + timedelta(days=14)) == 2
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    # 캘린더 수와 관계없이 시간대는 한 번에 읽음
+    assert len([statement for statement in statements if "FROM time_slots" in statement]) == 1
+    assert len(cache) == 2
+    schedule = await cache.get(db_session, host_user_calendar.id)
+    assert schedule.get(time_slot_tuesday.id) is not None
+    schedule = await cache.get(db_session, charming_host_calendar.id)
+    assert schedule.get(time_slot_wednesday_thursday.id) is not None
+
+
+async def test_유지_보수_작업은_만료된_키를_지우고_작업마다_시간을_기록한다(db_session: AsyncSession):
+    app = create_app(Settings(
+        database_dsn="sqlite+aiosqlite:///:memory:",
+        auth_backend="session",
+        session_store="database",
+        scheduler_enabled=True,
+    ))
+    # lifespan 대신 테스트 DB를 연결
+    app.state.session_factory = create_session(db_session.bind)
+    app.state.engine = db_session.bind
+    now = datetime.now(timezone.utc)
+    db_session.add_all([
+        IdempotencyRecord(key="expired", fingerprint="f", status_code=201, expires_at=now - timedelta(seconds=1)),
+        IdempotencyRecord(key="alive", fingerprint="f", status_code=201, expires_at=now + timedelta(hours=1)),
+    ])
+    await db_session.commit()
+
+    scheduler = app.state.scheduler
+    # DB 최적화는 한 주기 뒤에 처음 실행
+    assert await scheduler.run_pending() == ["purge-sessions", "purge-idempotency-keys", "warm-schedules"]
+    keys = (await db_session.execute(select(IdempotencyRecord.key))).scalars().all()
+    assert keys == ["alive"]
+
+    snapshot = scheduler.snapshot()
+    assert all(snapshot[name]["runs"] == 1 and snapshot[name]["failures"] == 0 for name in snapshot if name != "optimize-database")
+    assert snapshot["optimize-database"]["runs"] == 0
+    await scheduler.close()
+
+
+async def test_database_Broker면_보관_기간이_지난_이벤트를_지운다(db_session: AsyncSession):
+    app = create_app(Settings(
+        database_dsn="sqlite+aiosqlite:///:memory:",
+        event_broker="database",
+        event_retention_seconds=60,
+        scheduler_enabled=True,
+    ))
+    app.state.session_factory = create_session(db_session.bind)
+    app.state.engine = db_session.bind
+    db_session.add(EventMessage(
+        topic="calendar:1", message={"type": "booking.created"},
+        created_at=datetime.now(timezone.utc) - timedelta(minutes=2),
+    ))
+    await db_session.commit()
+
+    scheduler = app.state.scheduler
+    assert "purge-event-messages" in await scheduler.run_pending()
+    assert (await db_session.execute(select(EventMessage))).first() is None
+    await scheduler.close()
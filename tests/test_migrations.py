@@ -0,0 +1,114 @@
+import sqlite3
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+
+from appserver.libs.migrations.online import backfill_in_chunks, migration_checkpoints
+
+ROOT = Path(__file__).resolve().parent.parent
+BOOKING_ROW_COUNT = 1_000_000
+MIGRATION_TIME_BUDGET = 60.0  # 초
+
+
+def alembic_config(db_path: Path) -> Config:
+    # alembic.ini를 읽지 않음 → env.py가 로깅 설정(fileConfig)을 바꾸지 않음
+    config = Config()
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    config.attributes["dsn"] = f"sqlite+aiosqlite:///{db_path}"
+    return config
+
+
+def seed_bookings(db_path: Path, row_count: int) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO users (id, username, email, display_name, password, is_host) "
+        "VALUES (1, 'puddingcamp', 'puddingcamp@example.com', '푸딩캠프', 'x', 1)"
+    )
+    conn.execute(
+        "INSERT INTO calendars (id, topics, description, google_calendar_id, host_id) "
+        "VALUES (1, '[]', '', 'puddingcamp@example.com', 1)"
+    )
+    conn.execute(
+        "INSERT INTO time_slots (id, start_time, end_time, weekdays, calendar_id) "
+        "VALUES (1, '09:00:00', '10:00:00', '[0,1,2,3,4,5,6]', 1)"
+    )
+    start = date(2020, 1, 1)
+    rows = (
+        ((start + timedelta(days=i % 3650)).isoformat(), "topic", "description", 1, 1)
+        for i in range(row_count)
+    )
+    conn.executemany(
+        'INSERT INTO bookings ("when", topic, description, time_slot_id, guest_id) '
+        "VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.slow
+def test_100만_건의_예약이_있는_DB를_시간_예산_안에_마이그레이션한다(tmp_path: Path):
+    db_path = tmp_path / "large.db"
+    config = alembic_config(db_path)
+    command.upgrade(config, "6f1c2a9d4b7e")
+    seed_bookings(db_path, BOOKING_ROW_COUNT)
+
+    started_at = time.perf_counter()
+    command.upgrade(config, "head")
+    elapsed = time.perf_counter() - started_at
+
+    assert elapsed < MIGRATION_TIME_BUDGET
+
+    conn = sqlite3.connect(db_path)
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list('bookings')")}
+    count = conn.execute("SELECT count(*) FROM bookings").fetchone()[0]
+    conn.close()
+    assert "ix_bookings_time_slot_id_when" in indexes
+    assert count == BOOKING_ROW_COUNT
+
+
+def test_백필이_중간에_멈추면_체크포인트부터_이어서_처리한다(tmp_path: Path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path}/backfill.db", isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        conn.execute(sa.text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, name_lower TEXT)"))
+        conn.execute(
+            sa.text("INSERT INTO items (id, name) VALUES (:id, :name)"),
+            [{"id": i, "name": f"Item-{i}"} for i in range(1, 1001)],
+        )
+
+        class Interrupted(Exception):
+            pass
+
+        def interrupt_after_three_chunks(done, last_key, max_key, elapsed):
+            if last_key >= 300:
+                raise Interrupted()
+
+        values = {"name_lower": sa.func.lower(sa.column("name"))}
+        with pytest.raises(Interrupted):
+            backfill_in_chunks(
+                conn, "items", values,
+                chunk_size=100, checkpoint="items:name_lower",
+                progress=interrupt_after_three_chunks,
+            )
+
+        # 구간마다 커밋되었으므로 멈추기 전까지 처리한 행은 남아 있음
+        filled = conn.execute(sa.text("SELECT count(*) FROM items WHERE name_lower IS NOT NULL")).scalar()
+        assert filled == 300
+
+        progress_calls = []
+        updated = backfill_in_chunks(
+            conn, "items", values,
+            chunk_size=100, checkpoint="items:name_lower",
+            progress=lambda *args: progress_calls.append(args),
+        )
+
+        assert updated == 700
+        assert len(progress_calls) == 7
+        assert conn.execute(sa.text("SELECT name_lower FROM items WHERE id = 1000")).scalar() == "item-1000"
+        # 끝까지 마치면 체크포인트를 지움
+        assert conn.execute(sa.select(sa.func.count()).select_from(migration_checkpoints)).scalar() == 0
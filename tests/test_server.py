@@ -0,0 +1,93 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from appserver import server
+from appserver.app import create_app
+from appserver.cli import main
+from appserver.settings import Settings
+
+
+@pytest.fixture()
+def uvicorn_run_calls(monkeypatch: pytest.MonkeyPatch):
+    calls = []
+    monkeypatch.setattr(server.uvicorn, "run", lambda app, **kwargs: calls.append((app, kwargs)))
+    # serve()가 바꾸는 환경 변수를 테스트가 끝나면 되돌리도록 기록해 둠
+    monkeypatch.setenv("APPSERVER_DATABASE_POOL_SIZE", "5")
+    monkeypatch.setenv("APPSERVER_DATABASE_MAX_OVERFLOW", "10")
+    monkeypatch.setenv("APPSERVER_PREWARM", "false")
+    monkeypatch.setenv("APPSERVER_SCHEDULER_ENABLED", "false")
+    monkeypatch.setenv("APPSERVER_EVENT_BROKER", "local")
+    monkeypatch.delenv("APPSERVER_EVENT_BROKER")
+    return calls
+
+
+def test_serve_명령은_워커마다_연결_예산을_나눠_풀_크기를_정한다(uvicorn_run_calls):
+    main(["serve", "--workers", "4", "--db-connection-budget", "40", "--graceful-timeout", "15"])
+
+    app, kwargs = uvicorn_run_calls[0]
+    assert app == server.APP_FACTORY
+    assert kwargs["factory"] is True
+    assert kwargs["workers"] == 4
+    assert kwargs["timeout_graceful_shutdown"] == 15
+
+    # 워커 프로세스는 환경 변수로 설정을 물려받음
+    assert os.environ["APPSERVER_DATABASE_POOL_SIZE"] == "10"
+    assert os.environ["APPSERVER_DATABASE_MAX_OVERFLOW"] == "0"
+    assert os.environ["APPSERVER_PREWARM"] == "true"
+    settings = Settings()
+    assert settings.database_pool_size == 10
+    assert settings.prewarm is True
+    assert settings.scheduler_enabled is True
+
+
+def test_serve_명령에서_백그라운드_작업을_끌_수_있다(uvicorn_run_calls):
+    main(["serve", "--workers", "2", "--no-scheduler"])
+
+    assert Settings().scheduler_enabled is False
+
+
+def test_워커가_여럿이면_캘린더_이벤트를_DB로_나눈다(uvicorn_run_calls):
+    main(["serve", "--workers", "2"])
+
+    assert Settings().event_broker == "database"
+
+
+def test_워커가_하나면_캘린더_이벤트를_워커_안에서_전달한다(uvicorn_run_calls):
+    main(["serve", "--workers", "1"])
+
+    assert Settings().event_broker == "local"
+
+
+def test_워커가_여럿인데_local_Broker로_정했으면_경고한다(
+    uvicorn_run_calls,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    monkeypatch.setenv("APPSERVER_EVENT_BROKER", "local")
+
+    main(["serve", "--workers", "2"])
+
+    assert Settings().event_broker == "local"
+    assert "APPSERVER_EVENT_BROKER=local" in caplog.text
+
+
+def test_연결_예산이_워커_수보다_작으면_서버를_띄우지_않는다(uvicorn_run_calls):
+    with pytest.raises(ValueError):
+        main(["serve", "--workers", "8", "--db-connection-budget", "4"])
+    assert uvicorn_run_calls == []
+
+
+def test_prewarm_설정이면_시작할_때_풀을_채워둔다(tmp_path):
+    settings = Settings(
+        database_dsn=f"sqlite+aiosqlite:///{tmp_path}/prewarm.db",
+        database_pool_size=3,
+        prewarm=True,
+    )
+    app = create_app(settings)
+
+    with TestClient(app):
+        pool = app.state.engine.pool
+        assert pool.checkedin() == 3
+        assert pool.checkedout() == 0
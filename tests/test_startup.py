@@ -0,0 +1,86 @@
+import subprocess
+import sys
+
+import pytest
+
+
+# 콜드 스타트(파드 확장 시 앱이 뜨는 시간)를 지키기 위한 테스트
+# `python -X importtime`의 출력(stderr)을 읽어서 모듈별 누적 import 시간을 구합니다.
+IMPORT_TIME_BUDGET_US = 3_000_000  # 3초 (느린 CI 환경까지 감안한 상한)
+HEAVY_MODULES = ("jose", "pwdlib", "argon2", "bcrypt", "cryptography")
+
+
+def run_importtime(code: str) -> tuple[dict[str, int], set[str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    loaded = set(result.stdout.split())
+    return cumulative, loaded
+
+
+def print_loaded_heavy_modules(code: str) -> str:
+    heavy = ", ".join(repr(name) for name in HEAVY_MODULES)
+    return (
+        f"{code}\n"
+        "import sys\n"
+        f"print(*[m for m in ({heavy},) if m in sys.modules])\n"
+    )
+
+
+def test_앱_모듈을_import해도_무거운_암호화_모듈을_불러오지_않는다():
+    cumulative, loaded = run_importtime(print_loaded_heavy_modules("import appserver.app"))
+
+    assert cumulative["appserver.app"] < IMPORT_TIME_BUDGET_US
+    assert loaded == set()
+
+
+def test_앱을_만들어도_암호화_모듈은_처음_사용할_때_불러온다():
+    code = (
+        "from appserver.app import create_app\n"
+        "create_app()\n"
+    )
+    _, loaded = run_importtime(print_loaded_heavy_modules(code))
+    assert loaded == set()
+
+    code += (
+        "from appserver.apps.account.utils import hash_password\n"
+        "hash_password('testtest')\n"
+    )
+    _, loaded = run_importtime(print_loaded_heavy_modules(code))
+    assert {"pwdlib", "argon2"} <= loaded
+
+
+@pytest.mark.parametrize("module", ["appserver.app", "appserver.db", "appserver.settings"])
+def test_모듈을_import해도_엔진을_만들지_않는다(module: str):
+    code = (
+        f"import {module}\n"
+        "import sys\n"
+        "print('aiosqlite' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_lifespan에서_엔진을_만들고_종료할_때_정리한다(tmp_path):
+    from fastapi.testclient import TestClient
+    from appserver.app import create_app
+    from appserver.settings import Settings
+
+    app = create_app(Settings(database_dsn=f"sqlite+aiosqlite:///{tmp_path}/startup.db"))
+    assert not hasattr(app.state, "engine")
+
+    with TestClient(app):
+        engine = app.state.engine
+        assert app.state.session_factory is not None
+
+    # dispose() 이후에는 풀에 남아 있는 연결이 없어야 함
+    assert engine.pool.checkedout() == 0
@@ -0,0 +1,94 @@
+from datetime import date
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.db import transactional
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import TimeSlot
+
+
+@pytest.fixture()
+def executed_statements(db_session: AsyncSession):
+    """실행한 SQL 문과 커밋("COMMIT")을 순서대로 기록"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    def commit(conn):
+        statements.append("COMMIT")
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "commit", commit)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    event.remove(engine, "commit", commit)
+
+
+async def test_핸들러가_끝나면_한_번만_커밋하고_실패하면_커밋하지_않는다(
+    db_session: AsyncSession,
+    executed_statements: list[str],
+):
+    @transactional
+    async def handler(session: AsyncSession, fail: bool):
+        session.add(User(
+            username="puddingcamp",
+            hashed_password="hashed-password",
+            email="puddingcamp@example.com",
+            display_name="푸딩캠프",
+        ))
+        await session.flush()
+        if fail:
+            raise ValueError()
+
+    with pytest.raises(ValueError):
+        await handler(db_session, fail=True)
+    assert "COMMIT" not in executed_statements
+    assert (await db_session.execute(select(User))).first() is None
+
+    await handler(db_session, fail=False)
+    assert executed_statements.count("COMMIT") == 1
+    assert executed_statements[-1] == "COMMIT"
+
+
+def test_사용자_정보를_바꾸면_UPDATE_RETURNING으로_다시_조회하지_않는다(
+    client_with_auth: TestClient,
+    executed_statements: list[str],
+):
+    executed_statements.clear()
+    response = client_with_auth.patch("/account/@me", json={"display_name": "새로운 이름"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["display_name"] == "새로운 이름"
+    update_index = next(i for i, sql in enumerate(executed_statements) if sql.startswith("UPDATE users"))
+    assert "RETURNING" in executed_statements[update_index]
+    assert executed_statements[update_index + 1:] == ["COMMIT"]
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_예약을_만들면_INSERT_RETURNING으로_다시_조회하지_않고_한_번만_커밋한다(
+    time_slot_tuesday: TimeSlot,
+    host_user: User,
+    client_with_guest_auth: TestClient,
+    executed_statements: list[str],
+):
+    executed_statements.clear()
+    payload = {
+        "when": date(2024, 12, 3).isoformat(),
+        "topic": "test",
+        "description": "test",
+        "time_slot_id": time_slot_tuesday.id,
+    }
+    response = client_with_guest_auth.post(f"/bookings/{host_user.username}", json=payload)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["created_at"] is not None
+    insert_index = next(i for i, sql in enumerate(executed_statements) if sql.startswith("INSERT INTO bookings"))
+    assert "RETURNING" in executed_statements[insert_index]
+    assert executed_statements[insert_index + 1:] == ["COMMIT"]